@@ -0,0 +1,63 @@
+"""Measure field reads, pattern matching, equality and hashing of constructed variants.
+
+Run with `python benchmarks/attributes.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from fieldenum import Variant, fieldenum
+
+
+@fieldenum
+class Shape:
+    Point = Variant(int)
+    Move = Variant(x=int, y=int)
+
+    def area(self):
+        return 0
+
+
+point = Shape.Point(1)
+move = Shape.Move(x=1, y=2)
+other_move = Shape.Move(x=1, y=2)
+hashed_move = Shape.Move(x=1, y=2)
+table = {hashed_move: None}
+
+
+def match_point(value=point):
+    match value:
+        case Shape.Point(x):
+            return x
+
+
+def match_move(value=move):
+    match value:
+        case Shape.Move(x=x, y=y):
+            return x, y
+
+
+CASES = {
+    "load Enum.Variant": lambda: Shape.Move,
+    "method lookup": lambda: move.area,
+    "read tuple field": lambda: point._0,
+    "read named field": lambda: move.x,
+    "match tuple variant": match_point,
+    "match named variant": match_move,
+    "dump named variant": move.dump,
+    "dump tuple variant": point.dump,
+    "compare equal variants": lambda: move == other_move,
+    "dict lookup": lambda: hashed_move in table,
+    "hash fresh variant": lambda: hash(Shape.Move(x=1, y=2)),
+}
+
+
+def main(number: int = 500_000) -> None:
+    for name, case in CASES.items():
+        best = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:<24}{best / number * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Convert deep trees of variants to plain data and back, and compare with a recursive converter using `dump()`.
+
+Run with `python benchmarks/builtins.py [number of nodes]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import timeit
+
+from fieldenum import Unit, Variant, fieldenum, from_builtins, to_builtins
+
+
+@fieldenum
+class Expr:
+    Nil = Unit
+    Num = Variant(float)
+    Add = Variant(left="Expr", right="Expr")
+
+
+def chain(nodes: int) -> Expr:
+    # Every `Add` brings an `Add` and a `Num`, so the tree has about `nodes` variants.
+    expr = Expr.Nil
+    for index in range(nodes // 2):
+        expr = Expr.Add(left=Expr.Num(float(index)), right=expr)
+    return expr
+
+
+def to_builtins_recursive(expr: Expr):
+    # The converter users write today; it needs the recursion limit raised for deep trees.
+    match expr:
+        case Expr.Nil:
+            return "Nil"
+        case Expr.Num():
+            return {"Num": expr.dump()}
+        case Expr.Add():
+            return {"Add": {key: to_builtins_recursive(value) for key, value in expr.dump().items()}}
+
+
+def main() -> None:
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for count in [nodes // 10, nodes]:
+        expr = chain(count)
+        start = time.perf_counter()
+        data = to_builtins(expr)
+        middle = time.perf_counter()
+        from_builtins(Expr, data)
+        end = time.perf_counter()
+        for name, elapsed in [("to_builtins", middle - start), ("from_builtins", end - middle)]:
+            print(f"{count:>9} nodes  {name:<14}{elapsed * 1e3:8.0f} ms ({elapsed / count * 1e9:5.0f} ns/node)")
+
+    # A recursive converter is limited by the recursion limit, so it is compared on a shallow tree.
+    count = 1_000
+    expr = chain(count)
+    data = to_builtins(expr)
+    assert to_builtins_recursive(expr) == data
+    functions = {"recursive": lambda: to_builtins_recursive(expr), "to_builtins": lambda: to_builtins(expr)}
+    for name, function in functions.items():
+        elapsed = min(timeit.repeat(function, number=20, repeat=5)) / 20
+        print(f"{name:<12}{count:>6} nodes  {elapsed / count * 1e9:5.0f} ns/node")
+
+    # Subtrees shared at every level: without `share`, the output would have 2**60 nodes.
+    expr = Expr.Nil
+    for _ in range(60):
+        expr = Expr.Add(left=expr, right=expr)
+    start = time.perf_counter()
+    value = from_builtins(Expr, to_builtins(expr, share=True), share=True)
+    assert value.left is value.right
+    print(f"shared DAG of 2**60 paths  {(time.perf_counter() - start) * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
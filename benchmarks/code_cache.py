@@ -0,0 +1,60 @@
+"""Compare a cold start, a warm start and a start with the on-disk cache of generated code disabled.
+
+Run with `python benchmarks/code_cache.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import fieldenum
+
+ENUMS = 200
+
+
+def write_schema(directory: Path) -> None:
+    lines = ["from fieldenum import Unit, Variant, fieldenum", ""]
+    for index in range(ENUMS):
+        # Field names differ between enums, so that every enum generates its own code.
+        lines += [
+            "@fieldenum",
+            f"class Enum{index}:",
+            "    Empty = Unit",
+            f"    Point = Variant(int{', int' * (index % 4)})",
+            f"    Move = Variant(x{index}=int, y{index}=int)",
+            f"    Sized = Variant(width{index}=int, height{index}=int).default(height{index}=0)",
+            "",
+        ]
+    (directory / "schema.py").write_text("\n".join(lines))
+
+
+def start(directory: Path, **env: str) -> float:
+    code = "import time; start = time.perf_counter(); import schema; print(time.perf_counter() - start)"
+    environ = {
+        key: value for key, value in os.environ.items()
+        if key not in ("PYTHONDONTWRITEBYTECODE", "FIELDENUM_NO_CODE_CACHE")
+    }
+    environ["PYTHONPATH"] = os.pathsep.join([str(directory), str(Path(fieldenum.__file__).parent.parent)])
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=environ | env, check=True)
+    return float(result.stdout)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory)
+        write_schema(path)
+        cold = start(path)
+        warm = min(start(path) for _ in range(3))
+        disabled = min(start(path, FIELDENUM_NO_CODE_CACHE="1") for _ in range(3))
+    print(f"{ENUMS} enums")
+    print(f"{'cold (writes cache)':<24}{cold * 1e3:8.1f} ms")
+    print(f"{'warm (reads cache)':<24}{warm * 1e3:8.1f} ms")
+    print(f"{'cache disabled':<24}{disabled * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare the size and speed of `BinaryCodec` with pickle on a stream of variants.
+
+Run with `python benchmarks/codec.py`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import timeit
+
+from fieldenum import Unit, Variant, fieldenum, pickle_many, unpickle_many
+from fieldenum.codec import BinaryCodec
+
+COUNT = 10_000
+
+
+@fieldenum
+class Point:
+    Origin = Unit
+    At = Variant(x=float, y=float)
+
+
+@fieldenum
+class Event:
+    Tick = Variant(int)
+    Flag = Variant(id=int, on=bool)
+    Named = Variant(id=int, name=str)
+    Blob = Variant(id=int, data=bytes)
+    Moved = Variant(id=int, to=Point)
+
+
+DATASETS = {
+    "Event.Tick": [Event.Tick(index) for index in range(COUNT)],
+    "Event (mixed)": [
+        [
+            Event.Tick(index),
+            Event.Flag(id=index, on=index % 2 == 0),
+            Event.Named(id=index, name=f"user{index}"),
+            Event.Blob(id=index, data=index.to_bytes(4)),
+            Event.Moved(id=index, to=Point.At(x=index / 3, y=-index)),
+        ][index % 5]
+        for index in range(COUNT)
+    ],
+}
+
+
+def encode_all(codec: BinaryCodec, values: list) -> bytearray:
+    buffer = bytearray()
+    offset = 0
+    encode_into = codec.encode_into
+    for value in values:
+        offset = encode_into(value, buffer, offset)
+    return buffer
+
+
+def report(name: str, dumps, loads) -> None:
+    for dataset_name, values in DATASETS.items():
+        data = dumps(values)
+        assert loads(data) == values
+        dump_time = min(timeit.repeat(lambda: dumps(values), number=5, repeat=5)) / 5
+        load_time = min(timeit.repeat(lambda: loads(data), number=5, repeat=5)) / 5
+        print(
+            f"{name:<14}{dataset_name:<16}{len(data) / COUNT:8.1f} B/item"
+            f"{dump_time / COUNT * 1e9:10.0f} ns dump{load_time / COUNT * 1e9:10.0f} ns load"
+        )
+
+
+def main() -> None:
+    protocol = pickle.HIGHEST_PROTOCOL
+    codec = BinaryCodec(Event)
+    report("pickle.dumps", lambda values: pickle.dumps(values, protocol), pickle.loads)
+    report("pickle_many", pickle_many, unpickle_many)
+    report("BinaryCodec", lambda values: encode_all(codec, values), lambda data: list(codec.iter_decode(data)))
+
+
+if __name__ == "__main__":
+    main()
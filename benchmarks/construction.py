@@ -0,0 +1,53 @@
+"""Measure the cost of constructing variants.
+
+Run with `python benchmarks/construction.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from fieldenum import Variant, fieldenum, variant
+
+
+@fieldenum
+class Shape:
+    Point = Variant(int)
+    Color = Variant(int, int, int)
+    Move = Variant(x=int, y=int)
+    Sized = Variant(width=int, height=int, depth=int).default(depth=0)
+    KwOnly = Variant(x=int, y=int).kw_only()
+    Pause = Variant()
+
+    @variant
+    def Function(self, a: int, b: int = 1, *, c: int = 2):
+        pass
+
+
+COLUMN = list(range(100))
+ROWS = list(zip(COLUMN, COLUMN))
+
+CASES = {
+    "tuple (1 field)": lambda: Shape.Point(1),
+    "tuple (3 fields)": lambda: Shape.Color(1, 2, 3),
+    "named, keywords": lambda: Shape.Move(x=1, y=2),
+    "named, positionals": lambda: Shape.Move(1, 2),
+    "named, default used": lambda: Shape.Sized(width=1, height=2),
+    "named, keyword only": lambda: Shape.KwOnly(x=1, y=2),
+    "function variant": lambda: Shape.Function(1, c=3),
+    "fieldless variant": lambda: Shape.Pause(),
+    "tuple, _make()": lambda: Shape.Color._make((1, 2, 3)),
+    "named, _make()": lambda: Shape.Move._make((1, 2)),
+    "named, from_rows() x100": lambda: list(Shape.Move.from_rows(ROWS)),
+    "named, from_columns() x100": lambda: Shape.Move.from_columns(x=COLUMN, y=COLUMN),
+}
+
+
+def main(number: int = 200_000) -> None:
+    for name, case in CASES.items():
+        best = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:<28}{best / number * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare ways to dispatch on the kind of a variant.
+
+Run with `python benchmarks/dispatch.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from fieldenum import Unit, Variant, fieldenum
+
+
+@fieldenum
+class Shape:
+    Empty = Unit
+    Point = Variant(int, int)
+    Circle = Variant(radius=float)
+    Rect = Variant(width=float, height=float)
+
+
+HANDLERS = (lambda shape: 0, lambda shape: 1, lambda shape: 2, lambda shape: 3)
+BY_TYPE = dict(zip(Shape.__variant_classes__, HANDLERS))
+BY_NAME = dict(zip(Shape.__variants__, HANDLERS))
+SHAPES = [Shape.Empty, Shape.Point(1, 2), Shape.Circle(1.0), Shape.Rect(1.0, 2.0)] * 25
+
+
+def by_match(shape: Shape) -> int:
+    match shape:
+        case Shape.Empty:
+            return 0
+        case Shape.Point():
+            return 1
+        case Shape.Circle():
+            return 2
+        case Shape.Rect():
+            return 3
+    raise AssertionError
+
+
+CASES = {
+    "tuple indexed by __tag__": lambda: [HANDLERS[shape.__tag__](shape) for shape in SHAPES],
+    "dict keyed by type()": lambda: [BY_TYPE[type(shape)](shape) for shape in SHAPES],
+    "dict keyed by name": lambda: [BY_NAME[type(shape).__name__](shape) for shape in SHAPES],
+    "match statement": lambda: [by_match(shape) for shape in SHAPES],
+}
+
+
+def main(number: int = 10_000) -> None:
+    for name, case in CASES.items():
+        best = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:<28}{best / number / len(SHAPES) * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
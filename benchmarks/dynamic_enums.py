@@ -0,0 +1,42 @@
+"""Create and drop many enums at runtime and check that memory stays flat.
+
+Run with `python benchmarks/dynamic_enums.py [number of enums]`.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from fieldenum import Unit, make_enum
+
+BATCHES = 10
+
+
+def create(count: int) -> None:
+    for _ in range(count):
+        Dynamic = make_enum("Dynamic", {"Tuple": (int,), "Named": {"x": int}, "Empty": (), "Nothing": Unit})
+        Dynamic.Tuple(1), Dynamic.Named(x=1), Dynamic.Empty(), Dynamic.Nothing
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    batch = count // BATCHES
+    # The first batch fills caches such as the one of generated code, which are not leaks.
+    create(batch)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for index in range(1, BATCHES):
+        create(batch)
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        print(f"{(index + 1) * batch:>8} enums {(current - baseline) / 1024:10.1f} KiB retained")
+    print(f"{time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
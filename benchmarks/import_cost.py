@@ -0,0 +1,55 @@
+"""Check the import cost of fieldenum against a budget using `python -X importtime`.
+
+Run with `python benchmarks/import_cost.py [budget in ms]`. Exits with status 1 if the budget is exceeded.
+Only the time spent in fieldenum's own modules counts, since standard library modules
+such as `typing` are usually imported by the application anyway.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+STATEMENT = "import fieldenum.enums"
+BUDGET_MS = 10.0
+# Modules that are not needed until the features using them are used.
+UNEXPECTED = ["fieldenum._flag", "fieldenum._demo", "inspect", "threading", "weakref"]
+
+
+def measure() -> tuple[dict[str, int], list[str]]:
+    env = os.environ.copy()
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # The first run writes bytecode caches so that the second one measures a warm import.
+    for _ in range(2):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"{STATEMENT}; import sys; print(*sys.modules)"],
+            capture_output=True, text=True, env=env, check=True,
+        )
+    self_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        self_times[name.strip()] = int(self_us)
+    return self_times, result.stdout.split()
+
+
+def main() -> None:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    self_times, modules = measure()
+    own = {name: us for name, us in self_times.items() if name.split(".")[0] == "fieldenum"}
+    for name, us in sorted(own.items(), key=lambda item: -item[1]):
+        print(f"{name:<28}{us / 1000:8.2f} ms")
+    total = sum(own.values()) / 1000
+    print(f"{'total':<28}{total:8.2f} ms (budget {budget:.2f} ms)")
+
+    unexpected = [name for name in UNEXPECTED if name in modules]
+    if unexpected:
+        print(f"unexpectedly imported: {', '.join(unexpected)}")
+    if total > budget or unexpected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
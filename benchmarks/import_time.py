@@ -0,0 +1,56 @@
+"""Measure how long it takes to define a large schema of fieldenums, eagerly and lazily.
+
+Run with `python benchmarks/import_time.py`.
+"""
+
+from __future__ import annotations
+
+import time
+
+from fieldenum import Unit, Variant, fieldenum, variant
+
+ENUMS = 300
+VARIANTS = 7
+
+
+def define_schema(*, lazy: bool) -> list[type]:
+    enums = []
+    for index in range(ENUMS):
+        namespace = {
+            "Empty": Unit,
+            "Pause": Variant(),
+            "Point": Variant(int),
+            "Color": Variant(int, int, int),
+            "Move": Variant(x=int, y=int),
+            "Sized": Variant(width=int, height=int).default(height=0),
+        }
+
+        def Function(a: int, b: int = 1):
+            pass
+
+        namespace["Function"] = variant(Function)
+        assert len(namespace) == VARIANTS
+        enums.append(fieldenum(type(f"Enum{index}", (), namespace), lazy=lazy))
+    return enums
+
+
+def touch_all(enums: list[type]) -> None:
+    for enum in enums:
+        for name in enum.__variants__:
+            getattr(enum, name)
+
+
+def main() -> None:
+    print(f"{ENUMS} enums, {ENUMS * VARIANTS} variants")
+    for lazy in (False, True):
+        start = time.perf_counter()
+        enums = define_schema(lazy=lazy)
+        defined = time.perf_counter()
+        touch_all(enums)
+        touched = time.perf_counter()
+        label = "lazy" if lazy else "eager"
+        print(f"{label:<6} define {(defined - start) * 1e3:8.1f} ms, then access all {(touched - defined) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare the slot layout with the tuple layout of tuple variants.
+
+Run with `python benchmarks/layout.py`.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from fieldenum import Variant, fieldenum
+
+
+@fieldenum
+class Slots:
+    Point = Variant(int)
+    Color = Variant(int, int, int)
+
+
+@fieldenum(layout="tuple")
+class Tuples:
+    Point = Variant(int)
+    Color = Variant(int, int, int)
+
+
+def unpack(value):
+    red, green, blue = value.dump()
+    return red
+
+
+def match(value):
+    match value:
+        case Slots.Color(red, _, _) | Tuples.Color(red, _, _):
+            return red
+
+
+def cases(enum) -> dict:
+    color = enum.Color(1, 2, 3)
+    other = enum.Color(1, 2, 3)
+    table = {color: None}
+    return {
+        "construct (1 field)": lambda: enum.Point(1),
+        "construct (3 fields)": lambda: enum.Color(1, 2, 3),
+        "read field": lambda: color._1,
+        "unpack dump()": lambda: unpack(color),
+        "match": lambda: match(color),
+        "compare equal": lambda: color == other,
+        "hash fresh variant": lambda: hash(enum.Color(1, 2, 3)),
+        "dict lookup": lambda: color in table,
+    }
+
+
+def main(number: int = 200_000) -> None:
+    print(f"{'':<24}{'slots':>10}{'tuple':>10}")
+    for (name, slots), tuples in zip(cases(Slots).items(), cases(Tuples).values(), strict=True):
+        timings = [min(timeit.repeat(case, number=number, repeat=5)) / number * 1e9 for case in (slots, tuples)]
+        print(f"{name:<24}{timings[0]:8.1f} ns{timings[1]:7.1f} ns")
+
+    for name in ["Point", "Color"]:
+        sizes = [sys.getsizeof(getattr(enum, name)(*range(len(getattr(enum, name).__fields__)))) for enum in (Slots, Tuples)]
+        print(f"{'size of ' + name:<24}{sizes[0]:5} bytes{sizes[1]:5} bytes")
+
+
+if __name__ == "__main__":
+    main()
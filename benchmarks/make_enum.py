@@ -0,0 +1,71 @@
+"""Create many enums at runtime with `make_enum()` and report the time and memory it takes.
+
+Run with `python benchmarks/make_enum.py [number of enums]`.
+Each mode runs in a fresh process, and memory is the growth of its resident set size.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+VARIANTS_PER_ENUM = 10
+
+
+def specs(index: int) -> dict:
+    from fieldenum import Unit
+
+    return {
+        "Empty": Unit,
+        "Pause": (),
+        "Point": (int,),
+        "Pair": (int, int),
+        "Color": (int, int, int),
+        "Move": {"x": int, "y": int},
+        "Named": {"value": str},
+        "Sized": {"width": int, "height": int, "depth": int},
+        # Field names specific to the enum, as in schemas where every message has its own fields.
+        "Own": {f"field{index}": int},
+        "Message": {"id": int, f"payload{index}": bytes},
+    }
+
+
+def build(count: int, lazy: bool) -> dict:
+    from fieldenum import make_enum
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    enums = [make_enum(f"Enum{index}", specs(index), lazy=lazy) for index in range(count)]
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert sum(len(enum.__variants__) for enum in enums) == count * VARIANTS_PER_ENUM
+    return {"seconds": elapsed, "bytes": (after - before) * 1024}
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(json.dumps(build(int(sys.argv[2]), sys.argv[3] == "lazy")))
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    variants = count * VARIANTS_PER_ENUM
+    print(f"{count} enums, {variants} variants")
+    # The code cache would hide the cost of generating code, which is part of what is measured here.
+    env = os.environ | {"FIELDENUM_NO_CODE_CACHE": "1"}
+    for mode in ["eager", "lazy"]:
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", str(count), mode], capture_output=True, text=True, env=env, check=True
+        )
+        report = json.loads(result.stdout)
+        print(
+            f"{mode:<6}{report['seconds']:8.2f} s {report['bytes'] / 2**20:8.1f} MiB"
+            f"  ({report['bytes'] / variants:.0f} B per variant)"
+        )
+
+
+if __name__ == "__main__":
+    main()
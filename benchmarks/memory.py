@@ -0,0 +1,41 @@
+"""Report the memory used by a single instance of each variant.
+
+Run with `python benchmarks/memory.py`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from fieldenum import Variant, fieldenum
+from fieldenum.enums import Option, Result
+
+
+@fieldenum
+class Shape:
+    Point = Variant(int)
+    Color = Variant(int, int, int)
+    Move = Variant(x=int, y=int)
+    Pause = Variant()
+
+
+CASES = {
+    "Option.Some(1)": Option.Some(1),
+    "Result.Ok(1)": Result.Ok(1),
+    "Shape.Point(1)": Shape.Point(1),
+    "Shape.Color(1, 2, 3)": Shape.Color(1, 2, 3),
+    "Shape.Move(x=1, y=2)": Shape.Move(x=1, y=2),
+}
+
+
+def main() -> None:
+    for name, value in CASES.items():
+        # Checking `__dictoffset__` instead of touching `__dict__`, which would allocate it.
+        has_dict = type(value).__dictoffset__ != 0
+        has_weakref = type(value).__weakrefoffset__ != 0
+        flags = ", ".join(flag for flag, present in [("__dict__", has_dict), ("__weakref__", has_weakref)] if present)
+        print(f"{name:<24}{sys.getsizeof(value):5} bytes  {flags}")
+
+
+if __name__ == "__main__":
+    main()
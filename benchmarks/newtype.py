@@ -0,0 +1,37 @@
+"""Measure single-field variants, such as `Option.Some` and `Result.Ok`.
+
+Run with `python benchmarks/newtype.py`.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from fieldenum.enums import Option, Result
+
+some = Option.Some(1)
+other_some = Option.Some(1)
+ok = Result.Ok(1)
+
+CASES = {
+    "Option.Some(1)": lambda: Option.Some(1),
+    "Result.Ok(1)": lambda: Result.Ok(1),
+    "Result.Ok(value=1)": lambda: Result.Ok(value=1),
+    "Some(1).unwrap()": lambda: Option.Some(1).unwrap(),
+    "Ok(1).unwrap()": lambda: Result.Ok(1).unwrap(),
+    "compare equal": lambda: some == other_some,
+    "hash": lambda: hash(some),
+}
+
+
+def main(number: int = 200_000) -> None:
+    for name, case in CASES.items():
+        best = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:<24}{best / number * 1e9:8.1f} ns")
+    print(f"{'size of Option.Some(1)':<24}{sys.getsizeof(some):5} bytes")
+    print(f"{'size of Result.Ok(1)':<24}{sys.getsizeof(ok):5} bytes")
+
+
+if __name__ == "__main__":
+    main()
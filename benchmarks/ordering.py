@@ -0,0 +1,58 @@
+"""Compare sorting and bisecting variants with `order=True`, `sort_key()` and a key function built on `dump()`.
+
+Run with `python benchmarks/ordering.py`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import random
+import timeit
+
+from fieldenum import Variant, fieldenum
+
+
+@fieldenum(order=True)
+class Event:
+    Timer = Variant(at=float, id=int)
+    Message = Variant(at=float, sender=str)
+    Shutdown = Variant()
+
+
+def dump_key(event: Event) -> tuple:
+    # What has to be written without ordering support.
+    dump = event.dump()
+    return Event.__variants__.index(type(event).__name__), tuple(dump.values()) if isinstance(dump, dict) else dump
+
+
+random.seed(0)
+EVENTS = [
+    random.choice([
+        lambda: Event.Timer(at=random.random(), id=random.randrange(10)),
+        lambda: Event.Message(at=random.random(), sender=random.choice("abc")),
+        Event.Shutdown,
+    ])()
+    for _ in range(10_000)
+]
+SORTED = sorted(EVENTS)
+PROBE = Event.Message(at=0.5, sender="b")
+
+CASES = {
+    "sorted(), order=True": lambda: sorted(EVENTS),
+    "sorted(), sort_key": lambda: sorted(EVENTS, key=Event.sort_key),
+    "sorted(), dump() key": lambda: sorted(EVENTS, key=dump_key),
+    "bisect(), order=True": lambda: bisect.bisect(SORTED, PROBE),
+    "bisect(), sort_key": lambda: bisect.bisect(SORTED, Event.sort_key(PROBE), key=Event.sort_key),
+    "bisect(), dump() key": lambda: bisect.bisect(SORTED, dump_key(PROBE), key=dump_key),
+}
+
+
+def main() -> None:
+    for name, case in CASES.items():
+        number = 10 if name.startswith("sorted") else 10_000
+        best = min(timeit.repeat(case, number=number, repeat=5)) / number
+        print(f"{name:<24}{best * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure the size and speed of pickling variants, one by one and with `pickle_many()`.
+
+Run with `python benchmarks/pickling.py`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import timeit
+
+import fieldenum
+from fieldenum.enums import Message, Result
+
+COUNT = 10_000
+DATASETS = {
+    "Result.Ok": [Result.Ok(index) for index in range(COUNT)],
+    "Message (mixed)": [
+        [Message.Move(x=index, y=-index), Message.Write(str(index)), Message.ChangeColor(index, 0, 255),
+         Message.Pause(), Message.Quit][index % 5]
+        for index in range(COUNT)
+    ],
+}
+
+
+def report(name: str, dumps, loads) -> None:
+    for dataset_name, values in DATASETS.items():
+        data = dumps(values)
+        assert loads(data) == values
+        dump_time = min(timeit.repeat(lambda: dumps(values), number=5, repeat=5)) / 5
+        load_time = min(timeit.repeat(lambda: loads(data), number=5, repeat=5)) / 5
+        print(
+            f"{name:<14}{dataset_name:<18}{len(data) / COUNT:8.1f} B/item"
+            f"{dump_time / COUNT * 1e9:10.0f} ns dump{load_time / COUNT * 1e9:10.0f} ns load"
+        )
+
+
+def main() -> None:
+    protocol = pickle.HIGHEST_PROTOCOL
+    report("pickle.dumps", lambda values: pickle.dumps(values, protocol), pickle.loads)
+    if hasattr(fieldenum, "pickle_many"):
+        report("pickle_many", fieldenum.pickle_many, fieldenum.unpickle_many)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure the private memory of forked workers using fieldenums, with and without `warmup()`.
+
+Run with `python benchmarks/prefork.py [number of enums]`. Requires Linux (`os.fork` and `/proc/self/smaps_rollup`).
+Each mode runs in a fresh process, which builds lazy enums, optionally warms them up and forks the workers.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import subprocess
+import sys
+
+WORKERS = 4
+
+
+def private_kib() -> int:
+    total = 0
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def serve(enums: list[type]) -> None:
+    # What a worker does with the enums while handling requests.
+    for enum in enums:
+        enum.Point(1, 2), enum.Move(x=1, y=2), enum.Empty(), enum.Nothing
+        enum.Point._make((1, 2))
+    # Long-running workers eventually run a full collection, which touches every tracked object.
+    gc.collect()
+
+
+def run(count: int, mode: str) -> list[int]:
+    from fieldenum import Unit, make_enum, warmup
+
+    enums = [
+        make_enum(f"Enum{index}", {"Point": (int, int), "Move": {"x": int, "y": int}, "Empty": (), "Nothing": Unit}, lazy=True)
+        for index in range(count)
+    ]
+    if mode != "cold":
+        warmup(enums, freeze=mode == "freeze")
+
+    reports = []
+    for _ in range(WORKERS):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            before = private_kib()
+            serve(enums)
+            os.write(write_end, str(private_kib() - before).encode())
+            os._exit(0)
+        os.close(write_end)
+        with os.fdopen(read_end) as file:
+            reports.append(int(file.read()))
+        os.waitpid(pid, 0)
+    return reports
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(*run(int(sys.argv[2]), sys.argv[3]))
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{count} enums, {WORKERS} workers")
+    # "warm" calls `warmup()` before forking, and "freeze" also freezes the objects with `gc.freeze()`.
+    for mode in ["cold", "warm", "freeze"]:
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", str(count), mode], capture_output=True, text=True, check=True
+        )
+        reports = [int(report) for report in result.stdout.split()]
+        print(f"{mode:<6}{sum(reports) / len(reports) / 1024:8.1f} MiB private per worker after serving")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare construction without validation, with generated validation and with a handwritten `__post_init__`.
+
+Run with `python benchmarks/validation.py`. Run with `python -O` to see that validation costs nothing there.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from fieldenum import Variant, fieldenum
+
+ITEMS = list(range(100))
+
+
+@fieldenum
+class Plain:
+    Move = Variant(x=int, y=int)
+    Named = Variant(name=str, parent=int | None)
+    Items = Variant(items=list[int])
+
+
+@fieldenum(validate=True)
+class Validated:
+    Move = Variant(x=int, y=int)
+    Named = Variant(name=str, parent=int | None)
+    Items = Variant(items=list[int])
+    Sampled = Variant(items=list[int]).validate("sample")
+
+
+@fieldenum
+class Handwritten:
+    Move = Variant(x=int, y=int)
+    Named = Variant(name=str, parent=int | None)
+    Items = Variant(items=list[int])
+
+    def __post_init__(self):
+        match self:
+            case Handwritten.Move(x=x, y=y):
+                if not isinstance(x, int) or not isinstance(y, int):
+                    raise TypeError("Invalid value.")
+            case Handwritten.Named(name=name, parent=parent):
+                if not isinstance(name, str) or not (parent is None or isinstance(parent, int)):
+                    raise TypeError("Invalid value.")
+            case Handwritten.Items(items=items):
+                if not isinstance(items, list) or not all(isinstance(item, int) for item in items):
+                    raise TypeError("Invalid value.")
+
+
+CASES = {
+    "two ints": {
+        "plain": lambda: Plain.Move(x=1, y=2),
+        "validated": lambda: Validated.Move(x=1, y=2),
+        "__post_init__": lambda: Handwritten.Move(x=1, y=2),
+    },
+    "str and optional int": {
+        "plain": lambda: Plain.Named(name="a", parent=None),
+        "validated": lambda: Validated.Named(name="a", parent=None),
+        "__post_init__": lambda: Handwritten.Named(name="a", parent=None),
+    },
+    "list of 100 ints": {
+        "plain": lambda: Plain.Items(items=ITEMS),
+        "validated": lambda: Validated.Items(items=ITEMS),
+        "validated, sampled": lambda: Validated.Sampled(items=ITEMS),
+        "__post_init__": lambda: Handwritten.Items(items=ITEMS),
+    },
+}
+
+
+def main(number: int = 100_000) -> None:
+    for case_name, variants in CASES.items():
+        print(case_name)
+        for name, case in variants.items():
+            best = min(timeit.repeat(case, number=number, repeat=5))
+            print(f"    {name:<24}{best / number * 1e9:10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,72 @@
-from ._flag import Flag
-from ._fieldenum import Unit, Variant, fieldenum, variant, factory
-from .exceptions import unreachable
+import typing
 
-__all__ = ["Unit", "Variant", "Flag", "factory", "fieldenum", "unreachable", "variant"]
+if typing.TYPE_CHECKING:
+    from ._flag import Flag
+    from ._builtins import from_builtins, to_builtins
+    from ._fieldenum import (
+        Unit,
+        Variant,
+        factory,
+        fieldenum,
+        intern_stats,
+        lazy_factory,
+        make_enum,
+        pickle_many,
+        unpickle_many,
+        variant,
+        warmup,
+    )
+    from .exceptions import unreachable
+
+__all__ = [
+    "Unit",
+    "Variant",
+    "Flag",
+    "factory",
+    "fieldenum",
+    "from_builtins",
+    "intern_stats",
+    "lazy_factory",
+    "make_enum",
+    "pickle_many",
+    "to_builtins",
+    "unpickle_many",
+    "unreachable",
+    "variant",
+    "warmup",
+]
 __version__ = "0.2.0"
+
+# Exports are imported on first access, so that unused ones such as `Flag` cost nothing at import time.
+_EXPORTS = {
+    "Flag": "_flag",
+    "Unit": "_fieldenum",
+    "Variant": "_fieldenum",
+    "factory": "_fieldenum",
+    "fieldenum": "_fieldenum",
+    "from_builtins": "_builtins",
+    "intern_stats": "_fieldenum",
+    "lazy_factory": "_fieldenum",
+    "make_enum": "_fieldenum",
+    "pickle_many": "_fieldenum",
+    "to_builtins": "_builtins",
+    "unpickle_many": "_fieldenum",
+    "variant": "_fieldenum",
+    "warmup": "_fieldenum",
+    "unreachable": "exceptions",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(__import__(module_name, globals(), None, [name], 1), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
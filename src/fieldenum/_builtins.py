@@ -0,0 +1,317 @@
+"""Conversion between trees of variants and plain Python data.
+
+Both directions walk the tree with an explicit stack instead of recursion,
+so deep trees do not hit the recursion limit, and the work is linear in the number of nodes.
+
+This module is not meant to be used by users,
+which means it can be modified, deleted, or added without notice.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+import typing
+from operator import attrgetter
+
+from ._fieldenum import _positional_only, _resolve_annotation
+
+# Plans are stored on the classes, so that they are collected along with dynamically created enums.
+_TO_PLAN = "_fieldenum_to_builtins"
+_FROM_PLAN = "_fieldenum_from_builtins"
+
+_LEAVES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Marks that the entry below it on the stack is a node whose items have all been converted.
+_EXIT = object()
+
+# Shapes of variants
+_UNIT = 0
+_FIELDLESS = 1
+_TUPLE = 2
+_NAMED = 3
+
+# Kinds of nodes, used both by the specs of fields and by the nodes on the stack
+_VARIANT = 0
+_LIST = 1
+_TUPLE_OF = 2
+_DICT = 3
+_OPTIONAL = 4
+
+
+class _ToPlan(typing.NamedTuple):
+    name: str
+    shape: int
+    fields: tuple[str, ...]
+    get_fields: typing.Callable[[typing.Any], typing.Any]
+
+
+class _FromPlan(typing.NamedTuple):
+    shape: int
+    fields: tuple[str, ...]
+    specs: tuple[typing.Any, ...]
+    make: typing.Callable[[typing.Any], typing.Any]  # takes a list of values or a dict of the present fields
+    instance: typing.Any
+
+
+def _enum_of(variant: type) -> type:
+    return next(base for base in variant.__mro__ if "__variants__" in vars(base))
+
+
+def _shape(variant: type) -> int:
+    fields = variant.__fields__
+    if fields is None:
+        return _UNIT
+    if not fields:
+        return _FIELDLESS
+    return _NAMED if isinstance(fields[0], str) else _TUPLE
+
+
+def _constructor(variant: type, shape: int) -> typing.Callable[[typing.Any], typing.Any]:
+    """Return a function building `variant` with its constructor, so that defaults and validation apply."""
+    if shape == _TUPLE:
+        return lambda items: variant(*items)
+    positional = [field for field in variant.__fields__ if field in _positional_only(variant)]
+    if not positional:
+        return lambda items: variant(**items)
+    return lambda items: variant(*[items.pop(field) for field in positional], **items)
+
+
+def _to_plan(cls: type) -> _ToPlan | None:
+    """Return the plan converting the instances of `cls`, or None if they are not variants."""
+    plan = vars(cls).get(_TO_PLAN)
+    if plan is not None or "__tag__" not in vars(cls):
+        return plan
+    enum = _enum_of(cls)
+    name = next(name for name, variant in enum.__variant_map__.items() if variant is cls)
+    shape = _shape(cls)
+    fields = tuple(cls.__fields__ or ())
+    attributes = fields if shape == _NAMED else tuple(f"_{field}" for field in fields)
+    get_fields = attrgetter(*attributes) if attributes else None
+    plan = _ToPlan(name, shape, fields, get_fields)
+    setattr(cls, _TO_PLAN, plan)
+    return plan
+
+
+def _field_spec(annotation, enum: type, globalns: dict[str, typing.Any]):
+    """Return how to convert the values of a field, or None to leave them as they are."""
+    annotation = _resolve_annotation(annotation, enum, globalns)
+    if isinstance(annotation, type) and "__variants__" in vars(annotation):
+        return _VARIANT, annotation
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is types.UnionType or origin is typing.Union:
+        others = [arg for arg in args if arg is not type(None)]
+        if len(others) != 1 or len(others) == len(args):
+            return None
+        spec = _field_spec(others[0], enum, globalns)
+        return None if spec is None else (_OPTIONAL, spec)
+    if origin is list and len(args) == 1 or origin is tuple and len(args) == 2 and args[1] is ...:
+        spec = _field_spec(args[0], enum, globalns)
+        if spec is None and origin is list:
+            return None
+        return (_LIST if origin is list else _TUPLE_OF), spec
+    if origin is dict and len(args) == 2:
+        spec = _field_spec(args[1], enum, globalns)
+        return None if spec is None else (_DICT, spec)
+    return None
+
+
+def _from_plans(enum: type) -> dict[str, _FromPlan]:
+    plans = vars(enum).get(_FROM_PLAN)
+    if plans is not None:
+        return plans
+    module = sys.modules.get(enum.__module__)
+    globalns = vars(module) if module is not None else {}
+    plans = {}
+    for name, variant in enum.__variant_map__.items():
+        shape = _shape(variant)
+        fields = tuple(variant.__fields__ or ())
+        attributes = fields if shape == _NAMED else tuple(f"_{field}" for field in fields)
+        field_types = variant.__field_types__
+        specs = tuple(
+            _field_spec(field_types[attribute], enum, globalns) if attribute in field_types else None
+            for attribute in attributes
+        )
+        if shape == _UNIT:
+            instance = getattr(enum, name)
+        elif shape == _FIELDLESS:
+            instance = variant()
+        else:
+            instance = None
+        plans[name] = _FromPlan(shape, fields, specs, _constructor(variant, shape) if fields else None, instance)
+    setattr(enum, _FROM_PLAN, plans)
+    return plans
+
+
+def to_builtins(obj, /, *, share: bool = False):
+    """Convert the variants in `obj` into plain data, walking into lists, tuples and dict values.
+
+    A named variant becomes `{name: {field: value, ...}}`, a tuple variant `{name: (value, ...)}`,
+    a fieldless variant `{name: ()}` and a unit variant its name.
+    If `share` is True, a variant found several times in the tree is converted once and the result is shared.
+    """
+    # Containers are copied first and their items converted in place, so a node is a single entry on the stack.
+    # Tuples are filled as lists, and turned into tuples once all of their items are converted.
+    root = [obj]
+    stack: list = [(root, 0)]
+    memo: dict[int, typing.Any] = {}
+    plans: dict[type, _ToPlan | None] = {}
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        entry = pop()
+        if entry is _EXIT:
+            target, key, items = pop()
+            target[key] = tuple(items)
+            continue
+
+        target, key = entry
+        value = target[key]
+        cls = type(value)
+        if cls in _LEAVES:
+            continue
+        if cls is list or cls is tuple or cls is dict:
+            items = list(value) if cls is not dict else dict(value)
+            target[key] = items
+            if cls is tuple:
+                push((target, key, items))
+                push(_EXIT)
+            for index, item in enumerate(items) if cls is not dict else items.items():
+                if type(item) not in _LEAVES:
+                    push((items, index))
+            continue
+
+        try:
+            plan = plans[cls]
+        except KeyError:
+            plan = plans[cls] = _to_plan(cls)
+        if plan is None:
+            continue
+        if plan.shape == _UNIT:
+            target[key] = plan.name
+            continue
+        if plan.shape == _FIELDLESS:
+            target[key] = {plan.name: ()}
+            continue
+        if share:
+            converted = memo.get(id(value))
+            if converted is not None:
+                target[key] = converted
+                continue
+
+        items = plan.get_fields(value)
+        if len(plan.fields) == 1:
+            items = (items,)
+        if plan.shape == _NAMED:
+            items = dict(zip(plan.fields, items))
+            converted = target[key] = {plan.name: items}
+            keys = plan.fields
+        elif all(type(item) in _LEAVES for item in items):
+            converted = target[key] = {plan.name: items}
+            keys = ()
+        else:
+            items = list(items)
+            converted = target[key] = {plan.name: items}
+            push((converted, plan.name, items))
+            push(_EXIT)
+            keys = range(len(items))
+        if share:
+            memo[id(value)] = converted
+        for field in keys:
+            if type(items[field]) not in _LEAVES:
+                push((items, field))
+    return root[0]
+
+
+def from_builtins(enum: type, data, /, *, share: bool = False):
+    """Convert plain data made by `to_builtins()` back into a variant of `enum`.
+
+    Fields annotated with a fieldenum, or with `X | None`, `list[X]`, `tuple[X, ...]` or `dict[str, X]` of one,
+    are converted too. Other fields are left as they are.
+    Variants are built with their constructors, so missing fields take their defaults and fields are validated.
+    ValueError is raised if a field without a default is missing or a field does not pass the validation.
+    If `share` is True, a dict found several times in the data is converted once and the variant is shared.
+    """
+    if not isinstance(enum, type) or "__variants__" not in vars(enum):
+        raise TypeError(f"Expected a fieldenum, got {enum!r}.")
+    # Each entry converts the value at `target[key]` in place.
+    # Variants and tuples are built from their converted fields when their exit entry is reached.
+    root = [data]
+    stack: list = [((_VARIANT, enum), root, 0)]
+    memo: dict[int, typing.Any] = {}
+    enum_plans: dict[type, dict[str, _FromPlan]] = {}
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        entry = pop()
+        if entry is _EXIT:
+            make, items, target, key, node = pop()
+            try:
+                converted = target[key] = make(items)
+            except (KeyError, TypeError) as exc:
+                raise ValueError(f"Cannot build a variant from {node!r}.") from exc
+            if share and node is not None:
+                memo[id(node)] = converted
+            continue
+
+        (kind, inner), target, key = entry
+        value = target[key]
+        if kind == _OPTIONAL:
+            if value is not None:
+                push((inner, target, key))
+            continue
+        if kind == _LIST or kind == _TUPLE_OF or kind == _DICT:
+            items = target[key] = list(value) if kind != _DICT else dict(value)
+            if kind == _TUPLE_OF:
+                push((tuple, items, target, key, None))
+                push(_EXIT)
+            if inner is not None:
+                for index in range(len(items)) if kind != _DICT else items:
+                    push((inner, items, index))
+            continue
+
+        if share:
+            converted = memo.get(id(value))
+            if converted is not None:
+                target[key] = converted
+                continue
+        try:
+            plans = enum_plans[inner]
+        except KeyError:
+            plans = enum_plans[inner] = _from_plans(inner)
+        if isinstance(value, str):
+            name, fields = value, None
+        elif isinstance(value, dict) and len(value) == 1:
+            [(name, fields)] = value.items()
+        else:
+            raise ValueError(f"Expected a variant of {inner.__qualname__}, got {value!r}.")
+        plan = plans.get(name)
+        if plan is None:
+            raise ValueError(f"Unknown variant {name!r} of {inner.__qualname__}.")
+        if plan.instance is not None:
+            target[key] = plan.instance
+            continue
+        if plan.shape == _NAMED:
+            if not isinstance(fields, dict):
+                raise ValueError(f"Expected the fields {plan.fields} of {inner.__qualname__}.{name}, got {fields!r}.")
+            # Only the fields present are passed, so that missing ones fall back to their defaults.
+            items = {field: fields[field] for field in plan.fields if field in fields}
+        elif fields is None or len(fields) != len(plan.fields):
+            raise ValueError(
+                f"Expected {len(plan.fields)} field(s) for {inner.__qualname__}.{name}, got {fields!r}."
+            )
+        else:
+            items = list(fields)
+        push((plan.make, items, target, key, value))
+        push(_EXIT)
+        if plan.shape == _NAMED:
+            for field, spec in zip(plan.fields, plan.specs):
+                if spec is not None and field in items:
+                    push((spec, items, field))
+        else:
+            for index, spec in enumerate(plan.specs):
+                if spec is not None:
+                    push((spec, items, index))
+    return root[0]
@@ -0,0 +1,166 @@
+"""Helpers generating specialized functions for variants.
+
+This module is not meant to be used by users,
+which means it can be modified, deleted, or added without notice.
+"""
+
+from __future__ import annotations
+
+import builtins
+import marshal
+import os
+import sys
+import types
+import typing
+from collections import OrderedDict
+from contextlib import suppress
+
+_GLOBALS = {"__builtins__": builtins}
+# The number of sources kept compiled in memory, and stored in the on-disk cache of each module.
+# Field names are part of the sources, so dynamically created enums would otherwise grow the caches without limit.
+_CACHE_SIZE = 1024
+# Least recently used sources come first.
+_compiled: OrderedDict[str, types.CodeType] = OrderedDict()
+
+# Set this environment variable to a non-empty value to disable the on-disk cache of generated code.
+CACHE_DISABLE_ENV = "FIELDENUM_NO_CODE_CACHE"
+_CACHE_SUFFIX = ".fieldenum"
+
+
+class _ModuleCache:
+    """Compiled code generated for the fieldenums of a module, stored next to the module's bytecode."""
+    __slots__ = ("path", "loaded", "used")
+
+    def __init__(self, path: str | None) -> None:
+        self.path = path
+        self.loaded: dict[str, types.CodeType] = {}
+        self.used: dict[str, types.CodeType] = {}
+        if path is not None:
+            self.loaded = _read_cache(path)
+
+    def write(self) -> None:
+        # Entries not used by this process are dropped, so code of removed definitions does not pile up.
+        if self.path is None or sys.dont_write_bytecode or self.used.keys() == self.loaded.keys():
+            return
+        from importlib.util import MAGIC_NUMBER
+
+        data = MAGIC_NUMBER + marshal.dumps(self.used)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            # Replacing the file atomically means other processes never read a partially written cache.
+            os.replace(temp_path, self.path)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_path)
+        else:
+            self.loaded = dict(self.used)
+
+
+_module_caches: dict[str, _ModuleCache] = {}
+
+
+def _cache_path(module_name: str) -> str | None:
+    if os.environ.get(CACHE_DISABLE_ENV):
+        return None
+    module = sys.modules.get(module_name)
+    file = getattr(module, "__file__", None)
+    if not isinstance(file, str) or not file.endswith(".py"):
+        return None
+    from importlib.util import cache_from_source
+
+    try:
+        bytecode_path = cache_from_source(file, optimization="")
+    except NotImplementedError:  # `sys.implementation.cache_tag` is None
+        return None
+    return bytecode_path.removesuffix(".pyc") + _CACHE_SUFFIX
+
+
+def _read_cache(path: str) -> dict[str, types.CodeType]:
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return {}
+
+    from importlib.util import MAGIC_NUMBER
+
+    # A cache written by another Python version or a broken one is ignored and rewritten later.
+    if not data.startswith(MAGIC_NUMBER):
+        return {}
+    try:
+        entries = marshal.loads(data[len(MAGIC_NUMBER):])
+    except (EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        source: code for source, code in entries.items()
+        if isinstance(source, str) and isinstance(code, types.CodeType)
+    }
+
+
+def _module_cache(module_name: str) -> _ModuleCache:
+    try:
+        return _module_caches[module_name]
+    except KeyError:
+        if not _module_caches:
+            import atexit
+
+            atexit.register(write_caches)
+        cache = _module_caches[module_name] = _ModuleCache(_cache_path(module_name))
+        return cache
+
+
+def write_caches() -> None:
+    """Write the generated code of every module to its on-disk cache."""
+    for cache in _module_caches.values():
+        cache.write()
+
+
+def make_function(
+    name: str,
+    params: str,
+    body: typing.Iterable[str],
+    namespace: dict[str, typing.Any],
+    *,
+    qualname: str,
+    module: str | None = None,
+) -> types.FunctionType:
+    """Compile a function and bind the names in `namespace` as its free variables.
+
+    The generated source only depends on `name`, `params`, `body` and the keys of `namespace`,
+    so functions of the same shape share a single compiled code object.
+    The code is also cached on disk per module, keyed by the source, so that it is not compiled again in later runs.
+    Both caches keep at most `_CACHE_SIZE` sources.
+    """
+    outer_params = ", ".join(namespace)
+    lines = [f"def __create_fn__({outer_params}):", f"    def {name}({params}):"]
+    lines.extend(f"        {line}" for line in body)
+    lines.append(f"    return {name}")
+    source = "\n".join(lines)
+
+    cache = _module_cache(module) if module is not None else None
+    try:
+        code = _compiled[source]
+    except KeyError:
+        code = cache.loaded.get(source) if cache is not None else None
+        if code is None:
+            module_code = compile(source, f"<fieldenum generated {name}>", "exec")
+            code = next(const for const in module_code.co_consts if isinstance(const, types.CodeType))
+        _compiled[source] = code
+        if len(_compiled) > _CACHE_SIZE:
+            _compiled.popitem(last=False)
+    else:
+        _compiled.move_to_end(source)
+    # Only the sources of modules with an on-disk cache are recorded, and only the first ones once it is full.
+    if cache is not None and cache.path is not None and (source in cache.used or len(cache.used) < _CACHE_SIZE):
+        cache.used[source] = code
+
+    function = types.FunctionType(code, _GLOBALS)(**namespace)
+    function.__qualname__ = qualname
+    if module is not None:
+        function.__module__ = module
+    return function
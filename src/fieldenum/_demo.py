@@ -0,0 +1,84 @@
+"""Demo fieldenum to play with, which is kept off the import path of `fieldenum.enums`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, final
+
+from ._fieldenum import Unit, Variant, fieldenum
+
+__all__ = ["Message"]
+
+
+@final  # A redundant decorator for type checkers.
+@fieldenum
+class Message:
+    """Test fieldenum to play with."""
+    if TYPE_CHECKING:
+        Quit = Unit
+
+        class Move(Message):  # type: ignore
+            __match_args__ = ("x", "y")
+            __fields__ = ("x", "y")
+
+            @property
+            def x(self) -> int: ...
+
+            @property
+            def y(self) -> int: ...
+
+            def __init__(self, x: int, y: int): ...
+
+            def dump(self) -> dict[str, int]: ...
+
+        class Write(Message):  # type: ignore
+            __match_args__ = ("_0",)
+            __fields__ = (0,)
+
+            @property
+            def _0(self) -> str: ...
+
+            def __init__(self, message: str, /): ...
+
+            def dump(self) -> tuple[int]: ...
+
+        class ChangeColor(Message):  # type: ignore
+            __match_args__ = ("_0", "_1", "_2")
+            __fields__ = (0, 1, 2)
+
+            @property
+            def _0(self) -> int: ...
+
+            @property
+            def _1(self) -> int: ...
+
+            @property
+            def _2(self) -> int: ...
+
+            def __init__(self, red: int, green: int, blue: int, /): ...
+
+            def dump(self) -> tuple[int, int, int]: ...
+
+        class Pause(Message):  # type: ignore
+            __match_args__ = ()
+            __fields__ = ()
+
+            @property
+            def _0(self) -> int: ...
+
+            @property
+            def _1(self) -> int: ...
+
+            @property
+            def _2(self) -> int: ...
+
+            def __init__(self): ...
+
+            def dump(self) -> tuple[()]: ...
+
+    else:
+        Quit = Unit
+        Move = Variant(x=int, y=int)
+        Write = Variant(str)
+        ChangeColor = Variant(int, int, int)
+        Pause = Variant()
+
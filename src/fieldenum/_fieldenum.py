@@ -2,16 +2,424 @@
 
 from __future__ import annotations
 
-import copyreg
-import inspect
+import keyword
+import sys
 import types
 import typing
+from _thread import RLock
 from contextlib import suppress
+from itertools import islice
+from math import copysign
+from operator import itemgetter, methodcaller
 
-from ._utils import OneTimeSetter, ParamlessSingletonMeta, unpickle
+from ._codegen import make_function, write_caches
 from .exceptions import unreachable
 
+if typing.TYPE_CHECKING:
+    import inspect
+    from weakref import KeyedRef
+
+try:
+    from _collections import _tuplegetter
+except ImportError:
+    def _tuplegetter(index: int, doc: str) -> property:
+        return property(itemgetter(index), doc=doc)
+
 T = typing.TypeVar("T")
+_MISSING = object()
+_object_setattr = object.__setattr__
+_HASH_SLOT = "_fieldenum_hash"
+_LAYOUTS = ("slots", "tuple")
+_VALIDATION_MODES = ("full", "sample")
+_COMPARISONS = {"__lt__": "<", "__le__": "<=", "__gt__": ">", "__ge__": ">="}
+_lazy_attach_lock = RLock()
+
+
+def _validation_mode(validate: bool | str) -> str | typing.Literal[False]:
+    if validate is True:
+        return "full"
+    if validate is False:
+        return False
+    if validate not in _VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode {validate!r}. Use a bool or one of {_VALIDATION_MODES}.")
+    return validate
+
+
+def _frozen_setattr(self, name: str, value) -> typing.NoReturn:
+    raise TypeError(f"Cannot mutate attribute `{name}` since it's frozen.")
+
+
+def _frozen_delattr(self, name: str) -> typing.NoReturn:
+    raise TypeError(f"Cannot delete attribute `{name}` since it's frozen.")
+
+
+def _variant_namespace(
+    cls, name: str, slots: tuple[str, ...], *, frozen: bool, cache_hash: bool, weakref: bool = False
+) -> dict[str, typing.Any]:
+    # Every variant is a single class directly under the fieldenum class.
+    if cache_hash:
+        slots += (_HASH_SLOT,)
+    if weakref and not cls.__weakrefoffset__:
+        slots += ("__weakref__",)
+    namespace: dict[str, typing.Any] = {
+        "__qualname__": f"{cls.__qualname__}.{name}",
+        "__name__": name,
+        "__slots__": slots,
+    }
+    if frozen:
+        namespace["__setattr__"] = _frozen_setattr
+        namespace["__delattr__"] = _frozen_delattr
+    return namespace
+
+
+def _new_singleton(cls, /, *args, **kwargs):
+    # The first call creates the instance, and then `__new__` is replaced by one returning it.
+    if args or kwargs:
+        _raise_arguments_given(cls)
+    instance = object.__new__(cls)
+    if hasattr(cls, "__post_init__"):
+        instance.__post_init__()
+    cls.__new__ = _singleton_new(instance)
+    return instance
+
+
+def _singleton_new(instance):
+    def __new__(cls, /, *args, **kwargs):
+        if args or kwargs:
+            _raise_arguments_given(cls)
+        return instance
+
+    return staticmethod(__new__)
+
+
+def _raise_arguments_given(cls) -> typing.NoReturn:
+    raise TypeError(f"{cls.__qualname__}() takes no arguments.")
+
+
+def _hash_singleton(self) -> int:
+    return hash(type(self))
+
+
+def _dump_fieldless(self) -> tuple[()]:
+    return ()
+
+
+def _dump_unit(self) -> None:
+    return None
+
+
+# Variants are pickled with `__reduce__` rather than registered to `copyreg`,
+# whose global dispatch table would keep every variant class (and its enum) alive forever.
+# A variant is reduced to the reconstructor of its enum, its tag and its fields.
+# The reconstructor is the same object for every variant of the enum, so pickle stores it once
+# and each variant costs only its tag and its field values, without field names.
+_RECONSTRUCTOR = "_fieldenum_reconstruct"
+
+
+def _fieldenum_reconstruct(cls, tag: int, *fields):
+    variant = cls.__variant_classes__[tag]
+    return variant._make(fields) if fields else variant()
+
+
+def _constant_reduce(reduced: tuple):
+    def __reduce__(self) -> tuple:
+        return reduced
+
+    return __reduce__
+
+
+def _constant_repr(text: str):
+    def __repr__(self) -> str:
+        return text
+
+    return __repr__
+
+
+def _get_positions(self) -> tuple[dict[str, typing.Any], dict[str, typing.Any]]:
+    match_args = self.__match_args__
+    args_dict = {}
+    kwargs = {}
+    for name in self.__fields__:
+        if name in match_args:
+            args_dict[name] = getattr(self, name)
+        else:
+            kwargs[name] = getattr(self, name)
+    return args_dict, kwargs
+
+
+
+def _build_order(
+    cls, name: str, tag: int, fields: tuple[str, ...], *, tuple_layout: bool = False
+) -> dict[str, typing.Any]:
+    """Build the rich comparisons and `_sort_key()` of a variant.
+
+    Variants are ordered by their declaration order first and then by their fields, like tuples.
+    """
+    qualname = f"{cls.__qualname__}.{name}"
+    namespace: dict[str, typing.Any] = {}
+    for method_name, operator in _COMPARISONS.items():
+        method_namespace = {"__base": cls, "__tag": tag}
+        body = [
+            "if type(other) is not type(self):",
+            "    if isinstance(other, __base):",
+            f"        return __tag {operator} other.__tag__",
+            "    return NotImplemented",
+        ]
+        if tuple_layout:
+            method_namespace["__tuple_compare"] = getattr(tuple, method_name)
+            body.append("return __tuple_compare(self, other)")
+        elif fields:
+            # The last field decides the result by itself, so only the fields before it are checked for equality.
+            for field in fields[:-1]:
+                body += [
+                    f"__value = self.{field}",
+                    f"__other_value = other.{field}",
+                    "if __value is not __other_value and not __value == __other_value:",
+                    f"    return __value {operator} __other_value",
+                ]
+            body.append(f"return self.{fields[-1]} {operator} other.{fields[-1]}")
+        else:
+            body.append(f"return {operator in ('<=', '>=')}")
+        namespace[method_name] = make_function(
+            method_name,
+            "self, other",
+            body,
+            method_namespace,
+            qualname=f"{qualname}.{method_name}",
+            module=cls.__module__,
+        )
+
+    if tuple_layout:
+        key = "(__tag, *self)"
+    else:
+        key = f"(__tag, {''.join(f'self.{field}, ' for field in fields)})"
+    namespace["_sort_key"] = make_function(
+        "_sort_key", "self", [f"return {key}"], {"__tag": tag}, qualname=f"{qualname}._sort_key", module=cls.__module__
+    )
+    return namespace
+
+
+# Like PEP 484, `float` also accepts `int`, and `complex` also accepts `float` and `int`.
+_NUMERIC_TOWER = {float: (float, int), complex: (complex, float, int)}
+_CONTAINERS = (list, set, frozenset)
+
+
+def _resolve_annotation(annotation, owner: type, globalns: dict[str, typing.Any]):
+    """Evaluate a string annotation in `globalns`, where the name of `owner` refers to the enum being built."""
+    # A string annotation can itself be a string, such as `"str"` under `from __future__ import annotations`.
+    while isinstance(annotation, str | typing.ForwardRef):
+        source = annotation if isinstance(annotation, str) else annotation.__forward_arg__
+        annotation = eval(source, globalns, {owner.__name__: owner})
+    return annotation
+
+
+def _positional_only(variant: type) -> frozenset[str]:
+    """Return the fields of a variant made from a function that cannot be passed by keyword."""
+    # `inspect` is slow to import, so it is only imported once a converter needs it.
+    import inspect
+
+    try:
+        parameters = inspect.signature(variant).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    return frozenset(parameter.name for parameter in parameters if parameter.kind is parameter.POSITIONAL_ONLY)
+
+
+def _build_check(
+    annotation,
+    value: str,
+    namespace: dict[str, typing.Any],
+    *,
+    sample: bool,
+    owner: type,
+    globalns: dict[str, typing.Any],
+    depth: int = 0,
+) -> str | None:
+    """Compile an annotation to an expression checking `value`, or return None if any value is valid.
+
+    The objects the expression refers to are added to `namespace`.
+    String annotations are resolved by `_resolve_annotation()`.
+    With `sample`, only the first item of lists, sets and dicts is checked.
+    """
+    def bind(obj) -> str:
+        name = f"__check{len(namespace)}"
+        namespace[name] = obj
+        return name
+
+    def build(annotation, value: str) -> str | None:
+        return _build_check(
+            annotation, value, namespace, sample=sample, owner=owner, globalns=globalns, depth=depth + 1
+        )
+
+    annotation = _resolve_annotation(annotation, owner, globalns)
+    if annotation is typing.Any or annotation is object or isinstance(annotation, typing.TypeVar):
+        return None
+    if isinstance(annotation, typing.NewType):
+        return build(annotation.__supertype__, value)
+    if annotation is None or annotation is type(None):
+        return f"{value} is None"
+    if annotation is typing.Self:
+        annotation = owner
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is None and isinstance(annotation, type):
+        return f"isinstance({value}, {bind(_NUMERIC_TOWER.get(annotation, annotation))})"
+    if origin is typing.Annotated:
+        return build(args[0], value)
+    if origin is typing.Literal:
+        return f"{value} in {bind(args)}"
+
+    if origin is typing.Union or origin is types.UnionType:
+        if all(isinstance(arg, type) and typing.get_origin(arg) is None for arg in args):
+            classes = tuple(klass for arg in args for klass in _NUMERIC_TOWER.get(arg, (arg,)))
+            return f"isinstance({value}, {bind(classes)})"
+        checks = [build(arg, value) for arg in args]
+        if None in checks:
+            return None
+        return f"({' or '.join(checks)})"
+
+    if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        checks = [check for index, arg in enumerate(args) if (check := build(arg, f"{value}[{index}]")) is not None]
+        return " and ".join([f"isinstance({value}, tuple)", f"len({value}) == {len(args)}", *checks])
+
+    if origin is tuple or origin in _CONTAINERS:
+        item = f"__item{depth}"
+        check = build(args[0], item) if args else None
+        if check is None:
+            items_check = None
+        elif sample and origin in (list, tuple):
+            items_check = f"(not {value} or {build(args[0], f'{value}[0]')})"
+        elif sample:
+            items_check = f"all({check} for {item} in {bind(islice)}({value}, 1))"
+        else:
+            items_check = f"all({check} for {item} in {value})"
+        return " and ".join(filter(None, [f"isinstance({value}, {bind(origin)})", items_check]))
+
+    if origin is dict:
+        key, item = f"__key{depth}", f"__item{depth}"
+        key_check = build(args[0], key) if args else None
+        item_check = build(args[1], item) if args else None
+        if key_check is None and item_check is None:
+            return f"isinstance({value}, dict)"
+        check = " and ".join(filter(None, [key_check, item_check]))
+        items = f"{bind(islice)}({value}.items(), 1)" if sample else f"{value}.items()"
+        return f"isinstance({value}, dict) and all({check} for {key}, {item} in {items})"
+
+    if isinstance(origin, type):  # other generic classes such as `type[int]` or a generic fieldenum
+        return f"isinstance({value}, {bind(origin)})"
+    raise TypeError(f"Cannot validate values against {annotation!r}.")
+
+
+class _DeferredCheck:
+    """Check a field whose annotation refers to names not defined yet when the variant is built.
+
+    The annotation is resolved and compiled on the first check, once the module is fully imported.
+    """
+    __slots__ = ("annotation", "owner", "globalns", "sample", "qualname", "check")
+
+    def __init__(
+        self, annotation, *, owner: type, globalns: dict[str, typing.Any], sample: bool, qualname: str
+    ) -> None:
+        self.annotation = annotation
+        self.owner = owner
+        self.globalns = globalns
+        self.sample = sample
+        self.qualname = qualname
+        self.check = None
+
+    def __call__(self, value) -> bool:
+        if self.check is None:
+            namespace: dict[str, typing.Any] = {}
+            check = _build_check(
+                self.annotation, "value", namespace, sample=self.sample, owner=self.owner, globalns=self.globalns
+            )
+            self.check = make_function(
+                "check", "value", [f"return {check or 'True'}"], namespace,
+                qualname=self.qualname, module=self.owner.__module__,
+            )
+        return self.check(value)
+
+
+class _LazyClassMethod:
+    """A classmethod whose function is built on first access, after which it replaces itself on the class."""
+    __slots__ = ("build", "name")
+
+    def __init__(self, build: typing.Callable[[], types.FunctionType]) -> None:
+        self.build = build
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        owner = objtype if objtype is not None else type(obj)
+        method = classmethod(self.build())
+        setattr(owner, self.name, method)
+        return method.__get__(obj, owner)
+
+
+class _LazyClassAttribute:
+    """An attribute of a fieldenum computed on first access, after which it replaces itself on the enum."""
+    __slots__ = ("owner", "name", "build")
+
+    def __init__(self, owner: type, name: str, build: typing.Callable[[], typing.Any]) -> None:
+        self.owner = owner
+        self.name = name
+        self.build = build
+
+    def __get__(self, obj, objtype=None):
+        # The attribute can also be reached through the variants, so it is always set on the enum itself.
+        value = self.build()
+        setattr(self.owner, self.name, value)
+        return value
+
+
+def _variant_classes(cls) -> tuple[type, ...]:
+    # Unit variants are attached as their instances.
+    return tuple(
+        variant if isinstance(variant, type) else type(variant)
+        for variant in (getattr(cls, name) for name in cls.__variants__)
+    )
+
+
+# Types whose equal values cannot be told apart, so that instances of them can be interned as they are.
+_EXACT_TYPES = frozenset({int, str, bytes, bool, type(None)})
+
+
+def _intern_key(value) -> tuple:
+    """Return a key of a value which is the same only for indistinguishable values.
+
+    TypeError is raised for values whose equality is not exact, such as `Decimal("1.0")` and `Decimal("1.00")`.
+    """
+    cls = type(value)
+    if cls in _EXACT_TYPES or cls.__eq__ is object.__eq__:
+        return value, cls
+    if getattr(cls, "_intern_table", None) is not None:
+        # Interned variants are already canonical, so nested ones are keyed by identity.
+        # The instance holding the key keeps them alive as long as its entry exists.
+        return id(value), cls
+    if cls is float:
+        # `0.0 == -0.0`, but they are distinguishable.
+        return value, cls, copysign(1.0, value)
+    if cls is tuple:
+        return tuple(map(_intern_key, value)), cls
+    if cls is frozenset:
+        return frozenset(map(_intern_key, value)), cls
+    raise TypeError(f"Cannot intern {value!r}.")
+
+
+class _InternTable:
+    """Weak-value table of the interned instances of a variant."""
+    __slots__ = ("entries", "counters", "__weakref__")
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple, KeyedRef] = {}
+        self.counters = [0, 0, 0]  # hits, misses and instances which could not be interned
+
+    def remove(self, ref: KeyedRef) -> None:
+        # The key might already be reused by a newer instance.
+        if self.entries.get(ref.key) is ref:
+            del self.entries[ref.key]
 
 
 class Variant:  # MARK: Variant
@@ -24,7 +432,14 @@ class Variant:  # MARK: Variant
         "_generics",
         "_actual",
         "_defaults_and_factories",
+        "_defaults",
+        "_factories",
+        "_lazy_factories",
         "_kw_only",
+        "_intern",
+        "_layout",
+        "_validate",
+        "_pending",
     )
 
     def __set_name__(self, owner, name) -> None:
@@ -33,8 +448,11 @@ class Variant:  # MARK: Variant
         self.name = name
 
     def __get__(self, obj, objtype=None) -> typing.Self:
+        if self._pending is not None:
+            self._attach_pending()
         if self.attached:
-            # This is needed in order to make match statements work.
+            # Attached variants are normally replaced by their class in `_install()`,
+            # but the descriptor can still be reached through other classes it was assigned to.
             return self._actual  # type: ignore
 
         return self
@@ -43,6 +461,23 @@ class Variant:  # MARK: Variant
         self._kw_only = True
         return self
 
+    def intern(self) -> typing.Self:
+        self._intern = True
+        return self
+
+    def layout(self, layout: typing.Literal["slots", "tuple"]) -> typing.Self:
+        if layout not in _LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}. Use one of {_LAYOUTS}.")
+        if layout == "tuple" and not self.field[0]:
+            raise TypeError("Only tuple variants can use the tuple layout.")
+        self._layout = layout
+        return self
+
+    def validate(self, mode: bool | typing.Literal["full", "sample"] = True) -> typing.Self:
+        """Check the fields against their annotations on construction, overriding the option of the enum."""
+        self._validate = _validation_mode(mode)
+        return self
+
     # fieldless variant
     @typing.overload
     def __init__(self) -> None: ...
@@ -58,7 +493,12 @@ class Variant:  # MARK: Variant
     def __init__(self, *tuple_field, **named_field) -> None:
         self.attached = False
         self._kw_only = False
+        self._intern = False
+        self._layout = None
+        self._validate = None
+        self._pending = None
         self._defaults_and_factories = {}
+        self._lazy_factories = {}
         if tuple_field and named_field:
             raise TypeError("Cannot mix tuple fields and named fields. Use named fields.")
         self.field = (tuple_field, named_field)
@@ -87,192 +527,606 @@ class Variant:  # MARK: Variant
         build_hash: bool,
         build_repr: bool,
         frozen: bool,
+        intern: bool = False,
+        layout: str = "slots",
+        validate: str | typing.Literal[False] = False,
+        order: bool = False,
+        tag: int = 0,
     ) -> None | typing.Self:
         if self.attached:
             raise TypeError(f"This variants already attached to {self._base.__name__!r}.")
 
         self._base = cls
-        tuple_field, named_field = self.field
-        if not self._kw_only:
-            named_field_keys = tuple(named_field)
-        item = self
-
-        self._actual: ConstructedVariant
-
-        # fmt: off
-        class ConstructedVariant(cls):
-            if frozen and not typing.TYPE_CHECKING:
-                __slots__ = tuple(f"__original_{name}" for name in item._slots_names)
-                for name in item._slots_names:
-                    # to prevent potential security risk
-                    if name.isidentifier():
-                        exec(f"{name} = OneTimeSetter()")
-                    else:
-                        unreachable(name)
-                        OneTimeSetter()  # Show IDEs that OneTimeSetter is used. Not executed at runtime.
-            else:
-                __slots__ = item._slots_names
-
-        if tuple_field:
-            class TupleConstructedVariant(ConstructedVariant):
-                __name__ = item.name
-                __qualname__ = f"{cls.__qualname__}.{item.name}"
-                __fields__ = tuple(range(len(tuple_field)))
-                __slots__ = ()
-                __match_args__ = item._slots_names
-
-                if build_hash:
-                    __slots__ += ("__hash",)
-
-                    if frozen:
-                        def __hash__(self) -> int:
-                            with suppress(AttributeError):
-                                return self.__hash
-
-                            self.__hash = hash(self.dump())
-                            return self.__hash
-                    else:
-                        __hash__ = None  # type: ignore
-
-                if eq:
-                    def __eq__(self, other: typing.Self):
-                        return type(self) is type(other) and self.dump() == other.dump()
+        tuple_layout = bool(self.field[0]) and (self._layout or layout) == "tuple"
+        if self._validate is not None:
+            validate = self._validate
+        # Under `python -O`, no validation code is generated at all.
+        validate = validate if __debug__ else False
+        namespace = self._build_namespace(
+            eq=eq,
+            build_hash=build_hash,
+            build_repr=build_repr,
+            frozen=frozen,
+            intern=intern,
+            tuple_layout=tuple_layout,
+            validate=validate,
+            order=order,
+            tag=tag,
+        )
+        namespace["__tag__"] = tag
+        namespace["__field_types__"] = self._annotations()
+        bases = (cls, tuple) if tuple_layout else (cls,)
+        self._actual = type(cls)(self.name, bases, namespace)
+        self.attached = True
+        self._install()
 
-                if build_repr:
-                    def __repr__(self) -> str:
-                        values_repr = ", ".join(repr(getattr(self, f"_{name}" if isinstance(name, int) else name)) for name in self.__fields__)
-                        return f"{item._base.__name__}.{self.__name__}({values_repr})"
+    def attach_lazily(self, cls, /, **options) -> None:
+        """Defer `attach()` until the variant is first accessed."""
+        if self.attached:
+            raise TypeError(f"This variants already attached to {self._base.__name__!r}.")
+        self._base = cls
+        self._pending = options
 
-                @staticmethod
-                def _pickle(variant):
-                    assert isinstance(variant, ConstructedVariant)
-                    return unpickle, (cls, self.name, tuple(getattr(variant, f"_{i}") for i in variant.__fields__), {})
+    def _attach_pending(self) -> None:
+        with _lazy_attach_lock:
+            # Another thread might have attached the variant while this one was waiting.
+            if (options := self._pending) is not None:
+                self.attach(self._base, **options)
+                self._pending = None
 
-                def dump(self) -> tuple:
-                    return tuple(getattr(self, f"_{name}") for name in self.__fields__)
+    def _build_namespace(
+        self,
+        *,
+        eq: bool,
+        build_hash: bool,
+        build_repr: bool,
+        frozen: bool,
+        intern: bool,
+        tuple_layout: bool = False,
+        validate: str | typing.Literal[False] = False,
+        order: bool = False,
+        tag: int = 0,
+    ) -> dict[str, typing.Any]:
+        cls = self._base
+        name = self.name
+        tuple_field, named_field = self.field
+        has_post_init = hasattr(cls, "__post_init__")
+        # Hashing a single field costs about as much as reading a cached hash,
+        # so single-field variants (newtypes) skip the cache and stay as small as possible.
+        cache_hash = build_hash and frozen and len(self._slots_names) > 1 and not tuple_layout
+        intern = (intern or self._intern) and bool(self._slots_names)
+        if intern and not frozen:
+            raise TypeError("Only frozen variants can be interned.")
+        # Interned instances are looked up by their values, so they cannot wait for lazy factories.
+        self._split_defaults(lazy=not intern)
+
+        if tuple_layout:
+            if not frozen:
+                raise TypeError("Only frozen variants can use the tuple layout.")
+            if intern or cls.__weakrefoffset__:
+                raise TypeError("Variants using the tuple layout cannot be weakly referenced or interned.")
+            namespace = _variant_namespace(cls, name, (), frozen=frozen, cache_hash=False)
+            namespace |= self._build_tuple_layout(
+                eq=eq, build_hash=build_hash, has_post_init=has_post_init, validate=validate
+            )
+        else:
+            namespace = _variant_namespace(
+                cls, name, self._slots_names, frozen=frozen, cache_hash=cache_hash, weakref=intern
+            )
+            if self._slots_names:
+                namespace |= self._build_constructor(
+                    frozen=frozen, cache_hash=cache_hash, has_post_init=has_post_init, intern=intern, validate=validate
+                )
+        if self._slots_names:
+            namespace |= self._build_trusted_constructors(
+                frozen=frozen, cache_hash=cache_hash, has_post_init=has_post_init, intern=intern, tuple_layout=tuple_layout
+            )
 
-                def __init__(self, *args) -> None:
-                    if len(tuple_field) != len(args):
-                        raise TypeError(f"Expect {len(tuple_field)} field(s), but received {len(args)} argument(s).")
+        if tuple_field:
+            namespace["__fields__"] = tuple(range(len(tuple_field)))
+            namespace["__match_args__"] = self._slots_names
+            namespace.setdefault("dump", self._build_dump(named=False))
+            if build_repr:
+                namespace["__repr__"] = self._build_repr(named=False)
+            namespace["__reduce__"] = self._build_reduce(tag, tuple_layout=tuple_layout)
 
-                    for name, field, value in zip(item._slots_names, tuple_field, args, strict=True):
-                        setattr(self, name, value)
+        elif named_field:
+            namespace["__fields__"] = self._slots_names
+            if not self._kw_only:
+                namespace["__match_args__"] = self._slots_names
+            namespace["dump"] = self._build_dump(named=True)
+            namespace["__repr__"] = self._build_repr(named=True)
+            namespace["__reduce__"] = self._build_reduce(tag)
 
-                    post_init = getattr(self, "__post_init__", lambda: None)
-                    post_init()
+        else:
+            namespace["__fields__"] = ()
+            namespace["__new__"] = _new_singleton
+            namespace["__init__"] = object.__init__
+            namespace["dump"] = _dump_fieldless
+            namespace["__repr__"] = _constant_repr(f"{cls.__name__}.{name}()")
+            namespace["__hash__"] = None if build_hash and not frozen else _hash_singleton
+            namespace["__reduce__"] = _constant_reduce((getattr(cls, _RECONSTRUCTOR), (tag,)))
+            if order:
+                namespace |= _build_order(cls, name, tag, ())
+            return namespace
+
+        if self._lazy_factories:
+            namespace["__getattr__"] = self._build_lazy_getattr()
+
+        # Equality and hashing of the tuple layout are built by `_build_tuple_layout()`.
+        if build_hash and not tuple_layout:
+            namespace["__hash__"] = self._build_hash(cache_hash=cache_hash) if frozen else None
+        if eq and not tuple_layout:
+            namespace["__eq__"] = self._build_eq(cache_hash=cache_hash)
+        if order:
+            namespace |= _build_order(cls, name, tag, self._slots_names, tuple_layout=tuple_layout)
+        return namespace
 
-            self._actual = TupleConstructedVariant
+    def __call__(self, *args, **kwargs):
+        if self._pending is not None:
+            self._attach_pending()
+        return self._actual(*args, **kwargs)
 
-        elif named_field:
-            class NamedConstructedVariant(ConstructedVariant):
-                __name__ = item.name
-                __qualname__ = f"{cls.__qualname__}.{item.name}"
-                __fields__ = item._slots_names
-                __slots__ = ()
-                if not item._kw_only:
-                    __match_args__ = item._slots_names
-
-                if build_hash:
-                    __slots__ += ("__hash",)
-
-                    if frozen:
-                        def __hash__(self) -> int:
-                            with suppress(AttributeError):
-                                return self.__hash
-
-                            self.__hash = hash(tuple(self.dump().items()))
-                            return self.__hash
-                    else:
-                        __hash__ = None  # type: ignore
-
-                if eq:
-                    def __eq__(self, other: typing.Self):
-                        return type(self) is type(other) and self.dump() == other.dump()
-
-                @staticmethod
-                def _pickle(variant):
-                    assert isinstance(variant, ConstructedVariant)
-                    return unpickle, (cls, self.name, (), {name: getattr(variant, name) for name in variant.__fields__})
-
-                def dump(self):
-                    return {name: getattr(self, name) for name in self.__fields__}
-
-                def __repr__(self) -> str:
-                    values_repr = ', '.join(f'{name}={getattr(self, f"_{name}" if isinstance(name, int) else name)!r}' for name in self.__fields__)
-                    return f"{item._base.__name__}.{self.__name__}({values_repr})"
-
-                def __init__(self, *args, **kwargs) -> None:
-                    if args:
-                        if item._kw_only:
-                            raise TypeError(f"Variant '{type(self).__qualname__}' is keyword only.")
-
-                        if len(args) > len(named_field_keys):
-                            raise TypeError(f"{self.__name__} takes {len(named_field_keys)} positional argument(s) but {len(args)} were/was given")
-
-                        # a valid use case of zip without strict=True
-                        for arg, field_name in zip(args, named_field_keys):
-                            if field_name in kwargs:
-                                raise TypeError(f"Inconsistent input for field '{field_name}': received both positional and keyword values")
-                            kwargs[field_name] = arg
-
-                    if item._defaults_and_factories:
-                        for name, default_or_factory in item._defaults_and_factories.items():
-                            if name not in kwargs:
-                                kwargs[name] = factory._produce_from(default_or_factory)
-
-                    if missed_keys := kwargs.keys() ^ named_field.keys():
-                        raise TypeError(f"Key mismatch: {missed_keys}")
-
-                    for name in named_field:
-                        value = kwargs[name]
-                        # field = named_field[name]
-                        setattr(self, name, value)
-
-                    post_init = getattr(self, "__post_init__", lambda: None)
-                    post_init()
-
-            self._actual = NamedConstructedVariant
+    def _split_defaults(self, *, lazy: bool) -> None:
+        """Sort the defaults into constants, factories and lazy factories, so that none is checked on construction."""
+        if unknown_defaults := self._defaults_and_factories.keys() - set(self._slots_names):
+            raise TypeError(f"Defaults are given for unknown field(s): {unknown_defaults}")
+        self._defaults = {}
+        self._factories = {}
+        self._lazy_factories = {}
+        for name, default in self._defaults_and_factories.items():
+            if lazy and isinstance(default, lazy_factory):
+                self._lazy_factories[name] = default.produce
+            elif isinstance(default, factory):
+                self._factories[name] = default.produce
+            else:
+                self._defaults[name] = default
+
+    def _install(self) -> None:
+        # Replacing the descriptor with the constructed class makes `Enum.Variant` a plain attribute load.
+        if vars(self._base).get(self.name) is self:
+            setattr(self._base, self.name, self._actual)
+
+    def _build_constructor(
+        self, *, frozen: bool, cache_hash: bool, has_post_init: bool, intern: bool, validate: str | bool = False
+    ) -> dict[str, types.FunctionType]:
+        """Generate the constructor of the variant.
+
+        It's `__init__` normally, but interned variants need `__new__` to return existing instances.
+        """
+        params, body, namespace = self._build_binding()
+        if validate:
+            body += self._build_checks(namespace, sample=validate == "sample")
+        instance = self._instance_name()
+        namespace["__setattr"] = _object_setattr
+        if "/" not in params:
+            params = ["/", *params]
+        construct = self._store_fields(instance, frozen=frozen, cache_hash=cache_hash)
+        construct += self._call_initializers(instance, has_post_init=has_post_init)
+
+        if not intern:
+            init = self._make_method("__init__", ", ".join([instance, *params]), body + construct, namespace)
+            return {"__init__": init}
+
+        from weakref import KeyedRef
+
+        table = _InternTable()
+        namespace |= {
+            "__object_new": object.__new__,
+            "__entries": table.entries,
+            "__counters": table.counters,
+            "__remove": table.remove,
+            "__KeyedRef": KeyedRef,
+        }
+        # Types are part of the key so that `Some(1)` and `Some(True)` are not merged.
+        # Values of other types go through `_intern_key()`, which also tells apart `0.0` and `-0.0`.
+        names = self._slots_names
+        namespace |= {"__EXACT_TYPES": _EXACT_TYPES, "__intern_key": _intern_key}
+        body += [
+            "try:",
+            f"    if {' and '.join(f'type({name}) in __EXACT_TYPES' for name in names)}:",
+            f"        __key = ({''.join(f'{name}, type({name}), ' for name in names)})",
+            "    else:",
+            f"        __key = ({''.join(f'__intern_key({name}), ' for name in names)})",
+            "    __ref = __entries.get(__key)",
+            "except TypeError:",
+            "    __key = __ref = None  # values are unhashable or cannot be told apart, so they are not interned",
+            "if __ref is not None:",
+            "    __interned = __ref()",
+            "    if __interned is not None:",
+            "        __counters[0] += 1",
+            "        return __interned",
+            f"{instance} = __object_new(__cls)",
+            *construct,
+            "if __key is not None:",
+            "    __counters[1] += 1",
+            f"    __entries[__key] = __KeyedRef({instance}, __remove, __key)",
+            "else:",
+            "    __counters[2] += 1",
+            f"return {instance}",
+        ]
+        new = self._make_method("__new__", ", ".join(["__cls", *params]), body, namespace)
+        return {"__new__": new, "__init__": object.__init__, "_intern_table": table}
+
+    def _build_trusted_constructors(
+        self, *, frozen: bool, cache_hash: bool, has_post_init: bool, intern: bool, tuple_layout: bool = False
+    ) -> dict[str, typing.Any]:
+        """Build `_make()`, `from_rows()` and `from_columns()`.
+
+        They take the values of every field in order and skip argument checks, defaults and initializers
+        except `__post_init__()`, which is called whenever the constructor would call it.
+        Interned variants still go through the constructor to find existing instances.
+        """
+        names = self._slots_names
+        targets = f"{', '.join(names)},"
+        namespace: dict[str, typing.Any] = {"__zip": zip, "__MISSING": _MISSING}
+        if intern:
+            construct = [f"__self = __cls({self._call_arguments()})"]
+        elif tuple_layout:
+            namespace["__tuple_new"] = tuple.__new__
+            construct = [
+                f"__self = __tuple_new(__cls, ({targets}))",
+                *self._call_post_init("__self", has_post_init=has_post_init),
+            ]
+        else:
+            namespace["__object_new"] = object.__new__
+            namespace["__setattr"] = _object_setattr
+            construct = [
+                "__self = __object_new(__cls)",
+                *self._store_fields("__self", frozen=frozen, cache_hash=cache_hash),
+                *self._call_post_init("__self", has_post_init=has_post_init),
+            ]
+
+        make = [f"{targets} = __iterable", *construct, "return __self"]
+        from_rows = [f"for {targets} in __rows:", *(f"    {line}" for line in construct), "    yield __self"]
+        from_columns = [
+            "__result = []",
+            "__append = __result.append",
+            f"for {targets} in __zip({', '.join(names)}, strict=True):",
+            *(f"    {line}" for line in construct),
+            "    __append(__self)",
+            "return __result",
+        ]
+        # They are rarely used, so they are compiled on first access instead of when the variant is built.
+        return {
+            "_make": _LazyClassMethod(
+                lambda: self._make_method("_make", "__cls, __iterable, /", make, namespace)
+            ),
+            "from_rows": _LazyClassMethod(
+                lambda: self._make_method("from_rows", "__cls, __rows, /", from_rows, namespace)
+            ),
+            "from_columns": _LazyClassMethod(
+                lambda: self._make_method("from_columns", f"__cls, /, *, {', '.join(names)}", from_columns, namespace)
+            ),
+        }
 
+    def _call_arguments(self) -> str:
+        """Return the arguments passing the local variables named after the fields to the constructor."""
+        if self.field[0]:
+            return ", ".join(self._slots_names)
+        return ", ".join(f"{name}={name}" for name in self._slots_names)
+
+    def _instance_name(self) -> str:
+        return "self"
+
+    def _call_initializers(self, instance: str, *, has_post_init: bool) -> list[str]:
+        return self._call_post_init(instance, has_post_init=has_post_init)
+
+    def _call_post_init(self, instance: str, *, has_post_init: bool) -> list[str]:
+        return [f"{instance}.__post_init__()"] if has_post_init else []
+
+    def _build_binding(self) -> tuple[list[str], list[str], dict[str, typing.Any]]:
+        """Return the parameters and the code binding arguments to local variables named after the fields."""
+        tuple_field, _ = self.field
+        if tuple_field and len(tuple_field) == 1:
+            # Binding the only field to a parameter avoids packing the arguments into a tuple.
+            body = [
+                "if args or _0 is __MISSING:",
+                "    raise TypeError(f\"Expect 1 field(s), but received {len(args) + (_0 is not __MISSING)} argument(s).\")",
+            ]
+            return ["_0=__MISSING", "/", "*args"], body, {"__MISSING": _MISSING}
+        if tuple_field:
+            body = [*self._check_arg_count(), f"{', '.join(self._slots_names)}, = args"]
+            return ["*args"], body, {}
+
+        # Every field is a keyword-only parameter defaulting to a sentinel, so keyword construction
+        # binds at native speed. Anything unusual is delegated to `_raise_bind_error()`,
+        # which reproduces the error messages of the generic binding.
+        names = self._slots_names
+        namespace: dict[str, typing.Any] = {
+            "__MISSING": _MISSING,
+            "__raise_bind_error": self._raise_bind_error,
+        }
+        values = f"({', '.join(names)},)"
+        params = ["*__args", *(f"{name}=__MISSING" for name in names), "**__kwargs"]
+        body = []
+        if self._kw_only:
+            body += [
+                "if __args or __kwargs:",
+                f"    __raise_bind_error(__args, __kwargs, {values})",
+            ]
+        elif len(names) == 1:
+            # A positional value of a newtype is bound to its own parameter instead of being packed into `__args`.
+            name, = names
+            params.insert(0, "__positional=__MISSING")
+            params.insert(1, "/")
+            body += [
+                "if __positional is not __MISSING:",
+                f"    if __args or __kwargs or {name} is not __MISSING:",
+                f"        __raise_bind_error((__positional, *__args), __kwargs, {values})",
+                f"    {name} = __positional",
+                "elif __kwargs:",
+                f"    __raise_bind_error(__args, __kwargs, {values})",
+            ]
         else:
-            class FieldlessConstructedVariant(ConstructedVariant, metaclass=ParamlessSingletonMeta):
-                __name__ = item.name
-                __qualname__ = f"{cls.__qualname__}.{item.name}"
-                __fields__ = ()
-                __slots__ = ()
-
-                if build_hash and not frozen:
-                    __hash__ = None  # type: ignore
-                else:
-                    def __hash__(self):
-                        return hash(type(self))
+            conditions = " or ".join(
+                ["__kwargs", f"__n > {len(names)}"]
+                + [f"{name} is not __MISSING" if index == 0 else f"__n > {index} and {name} is not __MISSING"
+                   for index, name in enumerate(names)]
+            )
+            body += [
+                "if __args:",
+                "    __n = len(__args)",
+                f"    if {conditions}:",
+                f"        __raise_bind_error(__args, __kwargs, {values})",
+            ]
+            for index, name in enumerate(names):
+                if index:
+                    body.append(f"{'    ' * index}if __n > {index}:")
+                body.append(f"{'    ' * (index + 1)}{name} = __args[{index}]")
+            body += [
+                "elif __kwargs:",
+                f"    __raise_bind_error(__args, __kwargs, {values})",
+            ]
+
+        for name in names:
+            if name in self._defaults:
+                namespace[f"__default_{name}"] = self._defaults[name]
+                body += [f"if {name} is __MISSING:", f"    {name} = __default_{name}"]
+            elif name in self._factories:
+                namespace[f"__factory_{name}"] = self._factories[name]
+                body += [f"if {name} is __MISSING:", f"    {name} = __factory_{name}()"]
+            elif name not in self._lazy_factories:
+                # Missing lazy fields are left unset, see `_build_lazy_getattr()`.
+                body += [f"if {name} is __MISSING:", f"    __raise_bind_error((), {{}}, {values})"]
+
+        return params, body, namespace
+
+    def _check_arg_count(self) -> list[str]:
+        field_count = len(self._slots_names)
+        return [
+            f"if len(args) != {field_count}:",
+            f"    raise TypeError(f\"Expect {field_count} field(s), but received {{len(args)}} argument(s).\")",
+        ]
+
+    def _build_tuple_layout(
+        self, *, eq: bool, build_hash: bool, has_post_init: bool, validate: str | bool = False
+    ) -> dict[str, typing.Any]:
+        """Build the members of a tuple variant whose instances are tuples of its fields.
+
+        Everything `tuple` would wrongly provide to an enum variant, such as equality
+        with plain tuples or other variants, is shadowed by the enum's own behavior.
+        """
+        cls = self._base
+        namespace: dict[str, typing.Any] = {
+            name: _tuplegetter(index, f"Alias for field number {index}")
+            for index, name in enumerate(self._slots_names)
+        }
+        new_namespace = {"__tuple_new": tuple.__new__}
+        body = self._check_arg_count()
+        if validate:
+            body.append(f"{', '.join(self._slots_names)}, = args")
+            body += self._build_checks(new_namespace, sample=validate == "sample")
+        body += [
+            "self = __tuple_new(__cls, args)",
+            *self._call_initializers("self", has_post_init=has_post_init),
+            "return self",
+        ]
+        namespace["__new__"] = self._make_method("__new__", "__cls, /, *args", body, new_namespace)
+        namespace["__init__"] = object.__init__
+        namespace["dump"] = self._make_method("dump", "self", ["return self[:]"], {})
+        namespace["__ne__"] = cls.__ne__
+        for method_name in _COMPARISONS:
+            namespace[method_name] = getattr(cls, method_name)
+
+        if not eq:
+            namespace["__eq__"] = cls.__eq__
+            namespace["__hash__"] = cls.__hash__
+            return namespace
+
+        body = [
+            "if self is other:",
+            "    return True",
+            "if type(other) is not type(self):",
+            "    return False",
+            "return __tuple_eq(self, other)",
+        ]
+        namespace["__eq__"] = self._make_method("__eq__", "self, other", body, {"__tuple_eq": tuple.__eq__})
+        if build_hash:
+            namespace["__hash__"] = tuple.__hash__
+        return namespace
+
+    def _raise_bind_error(self, args: tuple, kwargs: dict, values: tuple) -> typing.NoReturn:
+        """Bind arguments the generic way and raise the error it encounters."""
+        _, named_field = self.field
+        kwargs = {name: value for name, value in zip(self._slots_names, values) if value is not _MISSING} | kwargs
 
-                @staticmethod
-                def _pickle(variant):
-                    assert isinstance(variant, ConstructedVariant)
-                    return unpickle, (cls, self.name, (), {})
+        if args:
+            if self._kw_only:
+                raise TypeError(f"Variant '{self._actual.__qualname__}' is keyword only.")
 
-                def dump(self):
-                    return ()
+            if len(args) > len(self._slots_names):
+                raise TypeError(f"{self.name} takes {len(self._slots_names)} positional argument(s) but {len(args)} were/was given")
 
-                def __repr__(self) -> str:
-                    values_repr = ""
-                    return f"{item._base.__name__}.{self.__name__}({values_repr})"
+            # a valid use case of zip without strict=True
+            for arg, field_name in zip(args, self._slots_names):
+                if field_name in kwargs:
+                    raise TypeError(f"Inconsistent input for field '{field_name}': received both positional and keyword values")
+                kwargs[field_name] = arg
 
-                def __init__(self) -> None:
-                    post_init = getattr(self, "__post_init__", lambda: None)
-                    post_init()
+        # Defaults only need to be present here, so factories are not called.
+        for name in self._defaults_and_factories:
+            kwargs.setdefault(name, _MISSING)
 
-            self._actual = FieldlessConstructedVariant
-        # fmt: on
+        if missed_keys := kwargs.keys() ^ named_field.keys():
+            raise TypeError(f"Key mismatch: {missed_keys}")
 
-        copyreg.pickle(self._actual, self._actual._pickle)
-        self.attached = True
+        unreachable()
 
-    def __call__(self, *args, **kwargs):
-        return self._actual(*args, **kwargs)
+    def _annotations(self) -> dict[str, typing.Any]:
+        tuple_field, named_field = self.field
+        return dict(zip(self._slots_names, tuple_field or named_field.values(), strict=True))
+
+    def _annotation_globals(self) -> dict[str, typing.Any]:
+        module = sys.modules.get(self._base.__module__)
+        return vars(module) if module is not None else {}
+
+    def _build_checks(self, namespace: dict[str, typing.Any], *, sample: bool) -> list[str]:
+        """Generate the code checking the local variables named after the fields against their annotations."""
+        namespace["__invalid"] = self._raise_invalid
+        globalns = self._annotation_globals()
+        lines = []
+        for name, annotation in self._annotations().items():
+            # Names bound by a failed build would be left unused, so checks are built in a copy first.
+            scratch = dict(namespace)
+            try:
+                check = _build_check(annotation, name, scratch, sample=sample, owner=self._base, globalns=globalns)
+            except NameError:
+                # The module is still being imported, so the annotation refers to a name defined later.
+                namespace[f"__deferred_{name}"] = _DeferredCheck(
+                    annotation,
+                    owner=self._base,
+                    globalns=globalns,
+                    sample=sample,
+                    qualname=f"{self._base.__qualname__}.{self.name}.check_{name}",
+                )
+                check = f"__deferred_{name}({name})"
+            else:
+                namespace.update(scratch)
+            if check is None:
+                continue
+            condition = f"not ({check})"
+            if name in self._lazy_factories:
+                condition = f"{name} is not __MISSING and {condition}"
+            lines += [f"if {condition}:", f"    __invalid({name!r}, {name})"]
+        return lines
+
+    def _raise_invalid(self, name: str, value) -> typing.NoReturn:
+        annotation = self._annotations()[name]
+        expected = annotation.__qualname__ if isinstance(annotation, type) else annotation
+        raise TypeError(
+            f"Invalid value for field {name!r} of {self._actual.__qualname__}: expected {expected}, got {value!r}."
+        )
 
+    def _store_fields(self, instance: str, *, frozen: bool, cache_hash: bool) -> list[str]:
+        # Frozen variants reject `__setattr__`, so fields are written through object's setter,
+        # which is the only way to initialize them.
+        lines = []
+        for name in self._slots_names:
+            if name in self._lazy_factories:
+                lines.append(f"if {name} is not __MISSING:")
+                indent = "    "
+            else:
+                indent = ""
+            if frozen:
+                lines.append(f"{indent}__setattr({instance}, {name!r}, {name})")
+            else:
+                lines.append(f"{indent}{instance}.{name} = {name}")
+        if cache_hash:
+            lines.append(f"__setattr({instance}, {_HASH_SLOT!r}, None)")
+        return lines
+
+    def _build_lazy_getattr(self) -> types.FunctionType:
+        """Build `__getattr__()` producing the values of lazy fields, whose slots are empty until they are read."""
+        namespace: dict[str, typing.Any] = {"__setattr": _object_setattr}
+        body = []
+        for name, produce in self._lazy_factories.items():
+            namespace[f"__factory_{name}"] = produce
+            body += [
+                f"if name == {name!r}:",
+                f"    __value = __factory_{name}()",
+                f"    __setattr(self, {name!r}, __value)",
+                "    return __value",
+            ]
+        if hasattr(self._base, "__getattr__"):
+            namespace["__getattr"] = self._base.__getattr__
+            body.append("return __getattr(self, name)")
+        else:
+            body.append("raise AttributeError(f\"{type(self).__name__!r} object has no attribute {name!r}\", name=name, obj=self)")
+        return self._make_method("__getattr__", "self, name", body, namespace)
+
+    def _build_eq(self, *, cache_hash: bool) -> types.FunctionType:
+        body = [
+            "if self is other:",
+            "    return True",
+            "if type(other) is not type(self):",
+            "    return False",
+        ]
+        if cache_hash:
+            body += [
+                f"__hash = self.{_HASH_SLOT}",
+                "if __hash is not None:",
+                f"    __other_hash = other.{_HASH_SLOT}",
+                "    if __other_hash is not None and __hash != __other_hash:",
+                "        return False",
+            ]
+        for name in self._slots_names:
+            body += [
+                f"__value = self.{name}",
+                f"__other_value = other.{name}",
+                "if __value is not __other_value and not __value == __other_value:",
+                "    return False",
+            ]
+        body.append("return True")
+        return self._make_method("__eq__", "self, other", body, {})
+
+    def _build_hash(self, *, cache_hash: bool) -> types.FunctionType:
+        if not cache_hash:
+            if len(self._slots_names) == 1:
+                return self._make_method("__hash__", "self", [f"return hash(self.{self._slots_names[0]})"], {})
+            return self._make_method("__hash__", "self", [f"return hash(({''.join(f'self.{name}, ' for name in self._slots_names)}))"], {})
+        body = [
+            f"__hash = self.{_HASH_SLOT}",
+            "if __hash is None:",
+            f"    __hash = hash(({''.join(f'self.{name}, ' for name in self._slots_names)}))",
+            f"    __setattr(self, {_HASH_SLOT!r}, __hash)",
+            "return __hash",
+        ]
+        return self._make_method("__hash__", "self", body, {"__setattr": _object_setattr})
+
+    def _build_reduce(self, tag: int, *, tuple_layout: bool = False) -> types.FunctionType:
+        values = "*self" if tuple_layout else "".join(f"self.{name}, " for name in self._slots_names)
+        namespace = {"__reconstruct": getattr(self._base, _RECONSTRUCTOR), "__tag": tag}
+        return self._make_method("__reduce__", "self", [f"return __reconstruct, (__tag, {values})"], namespace)
+
+    def _build_dump(self, *, named: bool) -> types.FunctionType:
+        if named:
+            values = ", ".join(f"{name!r}: self.{name}" for name in self._slots_names)
+            body = [f"return {{{values}}}"]
+        else:
+            body = [f"return ({''.join(f'self.{name}, ' for name in self._slots_names)})"]
+        return self._make_method("dump", "self", body, {})
 
-POSITIONALS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    def _build_repr(self, *, named: bool) -> types.FunctionType:
+        if named:
+            values = ", ".join(f"{name}={{self.{name}!r}}" for name in self._slots_names)
+        else:
+            values = ", ".join(f"{{self.{name}!r}}" for name in self._slots_names)
+        body = [f"return f\"{{__prefix}}({values})\""]
+        return self._make_method("__repr__", "self", body, {"__prefix": f"{self._base.__name__}.{self.name}"})
+
+    def _make_method(self, name: str, params: str, body: list[str], namespace: dict) -> types.FunctionType:
+        for field_name in self._slots_names:
+            if not field_name.isidentifier() or keyword.iskeyword(field_name):
+                raise TypeError(f"Field name {field_name!r} is not a valid identifier.")
+        return make_function(
+            name,
+            params,
+            body,
+            namespace,
+            qualname=f"{self._base.__qualname__}.{self.name}.{name}",
+            module=self._base.__module__,
+        )
 
 
 class _FunctionVariant(Variant):  # MARK: FunctionVariant
@@ -280,8 +1134,16 @@ class _FunctionVariant(Variant):  # MARK: FunctionVariant
     name: str
 
     def __init__(self, func: types.FunctionType) -> None:
+        # `inspect` is slow to import, so it is only imported once a function variant is defined.
+        import inspect
+
         assert type(func) is types.FunctionType, "Type other than function is not allowed."
         self.attached = False
+        self._intern = False
+        self._layout = None
+        self._validate = None
+        self._pending = None
+        self._lazy_factories = {}
         self._func = func
         signature = inspect.signature(func)
         parameters_raw = signature.parameters
@@ -295,7 +1157,7 @@ class _FunctionVariant(Variant):  # MARK: FunctionVariant
         self.field = ((), parameter_names)
         self._match_args = tuple(
             name for name in parameter_names
-            if parameters_raw[name].kind in POSITIONALS
+            if parameters_raw[name].kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
         )
 
     def kw_only(self) -> typing.NoReturn:
@@ -310,149 +1172,201 @@ class _FunctionVariant(Variant):  # MARK: FunctionVariant
             "Use function defaults instead."
         )
 
-    def attach(
+    def layout(self, layout) -> typing.NoReturn:
+        raise TypeError("`.layout()` method cannot be used in function variant.")
+
+    def _build_namespace(
         self,
-        cls,
-        /,
         *,
         eq: bool,
         build_hash: bool,
         build_repr: bool,
         frozen: bool,
-    ) -> None | typing.Self:
-        if self.attached:
-            raise TypeError(f"This variants already attached to {self._base.__name__!r}.")
+        intern: bool,
+        tuple_layout: bool = False,
+        validate: str | typing.Literal[False] = False,
+        order: bool = False,
+        tag: int = 0,
+    ) -> dict[str, typing.Any]:
+        cls = self._base
+        name = self.name
+        has_post_init = hasattr(cls, "__post_init__")
+        cache_hash = build_hash and frozen
+        intern = intern or self._intern
+        if intern and not frozen:
+            raise TypeError("Only frozen variants can be interned.")
+        namespace = _variant_namespace(
+            cls, name, self._slots_names, frozen=frozen, cache_hash=cache_hash, weakref=intern
+        )
+        namespace |= self._build_constructor(
+            frozen=frozen, cache_hash=cache_hash, has_post_init=has_post_init, intern=intern, validate=validate
+        )
+        if self._slots_names:
+            namespace |= self._build_trusted_constructors(
+                frozen=frozen, cache_hash=cache_hash, has_post_init=has_post_init, intern=intern
+            )
+        namespace["__fields__"] = self._slots_names
+        namespace["__match_args__"] = self._match_args
+        namespace["dump"] = self._build_dump(named=True)
+        namespace["_get_positions"] = _get_positions
+
+        if build_hash:
+            namespace["__hash__"] = self._build_hash(cache_hash=cache_hash) if frozen else None
+
+        if eq:
+            namespace["__eq__"] = self._build_eq(cache_hash=cache_hash)
+
+        if build_repr:
+            prefix = f"{cls.__name__}.{name}"
+
+            def __repr__(self) -> str:
+                args_dict, kwargs = self._get_positions()
+                args_repr = ", ".join(repr(value) for value in args_dict.values())
+                kwargs_repr = ", ".join(
+                    f'{name}={value!r}'
+                    for name, value in kwargs.items()
+                )
 
-        self._base = cls
-        item = self
-
-        # fmt: off
-        class ConstructedVariant(cls):
-            if frozen and not typing.TYPE_CHECKING:
-                __slots__ = tuple(f"__original_{name}" for name in item._slots_names)
-                for name in item._slots_names:
-                    # to prevent potential security risk
-                    if name.isidentifier():
-                        exec(f"{name} = OneTimeSetter()")
-                    else:
-                        unreachable(name)
-                        OneTimeSetter()  # Show IDEs that OneTimeSetter is used. Not executed at runtime.
-            else:
-                __slots__ = item._slots_names
+                if args_repr and kwargs_repr:
+                    values_repr = f"{args_repr}, {kwargs_repr}"
+                else:
+                    values_repr = f"{args_repr}{kwargs_repr}"
 
-            __name__ = item.name
-            __qualname__ = f"{cls.__qualname__}.{item.name}"
-            __fields__ = item._slots_names
-            __match_args__ = item._match_args
+                return f"{prefix}({values_repr})"
 
-            if build_hash:
-                __slots__ += ("__hash",)
+            namespace["__repr__"] = __repr__
 
-                if frozen:
-                    def __hash__(self) -> int:
-                        with suppress(AttributeError):
-                            return self.__hash
+        namespace["__reduce__"] = self._build_reduce(tag)
+        if order:
+            namespace |= _build_order(cls, name, tag, self._slots_names)
+        return namespace
 
-                        self.__hash = hash(tuple(self.dump().items()))
-                        return self.__hash
-                else:
-                    __hash__ = None  # type: ignore
-
-            if eq:
-                def __eq__(self, other: typing.Self):
-                    return type(self) is type(other) and self.dump() == other.dump()
-
-            def _get_positions(self) -> tuple[dict[str, typing.Any], dict[str, typing.Any]]:
-                match_args = self.__match_args__
-                args_dict = {}
-                kwargs = {}
-                for name in self.__fields__:
-                    if name in match_args:
-                        args_dict[name] = getattr(self, name)
-                    else:
-                        kwargs[name] = getattr(self, name)
-                return args_dict, kwargs
-
-            @staticmethod
-            def _pickle(variant):
-                assert isinstance(variant, ConstructedVariant)
-                args_dict, kwargs = variant._get_positions()
-                return unpickle, (cls, self.name, tuple(args_dict.values()), kwargs)
-
-            def dump(self):
-                return {name: getattr(self, name) for name in self.__fields__}
-
-            if eq:
-                def __eq__(self, other: typing.Self):
-                    return type(self) is type(other) and self.dump() == other.dump()
+    def _instance_name(self) -> str:
+        return "self" if self._self_included else "__self"
 
-            if build_repr:
-                def __repr__(self) -> str:
-                    args_dict, kwargs = self._get_positions()
-                    args_repr = ", ".join(repr(value) for value in args_dict.values())
-                    kwargs_repr = ", ".join(
-                        f'{name}={value!r}'
-                        for name, value in kwargs.items()
-                    )
-
-                    if args_repr and kwargs_repr:
-                        values_repr = f"{args_repr}, {kwargs_repr}"
-                    else:
-                        values_repr = f"{args_repr}{kwargs_repr}"
-
-                    return f"{item._base.__name__}.{self.__name__}({values_repr})"
-
-            def __init__(self, *args, **kwargs) -> None:
-                bound = (
-                    item._signature.bind(None, *args, **kwargs)
-                    if item._self_included
-                    else item._signature.bind(*args, **kwargs)
-                )
+    def _call_arguments(self) -> str:
+        import inspect
 
-                # code from Signature.apply_defaults()
-                arguments = bound.arguments
-                new_arguments = {}
-                for name, param in item._signature.parameters.items():
-                    try:
-                        value = arguments[name]
-                    except KeyError:
-                        assert param.default is not inspect._empty, "Argument is not properly bound."
-                        value = param.default
-                    new_arguments[name] = factory._produce_from(value)
-                bound.arguments = new_arguments  # type: ignore # why not OrderedDict? I don't know
-
-                for name, value in new_arguments.items():
-                    if item._self_included and name == "self":
-                        continue
-                    setattr(self, name, value)
-
-                if item._self_included:
-                    bound.arguments["self"] = self
-                    result = item._func(*bound.args, **bound.kwargs)
-                    if result is not None:
-                        raise TypeError("Initializer should return None.")
-
-                    post_init = getattr(self, "__post_init__", lambda: None)
-                    post_init()
-        # fmt: on
-
-        self._actual = ConstructedVariant
-        copyreg.pickle(self._actual, self._actual._pickle)
-        self.attached = True
+        prefixes = {
+            inspect.Parameter.POSITIONAL_ONLY: "",
+            inspect.Parameter.VAR_POSITIONAL: "*",
+            inspect.Parameter.VAR_KEYWORD: "**",
+        }
+        return ", ".join(
+            f"{prefixes[param.kind]}{param.name}" if param.kind in prefixes else f"{param.name}={param.name}"
+            for param in self._parameters()
+        )
+
+    def _parameters(self) -> list[inspect.Parameter]:
+        return [param for name, param in self._signature.parameters.items() if name in self._slots_names]
+
+    def _annotations(self) -> dict[str, typing.Any]:
+        # Only the parameters holding a single value are checked, not `*args` and `**kwargs`.
+        return {
+            param.name: param.annotation for param in self._parameters()
+            if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD) and param.annotation is not param.empty
+        }
+
+    def _annotation_globals(self) -> dict[str, typing.Any]:
+        return self._func.__globals__
+
+    def _build_binding(self) -> tuple[list[str], list[str], dict[str, typing.Any]]:
+        import inspect
+
+        # The generated constructor has the same parameters as the function,
+        # so arguments are bound by the interpreter itself.
+        namespace: dict[str, typing.Any] = {"__MISSING": _MISSING}
+        parameters = self._parameters()
+        last_positional_only = max(
+            (index for index, param in enumerate(parameters) if param.kind is inspect.Parameter.POSITIONAL_ONLY),
+            default=-1,
+        )
+        params = [] if last_positional_only >= 0 else ["/"]
+        body = []
+        star_added = False
+        for index, param in enumerate(parameters):
+            name = param.name
+            match param.kind:
+                case inspect.Parameter.VAR_POSITIONAL:
+                    params.append(f"*{name}")
+                    star_added = True
+                    continue
+                case inspect.Parameter.VAR_KEYWORD:
+                    params.append(f"**{name}")
+                    continue
+                case inspect.Parameter.KEYWORD_ONLY if not star_added:
+                    params.append("*")
+                    star_added = True
+
+            if param.default is inspect.Parameter.empty:
+                params.append(name)
+            elif isinstance(param.default, factory):
+                namespace[f"__factory_{name}"] = param.default.produce
+                params.append(f"{name}=__MISSING")
+                body += [f"if {name} is __MISSING:", f"    {name} = __factory_{name}()"]
+            else:
+                namespace[f"__default_{name}"] = param.default
+                params.append(f"{name}=__default_{name}")
+
+            if index == last_positional_only:
+                params.append("/")
+
+        namespace["__func"] = self._func
+        return params, body, namespace
+
+    def _call_initializers(self, instance: str, *, has_post_init: bool) -> list[str]:
+        if not self._self_included:
+            return []
+
+        import inspect
+
+        call_args = ["self"]
+        for param in self._parameters():
+            match param.kind:
+                case inspect.Parameter.VAR_POSITIONAL:
+                    call_args.append(f"*{param.name}")
+                case inspect.Parameter.VAR_KEYWORD:
+                    call_args.append(f"**{param.name}")
+                case inspect.Parameter.KEYWORD_ONLY:
+                    call_args.append(f"{param.name}={param.name}")
+                case _:
+                    call_args.append(param.name)
+        lines = [
+            f"if __func({', '.join(call_args)}) is not None:",
+            "    raise TypeError(\"Initializer should return None.\")",
+        ]
+        return lines + super()._call_initializers(instance, has_post_init=has_post_init)
+
+    def _call_post_init(self, instance: str, *, has_post_init: bool) -> list[str]:
+        # The constructor only calls `__post_init__()` for functions taking `self`.
+        if not self._self_included:
+            return []
+        return super()._call_post_init(instance, has_post_init=has_post_init)
 
 
 @typing.overload
 def variant(cls: type, /) -> Variant: ...
 
 @typing.overload
-def variant(*, kw_only: bool = False) -> typing.Callable[[type], Variant]: ...
+def variant(
+    *, kw_only: bool = False, intern: bool = False, validate: bool | typing.Literal["full", "sample"] | None = None
+) -> typing.Callable[[type], Variant]: ...
 
 @typing.overload
 def variant(func: types.FunctionType, /) -> Variant: ...
 
-def variant(cls_or_func=None, /, *, kw_only: bool = False) -> typing.Any:  # MARK: variant
+def variant(
+    cls_or_func=None,
+    /,
+    *,
+    kw_only: bool = False,
+    intern: bool = False,
+    validate: bool | typing.Literal["full", "sample"] | None = None,
+) -> typing.Any:  # MARK: variant
     if cls_or_func is None:
-        return lambda cls_or_func: variant(cls_or_func, kw_only=kw_only)  # type: ignore
+        return lambda cls_or_func: variant(  # type: ignore
+            cls_or_func, kw_only=kw_only, intern=intern, validate=validate
+        )
 
     if isinstance(cls_or_func, types.FunctionType):
         constructed = _FunctionVariant(cls_or_func)
@@ -468,6 +1382,11 @@ def variant(cls_or_func=None, /, *, kw_only: bool = False) -> typing.Any:  # MAR
         if kw_only:
             constructed = constructed.kw_only()
 
+    if intern:
+        constructed = constructed.intern()
+    if validate is not None:
+        constructed = constructed.validate(validate)
+
     return constructed
 
 
@@ -475,20 +1394,24 @@ class factory(typing.Generic[T]):  # MARK: factory
     def __init__(self, func: typing.Callable[[], T]):
         self.__factory = func
 
-    @classmethod
-    def _produce_from(cls, value: factory[T] | T) -> T:
-        return value.produce() if isinstance(value, factory) else value  # type: ignore
-
     def produce(self) -> T:
         return self.__factory()
 
 
+class lazy_factory(factory[T]):
+    """A factory whose value is produced when the field is first read, not when the variant is constructed.
+
+    Function variants and interned variants produce the value on construction like a normal factory.
+    """
+
+
 class UnitDescriptor:  # MARK: Unit
-    __slots__ = ("name",)
+    __slots__ = ("name", "_base", "_pending")
     __fields__ = None
 
     def __init__(self, name: str | None = None):
         self.name = name
+        self._pending = None
 
     def __set_name__(self, owner, name):
         setattr(owner, name, UnitDescriptor(name))
@@ -500,8 +1423,19 @@ class UnitDescriptor:  # MARK: Unit
     def __get__(self, obj, objtype: None = ...) -> typing.Self: ...
 
     def __get__(self, obj, objtype: type[T] | None = None) -> T | typing.Self:
+        if self._pending is not None:
+            with _lazy_attach_lock:
+                if (options := self._pending) is not None:
+                    self.attach(self._base, **options)
+                    self._pending = None
+            return vars(self._base)[self.name]
         return self
 
+    def attach_lazily(self, cls, /, **options) -> None:
+        """Defer `attach()` until the unit variant is first accessed."""
+        self._base = cls
+        self._pending = options
+
     def attach(
         self,
         cls,
@@ -511,40 +1445,34 @@ class UnitDescriptor:  # MARK: Unit
         build_hash: bool,
         build_repr: bool,
         frozen: bool,
+        intern: bool = False,  # unit variants are singletons anyway
+        layout: str = "slots",  # there are no fields to lay out
+        validate: str | bool = False,  # there are no fields to validate
+        order: bool = False,
+        tag: int = 0,
     ) -> None:
         if self.name is None:
             raise TypeError("`self.name` is not set.")
 
-        class UnitConstructedVariant(cls, metaclass=ParamlessSingletonMeta):
-            __name__ = self.name
-            __slots__ = ()
-            __fields__ = None  # `None` means it does not require calling for initialize.
-
-            if build_hash and not frozen:
-                __hash__ = None  # type: ignore # Explicitly disable hash
-            else:
-                def __hash__(self):
-                    return hash(type(self))
-
-            def dump(self):
-                return None
-
-            @staticmethod
-            def _pickle(variant):
-                assert isinstance(variant, UnitConstructedVariant)
-                return unpickle, (cls, self.name, None, None)
-
-            def __init__(self):
-                pass
-
-            if build_repr:
-                def __repr__(self):
-                    return f"{cls.__name__}.{self.__name__}"
-
-        copyreg.pickle(UnitConstructedVariant, UnitConstructedVariant._pickle)
+        name = self.name
+        namespace = _variant_namespace(cls, name, (), frozen=frozen, cache_hash=False)
+        namespace["__fields__"] = None  # `None` means it does not require calling for initialize.
+        namespace["__init__"] = object.__init__
+        namespace["__hash__"] = None if build_hash and not frozen else _hash_singleton  # Explicitly disable hash
+        namespace["dump"] = _dump_unit
+        if build_repr:
+            namespace["__repr__"] = _constant_repr(f"{cls.__name__}.{name}")
+        namespace["__reduce__"] = _constant_reduce((getattr(cls, _RECONSTRUCTOR), (tag,)))
+        if order:
+            namespace |= _build_order(cls, name, tag, ())
+        namespace["__tag__"] = tag
+        namespace["__field_types__"] = {}
+        unit_variant = type(cls)(name, (cls,), namespace)
+        instance = object.__new__(unit_variant)
+        unit_variant.__new__ = _singleton_new(instance)
 
         # This will replace Unit to specialized instance.
-        setattr(cls, self.name, UnitConstructedVariant())
+        setattr(cls, name, instance)
 
 
 Unit = UnitDescriptor()
@@ -556,14 +1484,32 @@ def fieldenum(
     *,
     eq: bool = True,
     frozen: bool = True,
+    weakref: bool = False,
+    intern: bool = False,
+    layout: typing.Literal["slots", "tuple"] = "slots",
+    lazy: bool = False,
+    validate: bool | typing.Literal["full", "sample"] = False,
+    order: bool = False,
 ):
     if cls is None:
         return lambda cls: fieldenum(
             cls,
             eq=eq,
             frozen=frozen,
+            weakref=weakref,
+            intern=intern,
+            layout=layout,
+            lazy=lazy,
+            validate=validate,
+            order=order,
         )
 
+    if layout not in _LAYOUTS:
+        raise ValueError(f"Unknown layout {layout!r}. Use one of {_LAYOUTS}.")
+    validate = _validation_mode(validate)
+    if order and not eq:
+        raise TypeError("Ordering requires `eq=True`.")
+
     # Preventing subclassing fieldenums at runtime.
     # This also prevent double decoration.
     is_final = False
@@ -579,28 +1525,276 @@ def fieldenum(
             "which should not be subclassed."
         )
 
+    cls = _with_slots(cls, weakref=weakref)
     class_attributes = vars(cls)
+    if order and (defined := _COMPARISONS.keys() & class_attributes.keys()):
+        raise TypeError(f"Cannot use `order=True` since {cls.__name__!r} defines {', '.join(sorted(defined))}.")
     has_own_hash = "__hash__" in class_attributes
     build_hash = eq and not has_own_hash
     build_repr = cls.__repr__ is object.__repr__
 
+    # Pickle refers to bound methods by the name of their function, which is why it matches the attribute.
+    setattr(cls, _RECONSTRUCTOR, types.MethodType(_fieldenum_reconstruct, cls))
     attrs = []
-    for name, attr in class_attributes.items():
+    for name, attr in list(class_attributes.items()):
         if isinstance(attr, Variant | UnitDescriptor):
-            attr.attach(
+            # Lazy variants are built on first access, which includes construction, matching and unpickling.
+            attach = attr.attach_lazily if lazy else attr.attach
+            attach(
                 cls,
                 eq=eq,
                 build_hash=build_hash,
                 build_repr=build_repr,
                 frozen=frozen,
+                intern=intern,
+                layout=layout,
+                validate=validate,
+                order=order,
+                tag=len(attrs),
             )
             attrs.append(name)
 
     cls.__variants__ = attrs
+    if lazy:
+        # Building the tables would build every variant, so lazy enums build them on first access.
+        cls.__variant_classes__ = _LazyClassAttribute(cls, "__variant_classes__", lambda: _variant_classes(cls))
+        cls.__variant_map__ = _LazyClassAttribute(
+            cls, "__variant_map__", lambda: dict(zip(attrs, cls.__variant_classes__, strict=True))
+        )
+    else:
+        cls.__variant_classes__ = _variant_classes(cls)
+        cls.__variant_map__ = dict(zip(attrs, cls.__variant_classes__, strict=True))
+    if order:
+        # `operator.methodcaller` is a C-level callable, so keys are made without a Python frame of its own.
+        cls.sort_key = methodcaller("_sort_key")
     cls.__init__ = _init_not_allowed
 
     return typing.final(cls)
 
 
+def make_enum(
+    name: str,
+    specs: typing.Mapping[str, typing.Any],
+    /,
+    *,
+    module: str | None = None,
+    qualname: str | None = None,
+    **options,
+) -> type:
+    """Build a fieldenum from the specs of its variants, without writing a class body.
+
+    A spec is either a `Variant`, `Unit` or function variant, which is used as is,
+    a tuple of field types for a tuple variant (`()` makes a fieldless variant),
+    or a dict of field names and types for a named variant.
+    The other keyword arguments are the options of `fieldenum()`.
+    """
+    namespace: dict[str, typing.Any] = {}
+    for variant_name, spec in specs.items():
+        match spec:
+            case Variant() | UnitDescriptor():
+                namespace[variant_name] = spec
+            case tuple():
+                namespace[variant_name] = Variant(*spec)
+            case dict():
+                namespace[variant_name] = Variant(**spec)
+            case _:
+                raise TypeError(f"Invalid spec for variant {variant_name!r}: {spec!r}")
+
+    if module is None:
+        # Like functional API of `enum`, the caller's module is used so that variants can be pickled.
+        module = sys._getframe(1).f_globals.get("__name__", "__main__")
+    namespace["__module__"] = module
+    namespace["__qualname__"] = qualname or name
+    # Giving the slots up front saves `fieldenum()` from creating the class twice.
+    namespace["__slots__"] = ("__weakref__",) if options.get("weakref") else ()
+    return fieldenum(type(name, (), namespace), **options)
+
+
+def intern_stats(enum_or_variant) -> dict[str, typing.Any]:
+    """Report how well interning works for a fieldenum or one of its variants.
+
+    `uninterned` counts the instances whose fields are unhashable or cannot be told apart by equality,
+    and which were therefore not interned.
+    `bytes_saved` estimates the memory saved by the hits, assuming each hit would otherwise have been a new instance.
+    """
+    if isinstance(enum_or_variant, type) and "__variants__" in vars(enum_or_variant):
+        variants = [getattr(enum_or_variant, name) for name in enum_or_variant.__variants__]
+    else:
+        variants = [enum_or_variant]
+
+    hits = misses = uninterned = live = bytes_saved = 0
+    for variant in variants:
+        table = vars(variant).get("_intern_table") if isinstance(variant, type) else None
+        if table is None:
+            continue
+        variant_hits, variant_misses, variant_uninterned = table.counters
+        hits += variant_hits
+        misses += variant_misses
+        uninterned += variant_uninterned
+        live += len(table.entries)
+        bytes_saved += variant_hits * variant.__basicsize__
+
+    return {
+        "hits": hits,
+        "misses": misses,
+        "uninterned": uninterned,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "live": live,
+        "bytes_saved": bytes_saved,
+    }
+
+
+def pickle_many(variants: typing.Iterable, /, *, protocol: int | None = None) -> bytes:
+    """Pickle variants of a single fieldenum as one flat list, storing the enum only once.
+
+    Each variant is stored as its tag followed by its field values, so no per-variant tuple is pickled.
+    If every variant is of the same kind, the tag is stored only once as well.
+    Load the result with `unpickle_many()`.
+    """
+    import pickle
+
+    enum = reconstruct = tag = None
+    length = 0
+    values: list[typing.Any] = []
+    extend = values.extend
+    for variant in variants:
+        if enum is None:
+            enum = type(variant).__bases__[0]
+            reconstruct = getattr(enum, _RECONSTRUCTOR, None)
+            if reconstruct is None:
+                raise TypeError(f"Expected a variant of a fieldenum, got {variant!r}.")
+            tag = variant.__tag__
+        reconstructor, args = variant.__reduce__()
+        if reconstructor is not reconstruct:
+            raise TypeError(f"Expected a variant of {enum.__qualname__}, got {variant!r}.")
+        if tag is not None and args[0] != tag:
+            tag = None
+        extend(args)
+        length += 1
+
+    if tag is not None:
+        # Every value is preceded by the same tag, which is dropped.
+        del values[::len(values) // length]
+    return pickle.dumps((enum, tag, length, values), protocol)
+
+
+def unpickle_many(data: bytes, /) -> list:
+    """Load variants pickled by `pickle_many()`."""
+    import pickle
+
+    enum, tag, length, values = pickle.loads(data)
+    if not length:
+        return []
+    classes = enum.__variant_classes__
+    if tag is not None:
+        variant = classes[tag]
+        if not values:
+            return [variant()] * length
+        return list(variant.from_rows(zip(*[iter(values)] * (len(values) // length), strict=True)))
+
+    # Unit variants have `None` as their `__fields__`.
+    field_counts = [len(variant.__fields__ or ()) for variant in classes]
+    result = []
+    append = result.append
+    values_iter = iter(values)
+    for tag in values_iter:
+        variant = classes[tag]
+        if count := field_counts[tag]:
+            append(variant._make(islice(values_iter, count)))
+        else:
+            append(variant())
+    return result
+
+
+def warmup(modules_or_enums: typing.Iterable[types.ModuleType | str | type], /, *, freeze: bool = False) -> None:
+    """Build everything that fieldenums would otherwise build on first use.
+
+    Call this in the parent process of a preforking server, so that workers share the built objects
+    instead of building their own copies after fork.
+    Modules (or their names) are searched for the fieldenums defined at their top level.
+    Lazy variants, singletons of fieldless variants, lazily compiled constructors and variant tables are built,
+    and the generated code is written to the on-disk cache.
+    With `freeze=True`, `gc.freeze()` is called afterwards, so that garbage collections in the workers
+    do not touch (and copy) the pages of objects created so far. In that case, call this right before forking.
+    """
+    enums: dict[type, None] = {}
+    for target in modules_or_enums:
+        if isinstance(target, str):
+            target = __import__(target, fromlist=["__name__"])
+        if isinstance(target, types.ModuleType):
+            for value in vars(target).values():
+                if isinstance(value, type) and "__variants__" in vars(value):
+                    enums[value] = None
+        elif isinstance(target, type) and "__variants__" in vars(target):
+            enums[target] = None
+        else:
+            raise TypeError(f"Expected a module or a fieldenum, got {target!r}.")
+
+    for enum in enums:
+        for name in enum.__variants__:
+            variant = getattr(enum, name)
+            if not isinstance(variant, type):  # unit variants are built as instances
+                continue
+            for attr_name, value in list(vars(variant).items()):
+                if isinstance(value, _LazyClassMethod):
+                    getattr(variant, attr_name)
+            if getattr(vars(variant).get("__new__"), "__func__", None) is _new_singleton:
+                variant()
+        # Reading the lazy attributes of the enum computes and stores them.
+        getattr(enum, "__variant_classes__")
+        getattr(enum, "__variant_map__")
+
+    write_caches()
+    if freeze:
+        import gc
+
+        gc.freeze()
+
+
+def _with_slots(cls, *, weakref: bool):
+    """Recreate the class with `__slots__` so that variants do not carry `__dict__`.
+
+    Like `dataclass(slots=True)`, recreating the class runs `__init_subclass__()` and metaclass hooks again,
+    and decorators applied before `fieldenum` see the discarded class.
+    Classes declaring `__slots__` themselves are kept as they are.
+    """
+    if "__slots__" in cls.__dict__:
+        # The layout is managed by the user.
+        return cls
+    if any(base.__dictoffset__ for base in cls.__bases__) and (
+        not weakref or any(base.__weakrefoffset__ for base in cls.__bases__)
+    ):
+        # Instances get `__dict__` (and `__weakref__` if needed) from a base anyway, so there is nothing to save.
+        return cls
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    has_weakref = any(base.__weakrefoffset__ for base in cls.__bases__)
+    cls_dict["__slots__"] = ("__weakref__",) if weakref and not has_weakref else ()
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+
+    # Methods using `super()` or `__class__` have a closure cell pointing to the old class.
+    for value in cls_dict.values():
+        match value:
+            case classmethod() | staticmethod():
+                functions = [value.__func__]
+            case property():
+                functions = [value.fget, value.fset, value.fdel]
+            case _:
+                functions = [value]
+        for function in functions:
+            closure = getattr(function, "__closure__", None)
+            if not closure or "__class__" not in function.__code__.co_freevars:
+                continue
+            cell = closure[function.__code__.co_freevars.index("__class__")]
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+
+    return new_cls
+
+
 def _init_not_allowed(*args, **kwargs) -> typing.NoReturn:
     raise TypeError("A base fieldenum cannot be initialized.")
@@ -0,0 +1,232 @@
+"""A compact binary codec for fieldenums whose fields are primitives, strings, bytes or other fieldenums.
+
+A variant is encoded as its tag and its fields packed with a `struct` layout generated for the variant,
+followed by the contents of its variable-size fields in order.
+Integers are encoded as signed 64-bit integers and floats as doubles, both little-endian.
+Strings (in UTF-8) and bytes are prefixed with their length in the fixed part,
+and nested fieldenums are encoded in place with their own codec.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import typing
+
+from ._codegen import make_function
+from ._fieldenum import _resolve_annotation
+
+__all__ = ["BinaryCodec"]
+
+_FORMATS = {bool: "?", int: "q", float: "d"}
+_LENGTH_FORMAT = "I"
+
+
+def _grow(buffer, end: int) -> None:
+    if not isinstance(buffer, bytearray):
+        raise ValueError(f"The buffer is too small: {end} bytes are needed, but it has {len(buffer)} bytes.")
+    buffer.extend(bytes(end - len(buffer)))
+
+
+def _truncated(buffer, offset: int) -> ValueError:
+    return ValueError(f"The buffer is truncated: the variant at offset {offset} ends after {len(buffer)} bytes.")
+
+
+class BinaryCodec:
+    """Encode and decode the variants of a fieldenum.
+
+    The encoders and decoders of the variants are generated when the codec is created,
+    so fields that cannot be encoded raise TypeError right away.
+    """
+    __slots__ = ("enum", "_encoders", "_decoders", "_unpack_tag")
+
+    def __init__(self, enum: type, /) -> None:
+        self._build(enum, {})
+
+    @classmethod
+    def _for_nested(cls, enum: type, codecs: dict[type, BinaryCodec]) -> BinaryCodec:
+        # Codecs being built are shared, so that recursive fieldenums refer to their own codec.
+        if enum in codecs:
+            return codecs[enum]
+        codec = cls.__new__(cls)
+        codec._build(enum, codecs)
+        return codec
+
+    def _build(self, enum: type, codecs: dict[type, BinaryCodec]) -> None:
+        if not isinstance(enum, type) or "__variants__" not in vars(enum):
+            raise TypeError(f"Expected a fieldenum, got {enum!r}.")
+        codecs[enum] = self
+        self.enum = enum
+        classes = enum.__variant_classes__
+        tag_format = "B" if len(classes) <= 256 else "H"
+        self._unpack_tag = struct.Struct(f"<{tag_format}").unpack_from
+        module = sys.modules.get(enum.__module__)
+        globalns = vars(module) if module is not None else {}
+        self._encoders = {}
+        decoders = []
+        for variant in classes:
+            encode, decode = self._build_variant(variant, tag_format, globalns, codecs)
+            self._encoders[variant] = encode
+            decoders.append(decode)
+        self._decoders = tuple(decoders)
+
+    def _build_variant(
+        self, variant: type, tag_format: str, globalns: dict[str, typing.Any], codecs: dict[type, BinaryCodec]
+    ) -> tuple[typing.Callable, typing.Callable]:
+        # Tuple variants list the indices of their fields in `__fields__`, and unit variants list None.
+        names = [f"_{field}" if isinstance(field, int) else field for field in variant.__fields__ or ()]
+        field_types = variant.__field_types__
+
+        formats = [tag_format]
+        packed = ["__tag"]  # the values packed into the fixed part
+        unpacked = ["__tag"]  # the names the fixed part is unpacked into
+        prepare = []  # encodes the variable-size fields before the fixed part is packed
+        write = []  # writes the variable-size fields after the fixed part
+        read = []  # reads the variable-size fields after the fixed part
+        sizes = []
+        namespace: dict[str, typing.Any] = {
+            "__tag": variant.__tag__, "__grow": _grow, "__truncated": _truncated, "__encode_str": str.encode
+        }
+        for name in names:
+            if name not in field_types:
+                raise TypeError(f"Cannot encode the field {name!r} of {variant.__qualname__} without an annotation.")
+            annotation = _resolve_annotation(field_types[name], self.enum, globalns)
+            if annotation in _FORMATS:
+                formats.append(_FORMATS[annotation])
+                packed.append(f"value.{name}")
+                unpacked.append(name)
+            elif annotation is str or annotation is bytes:
+                formats.append(_LENGTH_FORMAT)
+                # `str.encode()` raises TypeError for other types, where a method call would raise AttributeError.
+                prepare.append(f"__{name} = {'__encode_str' if annotation is str else ''}(value.{name})")
+                packed.append(f"len(__{name})")
+                unpacked.append(f"__length_{name}")
+                sizes.append(f"len(__{name})")
+                write += [
+                    f"buffer[offset:offset + len(__{name})] = __{name}",
+                    f"offset += len(__{name})",
+                ]
+                content = f"buffer[offset:offset + __length_{name}]"
+                read += [
+                    # Slicing past the end of a buffer does not fail, so truncated contents are checked here.
+                    f"if offset + __length_{name} > len(buffer):",
+                    "    raise __truncated(buffer, __start)",
+                    f"{name} = str({content}, 'utf-8')" if annotation is str else f"{name} = bytes({content})",
+                    f"offset += __length_{name}",
+                ]
+            elif isinstance(annotation, type) and "__variants__" in vars(annotation):
+                codec = type(self)._for_nested(annotation, codecs)
+                namespace[f"__encode_{name}"] = codec.encode_into
+                namespace[f"__decode_{name}"] = codec.decode_from
+                write.append(f"offset = __encode_{name}(value.{name}, buffer, offset)")
+                read.append(f"{name}, offset = __decode_{name}(buffer, offset)")
+            else:
+                raise TypeError(
+                    f"Cannot encode the field {name!r} of {variant.__qualname__} annotated with {annotation!r}."
+                )
+
+        layout = struct.Struct(f"<{''.join(formats)}")
+        namespace["__pack_into"] = layout.pack_into
+        namespace["__unpack_from"] = layout.unpack_from
+        encode = [
+            *prepare,
+            f"__end = offset + {' + '.join([str(layout.size), *sizes])}",
+            "if len(buffer) < __end:",
+            "    __grow(buffer, __end)",
+            f"__pack_into(buffer, offset, {', '.join(packed)})",
+        ]
+        if write:
+            encode += [f"offset += {layout.size}", *write, "return offset"]
+        else:
+            encode.append("return __end")
+
+        if names:
+            namespace["__make"] = variant._make
+            result = f"__make(({', '.join(names)},))"
+        else:
+            namespace["__value"] = variant()
+            result = "__value"
+        decode = [
+            # The start of the variant is kept for the errors of truncated variable-size fields.
+            *(["__start = offset"] if sizes else []),
+            f"{', '.join(unpacked)}, = __unpack_from(buffer, offset)",
+            f"offset += {layout.size}",
+            *read,
+            f"return {result}, offset",
+        ]
+
+        qualname = f"{type(self).__name__}.{variant.__qualname__}"
+        module = self.enum.__module__
+        encoder = make_function(
+            "encode", "value, buffer, offset", encode, namespace, qualname=f"{qualname}.encode", module=module
+        )
+        decoder = make_function(
+            "decode", "buffer, offset", decode, namespace, qualname=f"{qualname}.decode", module=module
+        )
+        return encoder, decoder
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.enum.__qualname__})"
+
+    def encode(self, value) -> bytes:
+        buffer = bytearray()
+        self.encode_into(value, buffer)
+        return bytes(buffer)
+
+    def encode_into(self, value, buffer, offset: int = 0) -> int:
+        """Write `value` to `buffer` at `offset`, and return the offset right after it.
+
+        A bytearray is extended if it is too small. Other writable buffers must be large enough.
+        ValueError is raised if a field cannot be packed, and TypeError if a string or bytes field holds another type.
+        """
+        try:
+            encode = self._encoders[type(value)]
+        except KeyError:
+            raise TypeError(f"Expected a variant of {self.enum.__qualname__}, got {value!r}.") from None
+        try:
+            return encode(value, buffer, offset)
+        except struct.error as exc:
+            # Such as integers which do not fit in 64 bits.
+            raise ValueError(f"Cannot encode {value!r}: {exc}.") from None
+
+    def decode(self, data):
+        value, end = self.decode_from(data)
+        if end != len(data):
+            raise ValueError(f"{len(data) - end} byte(s) are left after the encoded variant.")
+        return value
+
+    def decode_from(self, buffer, offset: int = 0) -> tuple[typing.Any, int]:
+        """Read a variant from `buffer` at `offset`, and return it with the offset right after it.
+
+        ValueError is raised if the buffer is truncated or holds an unknown tag.
+        """
+        try:
+            tag, = self._unpack_tag(buffer, offset)
+            try:
+                decode = self._decoders[tag]
+            except IndexError:
+                raise ValueError(f"Unknown tag {tag} for {self.enum.__qualname__}.") from None
+            return decode(buffer, offset)
+        except struct.error:
+            raise _truncated(buffer, offset) from None
+
+    def iter_decode(self, buffer) -> typing.Iterator:
+        """Read the variants encoded one after another in `buffer`."""
+        # Slicing a memoryview does not copy, unlike slicing bytes.
+        buffer = memoryview(buffer).cast("B")
+        unpack_tag = self._unpack_tag
+        decoders = self._decoders
+        offset = 0
+        end = len(buffer)
+        try:
+            while offset < end:
+                # Same as `decode_from()`, inlined since the loop is the hot path of reading a stream.
+                tag = unpack_tag(buffer, offset)[0]
+                try:
+                    decode = decoders[tag]
+                except IndexError:
+                    raise ValueError(f"Unknown tag {tag} for {self.enum.__qualname__}.") from None
+                value, offset = decode(buffer, offset)
+                yield value
+        except struct.error:
+            raise _truncated(buffer, offset) from None
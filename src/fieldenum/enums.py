@@ -41,7 +41,7 @@ class _SupportsGetitem[Item, Value](Protocol):
 T = TypeVar("T", covariant=True)  # variance inference did not work well and i don't know why
 
 @final  # A redundant decorator for type checkers.
-@fieldenum
+@fieldenum(lazy=True)
 class Option(Generic[T]):
     if TYPE_CHECKING:
         Nothing = Unit
@@ -312,7 +312,7 @@ class Option(Generic[T]):
 
 
 @final  # A redundant decorator for type checkers.
-@fieldenum
+@fieldenum(lazy=True)
 class Result[R, E: BaseException]:
     if TYPE_CHECKING:
         class Ok[R, E: BaseException](Result[R, E]):  # type: ignore
@@ -452,7 +452,7 @@ class Result[R, E: BaseException]:
 
 
 @final  # A redundant decorator for type checkers.
-@fieldenum
+@fieldenum(lazy=True)
 class BoundResult[R, E: BaseException]:
     if TYPE_CHECKING:
         class Success[R, E: BaseException](BoundResult[R, E]):  # type: ignore
@@ -498,7 +498,7 @@ class BoundResult[R, E: BaseException]:
             if not issubclass(self.bound, BaseException):
                 raise IncompatibleBoundError(f"{self.bound} is not an exception.")
 
-            if isinstance(self, Failed) and not isinstance(self.error, self.bound):
+            if isinstance(self, BoundResult.Failed) and not isinstance(self.error, self.bound):
                 raise IncompatibleBoundError(
                     f"Bound {self.bound.__qualname__!r} is not compatible with existing error: {type(self.error).__qualname__}."
                 )
@@ -600,82 +600,35 @@ class BoundResult[R, E: BaseException]:
         return inner
 
 
-@final  # A redundant decorator for type checkers.
-@fieldenum
-class Message:
-    """Test fieldenum to play with."""
-    if TYPE_CHECKING:
-        Quit = Unit
-
-        class Move(Message):  # type: ignore
-            __match_args__ = ("x", "y")
-            __fields__ = ("x", "y")
-
-            @property
-            def x(self) -> int: ...
-
-            @property
-            def y(self) -> int: ...
-
-            def __init__(self, x: int, y: int): ...
+if TYPE_CHECKING:
+    from ._demo import Message
 
-            def dump(self) -> dict[str, int]: ...
+    Some = Option.Some
+    Ok = Result.Ok
+    Err = Result.Err
+    Success = BoundResult.Success
+    Failed = BoundResult.Failed
 
-        class Write(Message):  # type: ignore
-            __match_args__ = ("_0",)
-            __fields__ = (0,)
-
-            @property
-            def _0(self) -> str: ...
+# Variant aliases are looked up on first access so that importing this module does not build the variants.
+_ALIASES = {
+    "Some": (Option, "Some"),
+    "Ok": (Result, "Ok"),
+    "Err": (Result, "Err"),
+    "Success": (BoundResult, "Success"),
+    "Failed": (BoundResult, "Failed"),
+}
 
-            def __init__(self, message: str, /): ...
 
-            def dump(self) -> tuple[int]: ...
-
-        class ChangeColor(Message):  # type: ignore
-            __match_args__ = ("_0", "_1", "_2")
-            __fields__ = (0, 1, 2)
-
-            @property
-            def _0(self) -> int: ...
-
-            @property
-            def _1(self) -> int: ...
-
-            @property
-            def _2(self) -> int: ...
-
-            def __init__(self, red: int, green: int, blue: int, /): ...
-
-            def dump(self) -> tuple[int, int, int]: ...
-
-        class Pause(Message):  # type: ignore
-            __match_args__ = ()
-            __fields__ = ()
-
-            @property
-            def _0(self) -> int: ...
-
-            @property
-            def _1(self) -> int: ...
-
-            @property
-            def _2(self) -> int: ...
-
-            def __init__(self): ...
-
-            def dump(self) -> tuple[()]: ...
+def __getattr__(name: str):
+    if name == "Message":
+        from ._demo import Message
 
+        value = Message
+    elif name in _ALIASES:
+        enum, variant_name = _ALIASES[name]
+        value = getattr(enum, variant_name)
     else:
-        Quit = Unit
-        Move = Variant(x=int, y=int)
-        Write = Variant(str)
-        ChangeColor = Variant(int, int, int)
-        Pause = Variant()
-
-
-Some = Option.Some
-Ok = Result.Ok
-Err = Result.Err
-Success = BoundResult.Success
-Failed = BoundResult.Failed
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
@@ -0,0 +1,261 @@
+"""A JSON codec for fieldenums, with JSON Lines helpers for streams of variants.
+
+Variants are tagged with the name of the variant, either internally under a discriminator key
+(`{"type": "Move", "x": 1, "y": 2}`) or externally as the single key of an object (`{"Move": {"x": 1, "y": 2}}`).
+Internally tagged tuple variants put their fields in a list under the `"values"` key,
+and externally tagged unit variants are encoded as the bare name.
+
+Fields annotated with a fieldenum, or with `X | None`, `list[X]`, `tuple[X, ...]` or `dict[str, X]`
+of one, are converted with the codec of that fieldenum. Other fields are left as they are for `json` to encode.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import types
+import typing
+
+from ._codegen import make_function
+from ._fieldenum import _positional_only, _resolve_annotation
+
+__all__ = ["JSONCodec"]
+
+_VALUES_KEY = "values"
+
+# Wraps the source of an expression into the source of an expression converting its value.
+type _Expression = typing.Callable[[str], str]
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+def _to_tuple(value: str) -> str:
+    return f"tuple({value})"
+
+
+def _is_fieldenum(annotation) -> bool:
+    return isinstance(annotation, type) and "__variants__" in vars(annotation)
+
+
+class JSONCodec:
+    """Convert the variants of a fieldenum to and from JSON.
+
+    Set `tag` to the discriminator key of internally tagged objects, or to None for external tagging.
+    The converters of the variants are generated when the codec is created.
+    """
+    __slots__ = ("enum", "tag", "_encoders", "_decoders", "_json_encode")
+
+    def __init__(self, enum: type, /, *, tag: str | None = "type") -> None:
+        self._build(enum, tag, {})
+
+    @classmethod
+    def _for_nested(cls, enum: type, tag: str | None, codecs: dict[type, JSONCodec]) -> JSONCodec:
+        # Codecs being built are shared, so that recursive fieldenums refer to their own codec.
+        if enum in codecs:
+            return codecs[enum]
+        codec = cls.__new__(cls)
+        codec._build(enum, tag, codecs)
+        return codec
+
+    def _build(self, enum: type, tag: str | None, codecs: dict[type, JSONCodec]) -> None:
+        if not _is_fieldenum(enum):
+            raise TypeError(f"Expected a fieldenum, got {enum!r}.")
+        if tag is not None and not isinstance(tag, str):
+            raise TypeError(f"The tag must be a string or None, got {tag!r}.")
+        codecs[enum] = self
+        self.enum = enum
+        self.tag = tag
+        self._json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False).encode
+        module = sys.modules.get(enum.__module__)
+        globalns = vars(module) if module is not None else {}
+        self._encoders = {}
+        self._decoders = {}
+        for name, variant in enum.__variant_map__.items():
+            encode, decode = self._build_variant(name, variant, globalns, codecs)
+            self._encoders[variant] = encode
+            self._decoders[name] = decode
+
+    def _build_variant(
+        self, name: str, variant: type, globalns: dict[str, typing.Any], codecs: dict[type, JSONCodec]
+    ) -> tuple[typing.Callable, typing.Callable]:
+        tag = self.tag
+        fields = variant.__fields__
+        field_types = variant.__field_types__
+        namespace: dict[str, typing.Any] = {}
+        encoded = []
+        decoded = []
+        named = bool(fields) and isinstance(fields[0], str)
+        positional = _positional_only(variant) if named else frozenset()
+        for index, field in enumerate(fields or ()):
+            attribute = field if named else f"_{field}"
+            key = field if named else index
+            if named and field == tag:
+                raise TypeError(f"The field {field!r} of {variant.__qualname__} conflicts with the tag {tag!r}.")
+            annotation = field_types.get(attribute, typing.Any)
+            encode_value, decode_value = self._converters(annotation, globalns, namespace, codecs, f"f{index}") or (
+                _identity, _identity
+            )
+            encoded.append(encode_value(f"value.{attribute}"))
+            decoded.append(decode_value(f"{'data' if named else '__values'}[{key!r}]"))
+
+        if fields is None:
+            encode = repr({tag: name}) if tag is not None else repr(name)
+        elif tag is None:
+            if named:
+                items = ", ".join(f"{field!r}: {value}" for field, value in zip(fields, encoded))
+                encode = f"{{{name!r}: {{{items}}}}}"
+            else:
+                encode = f"{{{name!r}: [{', '.join(encoded)}]}}"
+        elif named:
+            items = "".join(f", {field!r}: {value}" for field, value in zip(fields, encoded))
+            encode = f"{{{tag!r}: {name!r}{items}}}"
+        elif fields:
+            encode = f"{{{tag!r}: {name!r}, {_VALUES_KEY!r}: [{', '.join(encoded)}]}}"
+        else:
+            encode = repr({tag: name})
+
+        # Variants are built with their constructor, so that defaults are applied and the fields are validated.
+        namespace["__variant"] = variant
+        if named:
+            # Only the keys present are passed, so that missing fields fall back to their defaults.
+            decode = ["__kwargs = {}"]
+            arguments = []
+            for field, value in zip(fields, decoded):
+                if field in positional:
+                    decode += [f"if {field!r} not in data:", f"    raise KeyError({field!r})"]
+                    arguments.append(value)
+                else:
+                    decode += [f"if {field!r} in data:", f"    __kwargs[{field!r}] = {value}"]
+            decode.append(f"return __variant({''.join(f'{value}, ' for value in arguments)}**__kwargs)")
+        elif fields:
+            decode = [
+                f"__values = {'data' if tag is None else f'data[{_VALUES_KEY!r}]'}",
+                f"if len(__values) != {len(fields)}:",
+                f"    raise TypeError(f'Expected {len(fields)} field(s), got {{len(__values)}}.')",
+                f"return __variant({', '.join(decoded)})",
+            ]
+        else:
+            # Unit variants are attached as their instances.
+            namespace["__value"] = variant() if fields is not None else getattr(self.enum, name)
+            decode = ["return __value"]
+
+        qualname = f"{type(self).__name__}.{variant.__qualname__}"
+        module = self.enum.__module__
+        encoder = make_function(
+            "encode", "value", [f"return {encode}"], namespace, qualname=f"{qualname}.encode", module=module
+        )
+        decoder = make_function(
+            "decode", "data", decode, namespace, qualname=f"{qualname}.decode", module=module
+        )
+        return encoder, decoder
+
+    def _converters(
+        self,
+        annotation,
+        globalns: dict[str, typing.Any],
+        namespace: dict[str, typing.Any],
+        codecs: dict[type, JSONCodec],
+        prefix: str,
+        depth: int = 0,
+    ) -> tuple[_Expression, _Expression] | None:
+        """Return functions wrapping an expression to convert a value of `annotation`, or None to leave it as it is."""
+        # Arguments of generics can be strings too, such as `list["Expr"]`, so each level is resolved.
+        annotation = _resolve_annotation(annotation, self.enum, globalns)
+        if _is_fieldenum(annotation):
+            codec = type(self)._for_nested(annotation, self.tag, codecs)
+            namespace[f"__encode_{prefix}"] = codec.encode
+            namespace[f"__decode_{prefix}"] = codec.decode
+            return (lambda value: f"__encode_{prefix}({value})"), (lambda value: f"__decode_{prefix}({value})")
+
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+        item = f"__item{depth}"
+        if origin is types.UnionType or origin is typing.Union:
+            others = [arg for arg in args if arg is not type(None)]
+            if len(others) != 1 or len(others) == len(args):
+                return None
+            converters = self._converters(others[0], globalns, namespace, codecs, prefix, depth + 1)
+            if converters is None:
+                return None
+            # The value is bound to a name, so that the expression converting it is evaluated only once.
+            return tuple(
+                lambda value, convert=convert: f"(None if ({item} := {value}) is None else {convert(item)})"
+                for convert in converters
+            )
+        if origin is list and len(args) == 1 or origin is tuple and len(args) == 2 and args[1] is ...:
+            converters = self._converters(args[0], globalns, namespace, codecs, prefix, depth + 1)
+            if converters is None:
+                return None if origin is list else (_identity, _to_tuple)
+            encode, decode = converters
+            return (
+                lambda value: f"[{encode(item)} for {item} in {value}]",
+                lambda value: f"{'' if origin is list else 'tuple'}([{decode(item)} for {item} in {value}])",
+            )
+        if origin is tuple and args:
+            # Fixed-size tuples are decoded back into tuples, since `json` turns them into lists.
+            return _identity, _to_tuple
+        if origin is dict and len(args) == 2:
+            converters = self._converters(args[1], globalns, namespace, codecs, prefix, depth + 1)
+            if converters is None:
+                return None
+            key = f"__key{depth}"
+            return tuple(
+                lambda value, convert=convert: f"{{{key}: {convert(item)} for {key}, {item} in {value}.items()}}"
+                for convert in converters
+            )
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.enum.__qualname__}, tag={self.tag!r})"
+
+    def encode(self, value) -> typing.Any:
+        """Convert a variant into objects `json` can encode."""
+        try:
+            encode = self._encoders[type(value)]
+        except KeyError:
+            raise TypeError(f"Expected a variant of {self.enum.__qualname__}, got {value!r}.") from None
+        return encode(value)
+
+    def decode(self, data) -> typing.Any:
+        """Convert objects decoded by `json` back into a variant.
+
+        Missing fields take their defaults. ValueError is raised if a field without a default is missing
+        or a field does not pass the validation of the variant.
+        """
+        try:
+            if self.tag is None:
+                if isinstance(data, str):
+                    name = data
+                else:
+                    [(name, data)] = data.items()
+            else:
+                name = data[self.tag]
+            decode = self._decoders[name]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            raise ValueError(f"Cannot find the variant of {self.enum.__qualname__} of {data!r}.") from None
+        try:
+            return decode(data)
+        except (KeyError, IndexError, TypeError) as exc:
+            raise ValueError(f"Cannot decode {data!r} as {self.enum.__qualname__}.{name}.") from exc
+
+    def dumps(self, value) -> str:
+        return self._json_encode(self.encode(value))
+
+    def loads(self, text: str | bytes):
+        return self.decode(json.loads(text))
+
+    def dump_lines(self, values: typing.Iterable, file: typing.TextIO) -> None:
+        """Write the variants to a text file as JSON Lines, one at a time."""
+        encode = self.encode
+        json_encode = self._json_encode
+        file.writelines(f"{json_encode(encode(value))}\n" for value in values)
+
+    def iter_loads(self, file: typing.Iterable[str | bytes]) -> typing.Iterator:
+        """Read the variants of a JSON Lines file, one line at a time. Blank lines are skipped."""
+        decode = self.decode
+        loads = json.loads
+        for line in file:
+            if line.strip():
+                yield decode(loads(line))
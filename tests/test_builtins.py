@@ -0,0 +1,166 @@
+# type: ignore
+
+import sys
+
+import pytest
+from fieldenum import Unit, Variant, fieldenum, from_builtins, make_enum, to_builtins, variant
+from fieldenum.enums import Option
+
+
+@fieldenum
+class Expr:
+    Nil = Unit
+    Empty = Variant()
+    Num = Variant(float)
+    Pair = Variant("Expr", "Expr")
+    Add = Variant(left="Expr", right="Expr")
+    Call = Variant(
+        name=str, args="list[Expr]", kw="dict[str, Expr]", default="Expr | None", rest="tuple[Expr, ...]", raw=tuple
+    )
+
+
+@fieldenum(layout="tuple")
+class TupleLayout:
+    Empty = Unit
+    Pair = Variant(int, "TupleLayout")
+
+
+def test_round_trip():
+    expr = Expr.Call(
+        name="f",
+        args=[Expr.Num(2.0), Expr.Empty(), Expr.Nil],
+        kw={"a": Expr.Add(left=Expr.Nil, right=Expr.Num(1.0))},
+        default=None,
+        rest=(Expr.Pair(Expr.Nil, Expr.Num(3.0)),),
+        raw=(1, "a"),
+    )
+    data = to_builtins(expr)
+    assert data == {
+        "Call": {
+            "name": "f",
+            "args": [{"Num": (2.0,)}, {"Empty": ()}, "Nil"],
+            "kw": {"a": {"Add": {"left": "Nil", "right": {"Num": (1.0,)}}}},
+            "default": None,
+            "rest": ({"Pair": ("Nil", {"Num": (3.0,)})},),
+            "raw": (1, "a"),
+        }
+    }
+    assert from_builtins(Expr, data) == expr
+    assert from_builtins(Expr, "Nil") is Expr.Nil
+    assert from_builtins(Expr, {"Call": {**data["Call"], "default": "Nil"}}).default is Expr.Nil
+
+    # Containers are walked, and values other than variants are left as they are.
+    marker = object()
+    assert to_builtins([Expr.Nil, (Expr.Empty(),), {"key": Expr.Num(1.0)}, marker]) == [
+        "Nil", ({"Empty": ()},), {"key": {"Num": (1.0,)}}, marker
+    ]
+    assert to_builtins(1) == 1
+
+    value = TupleLayout.Pair(1, TupleLayout.Pair(2, TupleLayout.Empty))
+    assert to_builtins(value) == {"Pair": (1, {"Pair": (2, "Empty")})}
+    assert from_builtins(TupleLayout, to_builtins(value)) == value
+
+    # Fields of generic enums are not converted back, since their types are not known.
+    assert to_builtins(Option.Some(Expr.Nil)) == {"Some": ("Nil",)}
+    assert from_builtins(Option, {"Some": ("Nil",)}) == Option.Some("Nil")
+
+
+def test_deep_trees():
+    depth = sys.getrecursionlimit() * 10
+    expr = Expr.Nil
+    for index in range(depth):
+        expr = Expr.Add(left=Expr.Num(float(index)), right=expr)
+
+    data = to_builtins(expr)
+    value = from_builtins(Expr, data)
+    for _ in range(depth):
+        assert type(value) is Expr.Add
+        value = value.right
+    assert value is Expr.Nil
+
+    # Nested containers are as deep as nested variants.
+    nested = []
+    for _ in range(depth):
+        nested = [nested]
+    result = to_builtins(nested)
+    for _ in range(depth):
+        assert result is not nested
+        [result] = result
+        [nested] = nested
+    assert result == []
+
+
+def test_share():
+    leaf = Expr.Add(left=Expr.Num(1.0), right=Expr.Nil)
+    expr = Expr.Pair(leaf, leaf)
+
+    data = to_builtins(expr)
+    assert data["Pair"][0] == data["Pair"][1]
+    assert data["Pair"][0] is not data["Pair"][1]
+    value = from_builtins(Expr, data, share=True)
+    assert value._0 is not value._1
+
+    data = to_builtins(expr, share=True)
+    assert data["Pair"][0] is data["Pair"][1]
+    assert from_builtins(Expr, data) == expr
+    value = from_builtins(Expr, data, share=True)
+    assert value == expr
+    assert value._0 is value._1
+
+    # A tree sharing its subtrees at every level converts in linear time.
+    for _ in range(100):
+        expr = Expr.Pair(expr, expr)
+    value = from_builtins(Expr, to_builtins(expr, share=True), share=True)
+    assert value._0 is value._1
+
+
+def test_dynamic_enums():
+    Built = make_enum("Built", {"Leaf": Unit, "Node": {"value": int, "next": "Built"}})
+    value = Built.Node(value=1, next=Built.Node(value=2, next=Built.Leaf))
+    assert from_builtins(Built, to_builtins(value)) == value
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        from_builtins(int, "Nil")
+    with pytest.raises(ValueError, match="Unknown variant"):
+        from_builtins(Expr, "Unknown")
+    with pytest.raises(ValueError, match="Expected a variant"):
+        from_builtins(Expr, {"Nil": (), "Empty": ()})
+    with pytest.raises(ValueError, match="Expected the fields"):
+        from_builtins(Expr, {"Add": ["Nil", "Nil"]})
+    with pytest.raises(ValueError, match="Cannot build a variant"):
+        from_builtins(Expr, {"Add": {"left": "Nil"}})
+    with pytest.raises(ValueError, match="field"):
+        from_builtins(Expr, {"Num": ()})
+
+
+@fieldenum(validate=True)
+class Checked:
+    Point = Variant(x=int, y=int).default(y=0)
+    Pair = Variant(int, "Checked | None")
+
+    @variant
+    def Positive(self, value: int, /, label: str = ""):
+        if value <= 0:
+            raise ValueError("The value must be positive.")
+
+
+def test_constructor():
+    # Variants are built with their constructors, so defaults, validation and function bodies apply.
+    assert from_builtins(Checked, {"Point": {"x": 1}}) == Checked.Point(x=1, y=0)
+    assert from_builtins(Checked, {"Positive": {"value": 1}}) == Checked.Positive(1)
+    assert from_builtins(Checked, {"Pair": (1, {"Pair": (2, None)})}) == Checked.Pair(1, Checked.Pair(2, None))
+    data = to_builtins(Checked.Positive(2, label="two"))
+    assert from_builtins(Checked, data) == Checked.Positive(2, label="two")
+
+    with pytest.raises(ValueError, match="Cannot build a variant"):
+        from_builtins(Checked, {"Point": {"x": "not an int", "y": 1}})
+    with pytest.raises(ValueError, match="Cannot build a variant"):
+        from_builtins(Checked, {"Point": {"y": 1}})
+    with pytest.raises(ValueError, match="Cannot build a variant"):
+        from_builtins(Checked, {"Positive": {"label": "missing"}})
+    with pytest.raises(ValueError, match="Cannot build a variant"):
+        from_builtins(Checked, {"Pair": ("1", None)})
+    with pytest.raises(ValueError, match="must be positive"):
+        from_builtins(Checked, {"Positive": {"value": -1}})
@@ -0,0 +1,166 @@
+# type: ignore
+
+import pytest
+from fieldenum import Unit, Variant, fieldenum, variant
+from fieldenum.codec import BinaryCodec
+
+
+@fieldenum
+class Tree:
+    Leaf = Unit
+    Node = Variant(left="Tree", right="Tree", value=int)
+
+
+@fieldenum
+class Message:
+    Quit = Unit
+    Pause = Variant()
+    Point = Variant(int, float)
+    Text = Variant(body=str, raw=bytes, urgent=bool)
+    Nested = Variant(tree=Tree)
+
+    @variant
+    def Move(x: int, y: int = 0):
+        pass
+
+
+@fieldenum(layout="tuple")
+class TupleLayout:
+    Empty = Unit
+    Pair = Variant(int, str)
+
+
+MESSAGES = [
+    Message.Quit,
+    Message.Pause(),
+    Message.Point(-3, 1.5),
+    Message.Text(body="héllo", raw=b"\x00\xff", urgent=True),
+    Message.Text(body="", raw=b"", urgent=False),
+    Message.Nested(tree=Tree.Node(left=Tree.Leaf, right=Tree.Node(left=Tree.Leaf, right=Tree.Leaf, value=2), value=1)),
+    Message.Move(1, y=2),
+]
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_round_trip(message):
+    codec = BinaryCodec(Message)
+    data = codec.encode(message)
+    assert codec.decode(data) == message
+    assert type(codec.decode(data)) is type(message)
+    assert codec.decode(memoryview(data)) == message
+    assert codec.decode_from(memoryview(b"xx" + data), 2) == (message, len(data) + 2)
+
+    codec = BinaryCodec(TupleLayout)
+    for value in [TupleLayout.Empty, TupleLayout.Pair(1, "a")]:
+        assert codec.decode(codec.encode(value)) == value
+
+
+def test_sizes():
+    codec = BinaryCodec(Message)
+    assert codec.encode(Message.Quit) == bytes([0])
+    assert len(codec.encode(Message.Point(1, 1.0))) == 1 + 8 + 8
+    assert len(codec.encode(Message.Text(body="ab", raw=b"c", urgent=True))) == 1 + 4 + 4 + 1 + 2 + 1
+
+
+def test_buffers():
+    codec = BinaryCodec(Message)
+    buffer = bytearray()
+    offset = 0
+    for message in MESSAGES:
+        offset = codec.encode_into(message, buffer, offset)
+    assert offset == len(buffer)
+    assert list(codec.iter_decode(buffer)) == MESSAGES
+    assert list(codec.iter_decode(bytes(buffer))) == MESSAGES
+    assert list(codec.iter_decode(b"")) == []
+
+    # Buffers other than bytearray are not extended.
+    fixed = memoryview(bytearray(len(buffer)))
+    offset = 0
+    for message in MESSAGES:
+        offset = codec.encode_into(message, fixed, offset)
+    assert fixed == buffer
+    with pytest.raises(ValueError):
+        codec.encode_into(Message.Point(1, 1.0), memoryview(bytearray(4)))
+
+    # A bytearray is overwritten from the offset and extended as needed.
+    buffer = bytearray(b"\xaa" * 3)
+    assert codec.encode_into(Message.Quit, buffer, 1) == 2
+    assert buffer == b"\xaa\x00\xaa"
+
+
+def test_errors():
+    codec = BinaryCodec(Message)
+    with pytest.raises(TypeError):
+        codec.encode(Tree.Leaf)
+    with pytest.raises(TypeError):
+        codec.encode(1)
+    with pytest.raises(ValueError, match="Unknown tag"):
+        codec.decode(bytes([200]))
+    with pytest.raises(ValueError, match="left"):
+        codec.decode(codec.encode(Message.Quit) + b"\x00")
+    with pytest.raises(TypeError):
+        BinaryCodec(int)
+
+    @fieldenum
+    class Unsupported:
+        Listed = Variant(items=list)
+
+    with pytest.raises(TypeError, match="Cannot encode"):
+        BinaryCodec(Unsupported)
+
+    @fieldenum
+    class Unannotated:
+        @variant
+        def Loose(value):
+            pass
+
+    with pytest.raises(TypeError, match="without an annotation"):
+        BinaryCodec(Unannotated)
+
+
+@pytest.mark.parametrize("message", MESSAGES[2:])
+def test_truncated(message):
+    codec = BinaryCodec(Message)
+    data = codec.encode(message)
+    for end in range(len(data)):
+        with pytest.raises(ValueError, match="truncated"):
+            codec.decode(data[:end])
+        if end:
+            with pytest.raises(ValueError, match="truncated"):
+                list(codec.iter_decode(codec.encode(Message.Quit) + data[:end]))
+    with pytest.raises(ValueError, match="truncated"):
+        codec.decode_from(memoryview(data), len(data))
+
+
+def test_errors_are_not_masked():
+    codec = BinaryCodec(Message)
+    quit_size = len(codec.encode(Message.Quit))
+    data = codec.encode(Message.Text(body="long body", raw=b"", urgent=False))
+    # Truncated contents are reported at the start of their variant.
+    with pytest.raises(ValueError, match=f"at offset {quit_size} "):
+        list(codec.iter_decode(codec.encode(Message.Quit) + data[:-1]))
+    with pytest.raises(ValueError, match="at offset 0 "):
+        codec.decode(data[:-1])
+
+    with pytest.raises(ValueError, match="Cannot encode"):
+        codec.encode(Message.Point(2 ** 63, 1.0))
+    with pytest.raises(TypeError):
+        codec.encode(Message.Text(body=b"bytes", raw=b"", urgent=False))
+
+    armed = []
+
+    @fieldenum
+    class Failing:
+        Value = Variant(int)
+
+        def __post_init__(self):
+            if armed:
+                raise IndexError("raised by the variant")
+
+    failing = BinaryCodec(Failing)
+    data = failing.encode(Failing.Value(1))
+    armed.append(True)
+    with pytest.raises(IndexError, match="raised by the variant"):
+        failing.decode(data)
+    with pytest.raises(IndexError, match="raised by the variant"):
+        list(failing.iter_decode(data))
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from collections.abc import Callable
 from typing import Any, assert_type
 import pytest
@@ -429,6 +432,38 @@ def test_result_wrap(second_param):
     error = ValueError("hello")
     assert Result.Err(error).map(lambda x: exception_bound_func(None, x), ValueError) == Result.Err(error)
 
+
+def test_import_cost():
+    code = """
+import sys
+import fieldenum.enums
+from fieldenum import Variant
+from fieldenum.enums import Option
+
+unexpected = [name for name in ["fieldenum._flag", "fieldenum._demo", "inspect", "threading"] if name in sys.modules]
+assert not unexpected, unexpected
+assert isinstance(vars(Option)["Some"], Variant)
+assert fieldenum.enums.Some is Option.Some
+assert fieldenum.enums.Message.Quit is not None
+"""
+    subprocess.run([sys.executable, "-c", code], check=True, env=os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)})
+
+
+def test_bound_result_without_aliases():
+    # The variant aliases of the module are loaded lazily, so methods must not rely on them.
+    code = """
+import pytest
+from fieldenum.enums import BoundResult
+from fieldenum.exceptions import IncompatibleBoundError
+
+assert BoundResult.Success(1, ValueError).unwrap() == 1
+assert not BoundResult.Failed(ValueError("error"), ValueError)
+with pytest.raises(IncompatibleBoundError):
+    BoundResult.Failed(KeyError("error"), ValueError)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True, env=os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)})
+
+
 if __name__ == "__main__":
     test_bound_result_wrap(False)
     test_bound_result_wrap(True)
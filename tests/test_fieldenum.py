@@ -1,10 +1,30 @@
 # type: ignore
 
+import gc
+import os
 import pickle
-from typing import Any, Self
+import weakref
+import subprocess
+import sys
+import types
+from typing import Any, Never, Self
 
 import pytest
-from fieldenum import Unit, Variant, factory, fieldenum, unreachable, variant
+from fieldenum import (
+    Unit,
+    Variant,
+    factory,
+    fieldenum,
+    intern_stats,
+    lazy_factory,
+    make_enum,
+    pickle_many,
+    unpickle_many,
+    unreachable,
+    variant,
+    warmup,
+)
+from fieldenum._fieldenum import UnitDescriptor
 from fieldenum.exceptions import UnreachableError
 
 
@@ -126,6 +146,13 @@ def test_misc():
         message = Message.Move(x=123, y=567)
         message.x = 224
 
+    message = Message.ChangeColor(1, 2, 3)
+    with pytest.raises(TypeError, match="Cannot mutate attribute `_0` since it's frozen."):
+        message._0 = 224
+    with pytest.raises(TypeError, match="Cannot delete attribute `_0` since it's frozen."):
+        del message._0
+    assert message.dump() == (1, 2, 3)
+
     assert Message.Move(y=325) == Message.Move(x=234569834, y=325)
 
     with pytest.raises(TypeError):
@@ -243,6 +270,16 @@ def test_instancing():
     with pytest.raises(TypeError, match="hello"):
         Message.Move(hello=4)
 
+    # Both the first call, which creates the singleton, and later ones reject arguments.
+    for _ in range(2):
+        with pytest.raises(TypeError, match=r"Message\.Pause\(\) takes no arguments\."):
+            Message.Pause(1)
+        with pytest.raises(TypeError, match=r"Message\.Pause\(\) takes no arguments\."):
+            Message.Pause(x=1)
+        assert Message.Pause() is Message.Pause()
+    with pytest.raises(TypeError, match=r"Message\.Quit\(\) takes no arguments\."):
+        type(Message.Quit)(1)
+
 
 def test_eq_and_hash():
     assert Message.ChangeColor(1, ("hello",), [1, 2, 3]) == Message.ChangeColor(1, ("hello",), [1, 2, 3])
@@ -284,6 +321,55 @@ def test_pickling(message):
     dump = pickle.dumps(message)
     load = pickle.loads(dump)
     assert message == load
+    # Variants are stored by their tag, without their field names.
+    assert b"Move" not in dump and b"x" not in dump
+
+
+post_init_calls = []
+
+
+@fieldenum
+class PostInit:
+    Plain = Variant(int)
+
+    @variant
+    def WithoutSelf(a: int):
+        pass
+
+    @variant
+    def WithSelf(self, a: int):
+        pass
+
+    def __post_init__(self):
+        post_init_calls.append(self)
+
+
+def test_pickling_initializers():
+    # Unpickling and `_make()` call `__post_init__()` exactly when the constructor does.
+    for value, calls in [(PostInit.Plain(1), 1), (PostInit.WithoutSelf(1), 0), (PostInit.WithSelf(1), 1)]:
+        post_init_calls.clear()
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert type(value)._make((1,)) == value
+        assert unpickle_many(pickle_many([value, value])) == [value, value]
+        assert len(post_init_calls) == calls * 4
+
+
+def test_pickle_many():
+    messages = [Message.Move(x=1, y=2), Message.Quit, Message.Write("a"), Message.Pause(), Message.ChangeColor(1, 2, 3)]
+    assert unpickle_many(pickle_many(messages)) == messages
+    assert unpickle_many(pickle_many(messages * 3, protocol=2)) == messages * 3
+    assert unpickle_many(pickle_many([])) == []
+
+    moves = [Message.Move(x=index, y=-index) for index in range(100)]
+    assert unpickle_many(pickle_many(moves)) == moves
+    assert len(pickle_many(moves)) < len(pickle.dumps(moves)) / 2
+    quits = unpickle_many(pickle_many([Message.Quit] * 3))
+    assert quits == [Message.Quit] * 3 and quits[0] is Message.Quit
+
+    with pytest.raises(TypeError, match="Expected a variant of Message"):
+        pickle_many([Message.Quit, TupleLayout.Color(1, 2, 3)])
+    with pytest.raises(TypeError, match="Expected a variant of a fieldenum"):
+        pickle_many([1])
 
 
 def test_complex_matching():
@@ -412,3 +498,807 @@ def test_method_abuse_on_function_variant():
         @fieldenum
         class NeverGonnaBeUsed:
             V = MyVariant.default(hello=123)
+
+
+def test_binding_errors():
+    with pytest.raises(TypeError, match=r"ArgMove takes 2 positional argument\(s\) but 3 were/was given"):
+        Message.ArgMove(1, 2, 3)
+    with pytest.raises(TypeError, match="Inconsistent input for field 'x': received both positional and keyword values"):
+        Message.ArgMove(1, x=2)
+    with pytest.raises(TypeError, match="Inconsistent input for field 'y': received both positional and keyword values"):
+        Message.ArgMove(1, 2, y=2)
+    with pytest.raises(TypeError, match=r"Key mismatch: {'y'}"):
+        Message.ArgMove(1)
+    with pytest.raises(TypeError, match=r"Key mismatch: {'z'}"):
+        Message.ArgMove(y=1, z=3)
+    with pytest.raises(TypeError, match="Variant 'Message.Move' is keyword only."):
+        Message.Move(1, 2)
+    with pytest.raises(TypeError, match=r"Expect 3 field\(s\), but received 2 argument\(s\)\."):
+        Message.ChangeColor(1, 2)
+
+    with pytest.raises(TypeError, match="unknown field"):
+        @fieldenum
+        class UnknownDefault:
+            Move = Variant(x=int).default(y=123)
+
+
+def test_function_variant_binding():
+    @fieldenum
+    class Calls:
+        @variant
+        def Variadic(self, a, b=1, *args, c, d=factory(list), **kwargs):
+            assert self.d is d
+
+        @variant
+        def PositionalOnly(a, /, b):
+            pass
+
+    message = Calls.Variadic(1, 2, 3, c=4, z=5)
+    assert message.dump() == dict(a=1, b=2, args=(3,), c=4, d=[], kwargs={"z": 5})
+    assert Calls.Variadic(1, c=2).dump() == dict(a=1, b=1, args=(), c=2, d=[], kwargs={})
+    assert Calls.Variadic(1, c=2).d is not Calls.Variadic(1, c=2).d
+    assert Calls.PositionalOnly(1, b=2) == Calls.PositionalOnly(1, 2)
+
+    with pytest.raises(TypeError, match="missing 1 required keyword-only argument: 'c'"):
+        Calls.Variadic(1)
+    with pytest.raises(TypeError, match="positional-only arguments passed as keyword arguments: 'a'"):
+        Calls.PositionalOnly(a=1, b=2)
+    with pytest.raises(TypeError, match="missing 1 required positional argument: 'b'"):
+        Calls.PositionalOnly(1)
+
+
+def test_slots():
+    import weakref
+
+    for message in [Message.Quit, Message.Pause(), Message.Write("hello"), Message.Move(x=1, y=2), Message.ParamlessFuncVariantWithBody()]:
+        assert not hasattr(message, "__dict__")
+        with pytest.raises(TypeError):
+            weakref.ref(message)
+
+    @fieldenum(weakref=True)
+    class Referenced:
+        Quit = Unit
+        Write = Variant(str)
+
+        def owner(self):
+            super().__init_subclass__()
+            return __class__
+
+    message = Referenced.Write("hello")
+    assert weakref.ref(message)() is message
+    assert not hasattr(message, "__dict__")
+    assert message.owner() is Referenced
+
+    @fieldenum
+    class Generic[T]:
+        Value = Variant(T)
+
+    assert Generic.__type_params__[0].__name__ == "T"
+    assert Generic[int].Value(3) == Generic.Value(3)
+
+
+def test_slots_recreation():
+    registry = []
+
+    class Registered:
+        __slots__ = ()
+
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            # Variant classes are subclasses as well, but not direct ones.
+            if Registered in cls.__bases__:
+                registry.append(cls)
+
+    def register(cls):
+        registry.append(("decorated", cls))
+        return cls
+
+    # The class is recreated with `__slots__`, so `__init_subclass__()` runs again for the new class,
+    # and decorators applied before `fieldenum` see the discarded one.
+    @fieldenum
+    @register
+    class Recreated(Registered):
+        Value = Variant(int)
+
+    discarded = registry[0]
+    assert registry == [discarded, ("decorated", discarded), Recreated]
+    assert discarded is not Recreated and discarded.__qualname__ == Recreated.__qualname__
+    assert not hasattr(Recreated.Value(1), "__dict__")
+    assert isinstance(Recreated.Value(1), Registered)
+
+    # Declaring `__slots__` keeps the class, so hooks and decorators run once and see the final class.
+    registry.clear()
+
+    @fieldenum
+    @register
+    class Kept(Registered):
+        __slots__ = ()
+        Value = Variant(int)
+
+    assert registry == [Kept, ("decorated", Kept)]
+    assert not hasattr(Kept.Value(1), "__dict__")
+
+    # Instances get `__dict__` from a base anyway, so the class is not recreated.
+    class WithDict:
+        pass
+
+    registry.clear()
+
+    @fieldenum
+    @register
+    class Inherited(WithDict):
+        Value = Variant(int)
+
+    assert registry == [("decorated", Inherited)]
+    assert Inherited.Value(1) == Inherited.Value(1)
+
+
+def test_generated_eq_and_hash():
+    nan = float("nan")
+    assert Message.Write(nan) == Message.Write(nan)
+    assert Message.Write(float("nan")) != Message.Write(float("nan"))
+    assert Message.Write("hello") != Message.Move(x=1, y=2)
+    assert Message.Write("hello") != ("hello",)
+
+    first, second = Message.ArgMove(x=1, y=2), Message.ArgMove(x=1, y=3)
+    assert hash(first) != hash(second)
+    assert first != second
+    assert hash(Message.ArgMove(x=1, y=2)) == hash(first)
+    assert {first: "first"}[Message.ArgMove(1, 2)] == "first"
+
+    assert Message.ArgMove(x=1, y=2).dump() == {"x": 1, "y": 2}
+    assert Message.ChangeColor(1, 2, 3).dump() == (1, 2, 3)
+
+
+def test_installed_variant_classes():
+    assert isinstance(vars(Message)["Move"], type)
+    assert vars(Message)["Move"] is Message.Move
+    assert vars(Message)["FunctionVariant"] is Message.FunctionVariant
+
+    variant = Variant(int)
+    assert variant.__get__(None, object) is variant
+
+    @fieldenum
+    class Holder:
+        Value = variant
+
+    assert vars(Holder)["Value"] is variant._actual is Holder.Value
+
+
+def test_flat_variant_classes():
+    for variant in [Message.Move, Message.Write, Message.Pause, Message.FunctionVariant, type(Message.Quit)]:
+        assert variant.__bases__ == (Message,)
+        assert type(variant) is type
+
+    assert type(Message.Quit)() is Message.Quit
+
+    calls = []
+
+    @fieldenum
+    class Counted:
+        Fieldless = Variant()
+
+        def __post_init__(self):
+            calls.append(self)
+
+    assert Counted.Fieldless() is Counted.Fieldless() is Counted.Fieldless()
+    assert calls == [Counted.Fieldless()]
+
+
+@fieldenum(intern=True)
+class InternedModule:
+    Value = Variant(int)
+
+
+def test_intern():
+    @fieldenum(intern=True)
+    class Interned:
+        Leaf = Variant(int)
+        Node = Variant(left=object, right=object)
+        Empty = Unit
+
+        @variant
+        def Point(x: int, y: int = 0):
+            pass
+
+    one = Interned.Leaf(1)
+    assert one is Interned.Leaf(1)
+    assert one is not Interned.Leaf(True)
+    assert Interned.Node(1, 2) is Interned.Node(left=1, right=2)
+    assert Interned.Point(1) is Interned.Point(1, y=0)
+
+    unhashable = Interned.Leaf([1])
+    assert unhashable is not Interned.Leaf([1])
+    assert unhashable == Interned.Leaf([1])
+
+    leaf = InternedModule.Value(3)
+    assert pickle.loads(pickle.dumps(leaf)) is leaf
+    assert unpickle_many(pickle_many([leaf]))[0] is leaf
+
+    stats = intern_stats(Interned.Leaf)
+    assert stats["hits"] == 1
+    assert stats["live"] >= 1
+    assert stats["bytes_saved"] == Interned.Leaf.__basicsize__
+    assert stats["misses"] == 2
+    assert stats["uninterned"] == 3
+    assert stats["hit_rate"] == 1 / 3
+    assert intern_stats(Interned)["hits"] > stats["hits"]
+
+    # Values comparing equal are only merged when they cannot be told apart.
+    zero = Interned.Node(0.0, (1,))
+    assert zero is Interned.Node(0.0, (1,))
+    negative_zero = Interned.Node(-0.0, (1,))
+    assert negative_zero is not zero
+    assert str(negative_zero.left) == "-0.0"
+    assert Interned.Node(0.0, (True,)) is not zero
+    assert Interned.Node(0.0, (True,)).right[0] is True
+    assert Interned.Node(0.0, frozenset({-0.0})) is not Interned.Node(0.0, frozenset({0.0}))
+    sentinel = object()
+    assert Interned.Node(sentinel, None) is Interned.Node(sentinel, None)
+
+    from decimal import Decimal
+
+    assert Interned.Node(Decimal("1.0"), None) is not Interned.Node(Decimal("1.00"), None)
+
+    # Trees of interned variants are interned as a whole.
+    tree = Interned.Node(Interned.Leaf(1), Interned.Node(Interned.Leaf(2), Interned.Empty))
+    assert tree is Interned.Node(Interned.Leaf(1), Interned.Node(Interned.Leaf(2), Interned.Empty))
+    assert tree is not Interned.Node(Interned.Leaf(1), Interned.Node(Interned.Leaf(3), Interned.Empty))
+    assert Interned.Node(Interned.Leaf([1]), None) is not Interned.Node(Interned.Leaf([1]), None)
+    stats = intern_stats(Interned.Node)
+    before = stats["hits"]
+    Interned.Node(Interned.Leaf(1), Interned.Node(Interned.Leaf(2), Interned.Empty))
+    assert intern_stats(Interned.Node)["hits"] == before + 2
+    assert stats["uninterned"] >= 2
+
+    @fieldenum
+    class Partial:
+        Interned = Variant(int).intern()
+        Plain = Variant(int)
+
+    assert Partial.Interned(1) is Partial.Interned(1)
+    assert Partial.Plain(1) is not Partial.Plain(1)
+
+    with pytest.raises(TypeError, match="Only frozen variants can be interned."):
+        @fieldenum(frozen=False, intern=True)
+        class Mutable:
+            Value = Variant(int)
+
+
+@fieldenum(layout="tuple")
+class TupleLayout:
+    Color = Variant(int, int, int)
+    Other = Variant(int, int, int)
+    Move = Variant(x=int, y=int)
+
+
+def test_tuple_layout():
+    color = TupleLayout.Color(1, 2, 3)
+    assert isinstance(color, TupleLayout) and isinstance(color, tuple)
+    assert isinstance(TupleLayout.Move(x=1, y=2), TupleLayout)
+    assert not isinstance(TupleLayout.Move(x=1, y=2), tuple)
+    assert not hasattr(color, "__dict__")
+
+    assert color._0 == color[0] == 1
+    assert color.dump() == (1, 2, 3)
+    assert type(color.dump()) is tuple
+    assert repr(color) == "TupleLayout.Color(1, 2, 3)"
+    match color:
+        case TupleLayout.Color(red, green, blue):
+            assert (red, green, blue) == (1, 2, 3)
+        case _:
+            assert False
+
+    assert color == TupleLayout.Color(1, 2, 3)
+    assert not color != TupleLayout.Color(1, 2, 3)
+    assert color != (1, 2, 3)
+    assert color != TupleLayout.Other(1, 2, 3)
+    assert hash(color) == hash(TupleLayout.Color(1, 2, 3))
+    assert pickle.loads(pickle.dumps(color)) == color
+
+    with pytest.raises(TypeError, match="Cannot mutate attribute `_0` since it's frozen."):
+        color._0 = 3
+    with pytest.raises(TypeError, match=r"Expect 3 field\(s\), but received 1 argument\(s\)."):
+        TupleLayout.Color(1)
+
+    @fieldenum
+    class PerVariant:
+        Tuple = Variant(int).layout("tuple")
+        Slots = Variant(int)
+
+    assert isinstance(PerVariant.Tuple(1), tuple)
+    assert not isinstance(PerVariant.Slots(1), tuple)
+    assert PerVariant.Tuple(1) != PerVariant.Slots(1)
+
+    with pytest.raises(TypeError, match="Only tuple variants can use the tuple layout."):
+        Variant(x=int).layout("tuple")
+    with pytest.raises(ValueError, match="Unknown layout"):
+        Variant(int).layout("list")
+    with pytest.raises(TypeError, match="Only frozen variants can use the tuple layout."):
+        @fieldenum(frozen=False, layout="tuple")
+        class Mutable:
+            Value = Variant(int)
+
+
+def test_newtype_variants():
+    @fieldenum
+    class Wrapper:
+        Tuple = Variant(int)
+        Named = Variant(value=int)
+        Defaulted = Variant(args=int).default(args=5)
+        Pair = Variant(int, int)
+
+    assert Wrapper.Tuple.__slots__ == ("_0",)
+    assert Wrapper.Named.__slots__ == ("value",)
+    assert "_fieldenum_hash" in Wrapper.Pair.__slots__
+
+    assert Wrapper.Tuple(1) == Wrapper.Tuple(1)
+    assert Wrapper.Tuple(1) != Wrapper.Named(1)
+    assert hash(Wrapper.Named(value=1)) == hash(Wrapper.Named(1))
+    assert Wrapper.Named(1).dump() == {"value": 1}
+    assert Wrapper.Defaulted() == Wrapper.Defaulted(5) == Wrapper.Defaulted(args=5)
+
+    with pytest.raises(TypeError, match=r"Expect 1 field\(s\), but received 0 argument\(s\)."):
+        Wrapper.Tuple()
+    with pytest.raises(TypeError, match=r"Expect 1 field\(s\), but received 2 argument\(s\)."):
+        Wrapper.Tuple(1, 2)
+    with pytest.raises(TypeError, match="Inconsistent input for field 'value'"):
+        Wrapper.Named(1, value=2)
+    with pytest.raises(TypeError, match=r"Named takes 1 positional argument\(s\) but 2 were/was given"):
+        Wrapper.Named(1, 2)
+    with pytest.raises(TypeError, match="Key mismatch"):
+        Wrapper.Named(1, other=2)
+
+
+def test_trusted_construction():
+    post_inits = []
+
+    @fieldenum
+    class Rows:
+        Pair = Variant(int, int)
+        Point = Variant(x=int, y=int).kw_only().default(y=0)
+        Packed = Variant(int).layout("tuple")
+        Shared = Variant(x=int).intern()
+
+        @variant
+        def Checked(self, a: int, /, b: int, *, c: int = 0):
+            raise AssertionError("initializers are skipped")
+
+        def __post_init__(self):
+            post_inits.append(self)
+
+    assert Rows.Pair._make([1, 2]) == Rows.Pair(1, 2)
+    assert Rows.Point._make((1, 2)) == Rows.Point(x=1, y=2)
+    assert Rows.Packed._make([1]) == Rows.Packed(1)
+    assert Rows.Checked._make([1, 2, 3]).dump() == {"a": 1, "b": 2, "c": 3}
+    assert Rows.Shared._make([1]) is Rows.Shared(1)
+    assert hash(Rows.Pair._make([1, 2])) == hash(Rows.Pair(1, 2))
+
+    rows = Rows.Point.from_rows(iter([(1, 2), (3, 4)]))
+    assert next(rows) == Rows.Point(x=1, y=2)
+    assert list(rows) == [Rows.Point(x=3, y=4)]
+    assert Rows.Pair.from_columns(_0=[1, 3], _1=[2, 4]) == [Rows.Pair(1, 2), Rows.Pair(3, 4)]
+
+    post_inits.clear()
+    Rows.Checked._make([1, 2, 3])
+    Rows.Pair.from_columns(_0=[1, 3], _1=[2, 4])
+    assert len(post_inits) == 3
+
+    with pytest.raises(ValueError):
+        Rows.Pair._make([1])
+    with pytest.raises(ValueError):
+        Rows.Pair.from_columns(_0=[1], _1=[2, 3])
+    with pytest.raises(TypeError):
+        Rows.Pair.from_columns(_0=[1])
+
+
+def test_lazy_factory():
+    produced = []
+
+    def produce():
+        produced.append(None)
+        return [len(produced)]
+
+    @fieldenum
+    class Lazy:
+        Value = Variant(x=int, cache=list).default(cache=lazy_factory(produce))
+        Shared = Variant(x=int, cache=list).default(cache=lazy_factory(produce)).intern()
+
+        @variant(kw_only=True)
+        class Decorated:
+            x: int
+            cache: list = lazy_factory(produce)
+
+    value = Lazy.Value(1)
+    decorated = Lazy.Decorated(x=1)
+    assert produced == []
+    assert value.cache == [1]
+    assert value.cache is value.cache
+    assert decorated.cache == [2]
+    assert produced == [None, None]
+
+    assert Lazy.Value(1, []).cache == []
+    assert Lazy.Value(2) != Lazy.Value(2)
+    assert Lazy.Value(3).dump() == {"x": 3, "cache": [5]}
+    with pytest.raises(TypeError, match="Cannot mutate attribute `cache` since it's frozen."):
+        value.cache = []
+    with pytest.raises(AttributeError, match="'Value' object has no attribute 'missing'"):
+        value.missing
+
+    produced.clear()
+    Lazy.Shared(1)
+    assert produced == [None]
+
+
+@fieldenum(lazy=True)
+class LazyEnum:
+    Tuple = Variant(int)
+    Named = Variant(x=int)
+    Nothing = Unit
+    Unpickled = Variant(int)
+    Mutable = Variant(int).intern()
+
+
+class _UnpickleUnbuilt:
+    def __reduce__(self):
+        from fieldenum._utils import unpickle
+        return unpickle, (LazyEnum, "Unpickled", (1,), {})
+
+
+def test_lazy_attach():
+    assert isinstance(vars(LazyEnum)["Tuple"], Variant)
+    assert LazyEnum.Tuple(1) == LazyEnum.Tuple(1)
+    assert isinstance(vars(LazyEnum)["Tuple"], type)
+
+    match LazyEnum.Named(x=2):
+        case LazyEnum.Named(x=x):
+            assert x == 2
+        case _:
+            assert False
+
+    assert isinstance(vars(LazyEnum)["Nothing"], UnitDescriptor)
+    assert LazyEnum.Nothing is LazyEnum.Nothing
+    assert isinstance(vars(LazyEnum)["Nothing"], LazyEnum)
+
+    assert isinstance(vars(LazyEnum)["Unpickled"], Variant)
+    unpickled = pickle.loads(pickle.dumps(_UnpickleUnbuilt()))
+    assert unpickled == LazyEnum.Unpickled(1)
+    assert pickle.loads(pickle.dumps(unpickled)) == unpickled
+
+    assert LazyEnum.__variants__ == ["Tuple", "Named", "Nothing", "Unpickled", "Mutable"]
+    assert LazyEnum.Mutable(1) is LazyEnum.Mutable(1)
+
+    @fieldenum(lazy=True, frozen=False)
+    class Deferred:
+        Value = Variant(int).intern()
+
+    # Errors of lazy variants are raised when they are first accessed.
+    for _ in range(2):
+        with pytest.raises(TypeError, match="Only frozen variants can be interned."):
+            Deferred.Value
+
+
+def test_code_cache(tmp_path):
+    (tmp_path / "cached_schema.py").write_text(
+        "from fieldenum import Variant, fieldenum\n"
+        "@fieldenum\n"
+        "class Cached:\n"
+        "    Pair = Variant(int, int)\n"
+        "    Named = Variant(x=int, y=str).default(y='a')\n"
+    )
+    code = """
+import builtins
+compile_ = builtins.compile
+compiled = []
+
+def counting_compile(source, filename, *args, **kwargs):
+    if filename.startswith("<fieldenum generated"):
+        compiled.append(filename)
+    return compile_(source, filename, *args, **kwargs)
+
+builtins.compile = counting_compile
+from cached_schema import Cached
+assert Cached.Named(1) == Cached.Named(x=1, y="a")
+assert Cached.Pair(1, 2).dump() == (1, 2)
+print(len(compiled))
+"""
+
+    def run(**env):
+        environ = {key: value for key, value in os.environ.items() if key not in ("PYTHONDONTWRITEBYTECODE", "FIELDENUM_NO_CODE_CACHE")}
+        environ["PYTHONPATH"] = os.pathsep.join([str(tmp_path), *sys.path])
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=environ | env, check=True)
+        return int(result.stdout)
+
+    assert run() > 0
+    cache_files = list((tmp_path / "__pycache__").glob("cached_schema.*.fieldenum"))
+    assert len(cache_files) == 1
+    assert run() == 0
+    assert run(FIELDENUM_NO_CODE_CACHE="1") > 0
+
+    # Broken caches are ignored and rewritten.
+    cache_files[0].write_bytes(b"broken")
+    assert run() > 0
+    assert run() == 0
+
+    # Changed definitions compile only their new code.
+    schema = tmp_path / "cached_schema.py"
+    schema.write_text(schema.read_text().replace("y=", "label="))
+    code = code.replace('Cached.Named(x=1, y="a")', 'Cached.Named(x=1, label="a")')
+    assert run() > 0
+    assert run() == 0
+
+
+def test_code_caches_are_bounded():
+    from fieldenum import _codegen
+
+    # Field names are part of the generated sources, so each of these enums generates new code.
+    for index in range(_codegen._CACHE_SIZE + 100):
+        Dynamic = fieldenum(type("Dynamic", (), {"Named": Variant(**{f"field_{index}": int})}))
+        Dynamic.Named(**{f"field_{index}": 1})
+    assert len(_codegen._compiled) <= _codegen._CACHE_SIZE
+    assert all(len(cache.used) <= _codegen._CACHE_SIZE for cache in _codegen._module_caches.values())
+
+
+Built = make_enum("Built", {"Empty": Unit, "Pause": (), "Point": (int, int), "Move": {"x": int, "y": int}})
+
+
+def test_make_enum():
+    assert Built.__module__ == __name__
+    assert Built.__qualname__ == "Built"
+    assert Built.__variants__ == ["Empty", "Pause", "Point", "Move"]
+    assert Built.Empty is Built.Empty
+    assert Built.Pause() is Built.Pause()
+    assert Built.Point(1, 2).dump() == (1, 2)
+    assert Built.Move(x=1, y=2).dump() == {"x": 1, "y": 2}
+    assert Built.Point._make((1, 2)) == Built.Point(1, 2)
+    for value in [Built.Empty, Built.Pause(), Built.Point(1, 2), Built.Move(x=1, y=2)]:
+        assert pickle.loads(pickle.dumps(value)) == value
+
+    Options = make_enum(
+        "Options",
+        {"Value": Variant(x=int).default(x=0), "Named": {"x": int}},
+        qualname="Outer.Options",
+        module="somewhere",
+        lazy=True,
+        weakref=True,
+        intern=True,
+    )
+    assert (Options.__module__, Options.__qualname__) == ("somewhere", "Outer.Options")
+    assert isinstance(vars(Options)["Value"], Variant)
+    assert Options.Value() is Options.Value(x=0)
+    assert Options.Named.__qualname__ == "Outer.Options.Named"
+    assert Options.Value.__weakrefoffset__
+
+    with pytest.raises(TypeError, match="Invalid spec for variant 'Wrong'"):
+        make_enum("Invalid", {"Wrong": [int]})
+
+
+def test_dynamic_enums_are_collected():
+    def create():
+        Dynamic = make_enum("Dynamic", {"Tuple": (int,), "Named": {"x": int}, "Empty": (), "Nothing": Unit})
+        for value in [Dynamic.Tuple(1), Dynamic.Named(x=1), Dynamic.Empty(), Dynamic.Nothing]:
+            value.__reduce__()
+        return Dynamic
+
+    refs = [weakref.ref(create()) for _ in range(100)]
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+    gc.collect()
+    before = sys.getallocatedblocks()
+    for _ in range(10_000):
+        make_enum("Dynamic", {"Value": (int,)}).Value(1)
+    gc.collect()
+    # Leaking even a single object per enum would add 10,000 blocks.
+    assert sys.getallocatedblocks() - before < 1000
+
+
+def test_warmup():
+    calls = []
+
+    class Base:
+        def __post_init__(self):
+            calls.append(self)
+
+    Warm = make_enum("Warm", {"Value": (int,), "Empty": (), "Nothing": Unit}, lazy=True)
+    Eager = fieldenum(type("Eager", (Base,), {"__slots__": (), "Empty": Variant()}))
+    module = types.ModuleType("warm_schema")
+    module.Eager = Eager
+
+    warmup([Warm, module])
+    assert all(isinstance(vars(Warm)[name], type) for name in ["Value", "Empty"])
+    assert isinstance(vars(Warm)["Nothing"], Warm)
+    assert isinstance(vars(Warm.Value)["_make"], classmethod)
+    assert calls == [Eager.Empty()]
+    assert Warm.Empty() is Warm.Empty()
+
+    warmup(["fieldenum.enums"], freeze=True)
+    try:
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    with pytest.raises(TypeError, match="Expected a module or a fieldenum"):
+        warmup([Base])
+
+
+@fieldenum(validate=True)
+class Validated:
+    Leaf = Variant(int)
+    Node = Variant(left="Validated", right="Validated")
+    Optional = Variant(value=int | None, name=str).default(name="")
+    Pair = Variant(tuple[int, str], tuple[float, ...])
+    Items = Variant(items=list[int], mapping=dict[str, set[int]])
+    Sampled = Variant(items=list[int]).validate("sample")
+    Unchecked = Variant(int).validate(False)
+
+    @variant
+    def Function(a: int, *args, b: "str" = "b"):
+        pass
+
+
+def test_validate():
+    leaf = Validated.Leaf(1)
+    assert Validated.Node(leaf, Validated.Node(leaf, leaf))
+    assert Validated.Optional(None) == Validated.Optional(value=None, name="")
+    assert Validated.Pair((1, "a"), (1.0, 2))
+    assert Validated.Items(items=[1, 2], mapping={"a": {1}})
+    assert Validated.Sampled(items=[1, "not checked"])
+    assert Validated.Unchecked("not checked")
+    assert Validated.Function(1, "any", b="b")
+    assert Validated.Leaf._make(["trusted"])
+
+    with pytest.raises(TypeError, match="Invalid value for field '_0' of Validated.Leaf: expected int, got '1'."):
+        Validated.Leaf("1")
+    invalid = [
+        lambda: Validated.Node(leaf, 1),
+        lambda: Validated.Optional("1"),
+        lambda: Validated.Pair((1, 2), ()),
+        lambda: Validated.Pair((1, "a"), (1.0, "b")),
+        lambda: Validated.Items(items=[1, "a"], mapping={}),
+        lambda: Validated.Items(items=[], mapping={"a": {"b"}}),
+        lambda: Validated.Sampled(items=["a", 1]),
+        lambda: Validated.Function(1, b=2),
+    ]
+    for construct in invalid:
+        with pytest.raises(TypeError, match="Invalid value for field"):
+            construct()
+
+    @fieldenum(layout="tuple", intern=False, validate=True)
+    class Tuple:
+        Point = Variant(int, int)
+
+    assert Tuple.Point(1, 2) == Tuple.Point(1, 2)
+    with pytest.raises(TypeError, match="Invalid value for field '_1'"):
+        Tuple.Point(1, "2")
+
+    with pytest.raises(ValueError, match="Unknown validation mode"):
+        Variant(int).validate("partial")
+    with pytest.raises(TypeError, match="Cannot validate values against"):
+        @fieldenum(validate=True)
+        class Unsupported:
+            Value = Variant(Never)
+
+    # Validation is removed under `python -O`.
+    code = (
+        "from fieldenum import Variant, fieldenum\n"
+        "Checked = fieldenum(type('Checked', (), {'Leaf': Variant(int)}), validate=True)\n"
+        "print(Checked.Leaf('1'))\n"
+    )
+    result = subprocess.run([sys.executable, "-O", "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "Checked.Leaf('1')"
+
+
+def test_validate_deferred(tmp_path, monkeypatch):
+    # Annotations referring to names defined later in the module are resolved on the first construction.
+    (tmp_path / "deferred_schema.py").write_text(
+        "from __future__ import annotations\n"
+        "from typing import NewType\n"
+        "from fieldenum import Variant, fieldenum, variant\n"
+        "UserId = NewType('UserId', int)\n"
+        "@fieldenum(validate=True)\n"
+        "class Deferred:\n"
+        "    Named = Variant(later='Later', user=UserId)\n"
+        "    Items = Variant(list['Later'])\n"
+        "    @variant\n"
+        "    def Function(later: Later, count: int = 0):\n"
+        "        pass\n"
+        "class Later:\n"
+        "    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from deferred_schema import Deferred, Later
+
+    later = Later()
+    assert Deferred.Named(later=later, user=1).later is later
+    assert Deferred.Items([later, later])
+    assert Deferred.Function(later)
+    invalid = [
+        lambda: Deferred.Named(later=1, user=1),
+        lambda: Deferred.Named(later=later, user="1"),
+        lambda: Deferred.Items([later, 1]),
+        lambda: Deferred.Function(later, count="1"),
+        lambda: Deferred.Function(1),
+    ]
+    for construct in invalid:
+        with pytest.raises(TypeError, match="Invalid value for field"):
+            construct()
+
+
+def test_order():
+    @fieldenum(order=True)
+    class Event:
+        Start = Unit
+        Timer = Variant(int, str)
+        Message = Variant(at=int, sender=str)
+        Pause = Variant()
+
+        @variant
+        def Function(at: int, *, priority: int = 0):
+            pass
+
+    events = [
+        Event.Function(1, priority=2), Event.Message(at=1, sender="b"), Event.Timer(2, "a"), Event.Pause(),
+        Event.Start, Event.Timer(1, "b"), Event.Message(at=1, sender="a"), Event.Function(1),
+    ]
+    expected = [
+        Event.Start, Event.Timer(1, "b"), Event.Timer(2, "a"), Event.Message(at=1, sender="a"),
+        Event.Message(at=1, sender="b"), Event.Pause(), Event.Function(1), Event.Function(1, priority=2),
+    ]
+    assert sorted(events) == expected
+    assert sorted(events, key=Event.sort_key) == expected
+    assert Event.sort_key(Event.Message(at=1, sender="a")) == (2, 1, "a")
+    assert Event.sort_key(Event.Start) == (0,)
+    assert Event.Start <= Event.Start and not Event.Start < Event.Start
+    assert Event.Timer(1, "a") >= Event.Timer(1, "a") and not Event.Timer(1, "a") > Event.Timer(1, "a")
+    assert Event.Pause() > Event.Timer(3, "c")
+    with pytest.raises(TypeError):
+        Event.Start < 1  # noqa: B015
+
+    @fieldenum(order=True, layout="tuple")
+    class Tuple:
+        Pair = Variant(int, int)
+        Single = Variant(int)
+
+    assert sorted([Tuple.Single(0), Tuple.Pair(2, 1), Tuple.Pair(1, 3)]) == [
+        Tuple.Pair(1, 3), Tuple.Pair(2, 1), Tuple.Single(0)
+    ]
+    assert Tuple.sort_key(Tuple.Pair(1, 2)) == (0, 1, 2)
+
+    # Variants using the tuple layout are not ordered like tuples unless `order=True`.
+    with pytest.raises(TypeError):
+        TupleLayout.Color(1, 2, 3) < TupleLayout.Color(1, 2, 4)  # noqa: B015
+    assert not hasattr(TupleLayout, "sort_key")
+
+    with pytest.raises(TypeError, match="Ordering requires `eq=True`."):
+        fieldenum(type("Unordered", (), {}), eq=False, order=True)
+    with pytest.raises(TypeError, match="Cannot use `order=True` since 'Ordered' defines __lt__."):
+        @fieldenum(order=True)
+        class Ordered:
+            Value = Variant(int)
+
+            def __lt__(self, other):
+                return True
+
+
+def test_variant_tables():
+    @fieldenum
+    class Shape:
+        Empty = Unit
+        Point = Variant(int, int)
+        Circle = Variant(radius=float)
+        Pause = Variant()
+
+    assert [variant.__tag__ for variant in Shape.__variant_classes__] == [0, 1, 2, 3]
+    assert Shape.__variant_classes__ == (type(Shape.Empty), Shape.Point, Shape.Circle, Shape.Pause)
+    assert Shape.__variant_map__ == {"Empty": type(Shape.Empty), "Point": Shape.Point, "Circle": Shape.Circle, "Pause": Shape.Pause}
+    assert Shape.Empty.__tag__ == 0
+    assert Shape.Circle(1.0).__tag__ == 2
+    assert Shape.__variant_classes__[Shape.Point(1, 2).__tag__] is Shape.Point
+
+    Lazy = make_enum("Lazy", {"Empty": Unit, "Value": (int,)}, lazy=True)
+    assert isinstance(vars(Lazy)["Value"], Variant)
+    # Tables are built on first access, even through a variant.
+    assert Lazy.Value(1).__variant_map__ == {"Empty": type(Lazy.Empty), "Value": Lazy.Value}
+    assert vars(Lazy)["__variant_classes__"] == (type(Lazy.Empty), Lazy.Value)
+    assert isinstance(vars(Lazy)["__variant_map__"], dict)
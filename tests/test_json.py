@@ -0,0 +1,143 @@
+# type: ignore
+
+import io
+import json
+from typing import Optional
+
+import pytest
+from fieldenum import Unit, Variant, fieldenum, variant
+from fieldenum.enums import Option, Result
+from fieldenum.json import JSONCodec
+
+
+@fieldenum
+class Expr:
+    Nil = Unit
+    Empty = Variant()
+    Num = Variant(float)
+    Add = Variant(left="Expr", right="Expr")
+    Call = Variant(name=str, args="list[Expr]", kw="dict[str, Expr]", default="Expr | None", pair=tuple[int, int])
+
+
+EXPRS = [
+    Expr.Nil,
+    Expr.Empty(),
+    Expr.Num(1.5),
+    Expr.Add(left=Expr.Num(1), right=Expr.Nil),
+    Expr.Call(name="f", args=[Expr.Num(2), Expr.Empty()], kw={"a": Expr.Nil}, default=None, pair=(1, 2)),
+    Expr.Call(name="g", args=[], kw={}, default=Expr.Num(3), pair=(3, 4)),
+]
+
+
+@pytest.mark.parametrize("tag", ["type", "kind", None])
+def test_round_trip(tag):
+    codec = JSONCodec(Expr, tag=tag)
+    for expr in EXPRS:
+        assert codec.loads(codec.dumps(expr)) == expr
+        assert codec.decode(json.loads(json.dumps(codec.encode(expr)))) == expr
+    assert codec.loads(codec.dumps(Expr.Nil)) is Expr.Nil
+
+
+def test_representation():
+    codec = JSONCodec(Expr)
+    assert codec.encode(Expr.Nil) == {"type": "Nil"}
+    assert codec.encode(Expr.Empty()) == {"type": "Empty"}
+    assert codec.encode(Expr.Num(1.0)) == {"type": "Num", "values": [1.0]}
+    assert codec.encode(Expr.Add(left=Expr.Nil, right=Expr.Num(2.0))) == {
+        "type": "Add", "left": {"type": "Nil"}, "right": {"type": "Num", "values": [2.0]}
+    }
+
+    codec = JSONCodec(Expr, tag=None)
+    assert codec.encode(Expr.Nil) == "Nil"
+    assert codec.encode(Expr.Empty()) == {"Empty": []}
+    assert codec.encode(Expr.Num(1.0)) == {"Num": [1.0]}
+    assert codec.encode(Expr.Add(left=Expr.Nil, right=Expr.Num(2.0))) == {
+        "Add": {"left": "Nil", "right": {"Num": [2.0]}}
+    }
+
+    assert JSONCodec(Result).dumps(Result.Ok("é")) == '{"type":"Ok","value":"é"}'
+    assert JSONCodec(Option, tag=None).loads('{"Some": [3]}') == Option.Some(3)
+    assert JSONCodec(Option, tag=None).loads('"Nothing"') is Option.Nothing
+
+
+def test_lines():
+    codec = JSONCodec(Expr)
+    file = io.StringIO()
+    codec.dump_lines(iter(EXPRS), file)
+    assert file.getvalue().count("\n") == len(EXPRS)
+    assert list(codec.iter_loads(io.StringIO(file.getvalue() + "\n"))) == EXPRS
+    assert list(codec.iter_loads(io.BytesIO(file.getvalue().encode()))) == EXPRS
+
+    # Lines are read one at a time.
+    lines = iter(file.getvalue().splitlines())
+    values = codec.iter_loads(lines)
+    assert next(values) == EXPRS[0]
+    assert next(lines) == codec.dumps(EXPRS[1])
+
+
+def test_errors():
+    codec = JSONCodec(Expr)
+    with pytest.raises(TypeError):
+        codec.encode(Option.Nothing)
+    with pytest.raises(ValueError, match="Cannot find"):
+        codec.decode({"type": "Unknown"})
+    with pytest.raises(ValueError, match="Cannot find"):
+        codec.decode({"kind": "Nil"})
+    with pytest.raises(ValueError, match="Cannot find"):
+        JSONCodec(Expr, tag=None).decode({"Nil": [], "Empty": []})
+    with pytest.raises(ValueError, match="Cannot decode"):
+        codec.decode({"type": "Add", "left": {"type": "Nil"}})
+    with pytest.raises(TypeError):
+        JSONCodec(int)
+    with pytest.raises(TypeError, match="conflicts"):
+        JSONCodec(Expr, tag="name")
+
+
+@fieldenum
+class Shape:
+    Circle = Variant(radius=float, label=str).default(label="circle")
+    Square = Variant(side=float).validate()
+    Pair = Variant(int, int)
+
+    @variant
+    def Point(x: int, /, y: int = 0):
+        pass
+
+
+def test_constructor():
+    codec = JSONCodec(Shape)
+    # Missing fields take their defaults.
+    assert codec.decode({"type": "Circle", "radius": 1.0}) == Shape.Circle(radius=1.0)
+    assert codec.decode({"type": "Point", "x": 1}) == Shape.Point(1)
+    assert codec.decode({"type": "Point", "x": 1, "y": 2}) == Shape.Point(1, 2)
+    assert JSONCodec(Shape, tag=None).decode({"Point": {"x": 3}}) == Shape.Point(3)
+
+    with pytest.raises(ValueError, match="Cannot decode"):
+        codec.decode({"type": "Circle", "label": "c"})
+    with pytest.raises(ValueError, match="Cannot decode"):
+        codec.decode({"type": "Point", "y": 2})
+    with pytest.raises(ValueError, match="Cannot decode"):
+        codec.decode({"type": "Square", "side": "wide"})
+    with pytest.raises(ValueError, match="Cannot decode"):
+        codec.decode({"type": "Pair", "values": [1]})
+    with pytest.raises(ValueError, match="Cannot decode"):
+        codec.decode({"type": "Pair", "values": [1, 2, 3]})
+    assert codec.decode({"type": "Pair", "values": [1, 2]}) == Shape.Pair(1, 2)
+
+
+@fieldenum
+class Tree:
+    Leaf = Variant(int)
+    Node = Variant(children=list["Tree"], parent=Optional["Tree"], named=dict[str, "Tree"], pair=tuple["Tree", ...])
+
+
+def test_nested_string_annotations():
+    tree = Tree.Node(
+        children=[Tree.Leaf(1)], parent=Tree.Leaf(2), named={"a": Tree.Leaf(3)}, pair=(Tree.Leaf(4), Tree.Leaf(5))
+    )
+    for tag in ["type", None]:
+        codec = JSONCodec(Tree, tag=tag)
+        decoded = codec.loads(codec.dumps(tree))
+        assert decoded == tree
+        assert decoded.parent == Tree.Leaf(2)
+        assert codec.loads(codec.dumps(Tree.Node(children=[], parent=None, named={}, pair=()))).parent is None